@@ -0,0 +1,82 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Cost of the support blockers of the scene.
+#
+# Every anti_overhang_mesh is one more mesh for CuraEngine to load, slice on every layer and
+# subtract from the support areas, so the slice time grows with the number of blockers and
+# with their triangles. The estimate is a rough linear model, it is only meant to tell when
+# the blockers start to weigh on the slice, not to predict the slice time.
+#
+# Pure Python, no Cura dependency : the nodes only need getMeshData().getFaceCount().
+#--------------------------------------------------------------------------------------------
+
+import collections
+
+# Estimated slice time in s per blocker mesh and per blocker triangle
+NODE_COST = 0.02
+TRIANGLE_COST = 0.00002
+
+DEFAULT_MAX_BLOCKERS = 200
+DEFAULT_MAX_TRIANGLES = 50000
+
+# The Simplify action rebuilds the cylinders with a chord tolerance this many times coarser
+SIMPLIFY_TOLERANCE_FACTOR = 5
+
+BlockerCost = collections.namedtuple("BlockerCost", ["blockers", "triangles", "seconds"])
+
+
+def estimateSeconds(blockers: int, triangles: int) -> float:
+    """Additional slice time in s estimated for these blockers."""
+    return blockers * NODE_COST + triangles * TRIANGLE_COST
+
+
+def faceCount(node) -> int:
+    mesh = node.getMeshData()
+    return mesh.getFaceCount() if mesh is not None else 0
+
+
+class BlockerBudget:
+    def __init__(self, max_blockers: int = DEFAULT_MAX_BLOCKERS, max_triangles: int = DEFAULT_MAX_TRIANGLES) -> None:
+        """
+        param max_blockers: limit of the blocker count, 0 = no limit.
+        param max_triangles: limit of the blocker triangles, 0 = no limit.
+        """
+        self.max_blockers = max_blockers
+        self.max_triangles = max_triangles
+
+    def measure(self, nodes) -> BlockerCost:
+        blockers = 0
+        triangles = 0
+        for node in nodes:
+            blockers += 1
+            triangles += faceCount(node)
+        return BlockerCost(blockers, triangles, estimateSeconds(blockers, triangles))
+
+    def exceeded(self, cost: BlockerCost) -> bool:
+        return (self.max_blockers > 0 and cost.blockers > self.max_blockers) or \
+               (self.max_triangles > 0 and cost.triangles > self.max_triangles)
+
+    def excess(self, nodes):
+        """Nodes to drop, in the given order, to come back within the limits."""
+        nodes = list(nodes)
+        blockers = len(nodes)
+        triangles = sum(faceCount(node) for node in nodes)
+        result = []
+        for node in nodes:
+            if not self.exceeded(BlockerCost(blockers, triangles, 0.0)):
+                break
+            result.append(node)
+            blockers -= 1
+            triangles -= faceCount(node)
+        return result
+
+    def summary(self, cost: BlockerCost) -> str:
+        """One line text of the cost and the limits."""
+        blockers = "%d" % cost.blockers
+        if self.max_blockers > 0:
+            blockers += " / %d" % self.max_blockers
+        triangles = "%d" % cost.triangles
+        if self.max_triangles > 0:
+            triangles += " / %d" % self.max_triangles
+        return "Blockers : %s, triangles : %s, slice ~ +%.1f s" % (blockers, triangles, cost.seconds)
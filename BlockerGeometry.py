@@ -0,0 +1,976 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Vectorized geometry for the support blocker shapes.
+#
+# Every builder returns plain NumPy arrays (vertices, indices, normals) so the result can be
+# handed to MeshData without going through MeshBuilder and its per-face Python loops.
+# The cube and cylinder only depend on a handful of scalar values, so the finished arrays
+# are kept in an LRU cache and shared (read-only) between placements.
+#
+# This module only depends on NumPy and the standard library (no PyQt, UM or cura), so it can
+# be used without Cura : put the plugin folder on sys.path and "import BlockerGeometry", or run
+#
+#   python BlockerGeometry.py placements.json blockers.stl   (or .3mf)
+#
+# Coordinates follow Cura : Y up, in mm.
+#--------------------------------------------------------------------------------------------
+
+import collections
+import functools
+import json
+import struct
+import sys
+import zipfile
+
+import numpy
+
+# Rounding applied on the cache key, the click precision is far coarser than this
+KEY_DECIMALS = 4
+
+TEMPLATE_CACHE_SIZE = 128
+
+# Maximum distance in mm between a cylinder and its facets, and the bounds of the segment count
+DEFAULT_CHORD_TOLERANCE = 0.02
+MIN_SEGMENTS = 8
+MAX_SEGMENTS = 180
+
+# Upper bound of grid cells used to group the overhang faces, the cell size grows beyond it
+MAX_OVERHANG_CELLS = 2000000
+
+# Upper bound of (triangle, cell) entries of the ray casting grid, the cell size grows beyond it
+MAX_RAY_GRID_ENTRIES = 4000000
+
+# Samples per side of the rectangle of a box selection
+BOX_SAMPLES = 24
+
+# Stop At Surface : rays under the footprint of a blocker at most this many mm apart, and at most this many per side
+FLOOR_RAY_SPACING = 2.0
+MAX_FLOOR_RAY_SAMPLES = 32
+
+
+def _readOnly(*arrays):
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+def _quadIndices(nb_quads: int) -> numpy.ndarray:
+    # Two triangles per quad : [i, i+2, i+1] and [i, i+3, i+2]
+    base = numpy.arange(nb_quads, dtype=numpy.int32)[:, None] * 4
+    pattern = numpy.array([[0, 2, 1], [0, 3, 2]], dtype=numpy.int32)
+    return (base[:, None, :] + pattern[None, :, :]).reshape(-1, 3)
+
+
+def calculateNormals(vertices: numpy.ndarray, indices: numpy.ndarray) -> numpy.ndarray:
+    """Per-vertex normals, same result as MeshBuilder.calculateNormals() for unshared vertices.
+
+    :param vertices: (n, 3) float32 array.
+    :param indices: (m, 3) int32 array.
+    :return: (n, 3) float32 array.
+    """
+    tris = vertices[indices]
+    face_normals = numpy.cross(tris[:, 0] - tris[:, 1], tris[:, 2] - tris[:, 1])
+    length = numpy.linalg.norm(face_normals, axis=1)
+    length[length == 0] = 1.0
+    face_normals /= length[:, None]
+
+    normals = numpy.zeros(vertices.shape, dtype=numpy.float32)
+    for column in range(3):
+        normals[indices[:, column]] = face_normals
+    return normals
+
+
+def calculateSmoothNormals(vertices: numpy.ndarray, indices: numpy.ndarray) -> numpy.ndarray:
+    """Area weighted per-vertex normals, for meshes sharing their vertices between faces."""
+    tris = vertices[indices].astype(numpy.float64)
+    face_normals = numpy.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    normals = numpy.zeros(vertices.shape, dtype=numpy.float64)
+    for column in range(3):
+        numpy.add.at(normals, indices[:, column], face_normals)
+    length = numpy.linalg.norm(normals, axis=1)
+    length[length == 0] = 1.0
+    return (normals / length[:, None]).astype(numpy.float32)
+
+
+def compactMesh(vertices: numpy.ndarray, indices: numpy.ndarray):
+    """Merge the duplicated vertices, the faces then share them.
+
+    :return: (vertices, indices) with every distinct position stored once.
+    """
+    verts, inverse = numpy.unique(numpy.round(vertices, 5), axis=0, return_inverse=True)
+    new_indices = inverse.reshape(-1)[indices].astype(numpy.int32)
+    # Faces collapsed by the merge are dropped
+    valid = (new_indices[:, 0] != new_indices[:, 1]) & (new_indices[:, 1] != new_indices[:, 2]) & (new_indices[:, 0] != new_indices[:, 2])
+    return verts.astype(numpy.float32), new_indices[valid]
+
+
+def segmentsForTolerance(radius: float, tolerance: float = DEFAULT_CHORD_TOLERANCE) -> int:
+    """Number of segments of a circle whose facets stay within tolerance of the true circle."""
+    if radius <= 0 or tolerance <= 0:
+        return MIN_SEGMENTS
+    if tolerance >= radius:
+        return MIN_SEGMENTS
+    # Sagitta of one segment : r * (1 - cos(pi / n)) <= tolerance
+    segments = int(numpy.ceil(numpy.pi / numpy.arccos(1.0 - tolerance / radius)))
+    return int(min(max(segments, MIN_SEGMENTS), MAX_SEGMENTS))
+
+
+def createCube(size: float, height: float, sup: float):
+    """Vertices and indices of a square blocker.
+
+    :param size: side of the square in mm.
+    :param height: length below the picked point.
+    :param sup: additional height above the picked point.
+    :return: (vertices, indices)
+    """
+    s = size / 2
+    l = height
+    # 6 faces with 4 corners each
+    verts = numpy.array([
+        [-s, -l,  s], [-s, sup,  s], [ s, sup,  s], [ s, -l,  s],
+        [-s, sup, -s], [-s, -l, -s], [ s, -l, -s], [ s, sup, -s],
+        [ s, -l, -s], [-s, -l, -s], [-s, -l,  s], [ s, -l,  s],
+        [-s, sup, -s], [ s, sup, -s], [ s, sup,  s], [-s, sup,  s],
+        [-s, -l,  s], [-s, -l, -s], [-s, sup, -s], [-s, sup,  s],
+        [ s, -l, -s], [ s, -l,  s], [ s, sup,  s], [ s, sup, -s]
+    ], dtype=numpy.float32)
+    return verts, _quadIndices(6)
+
+
+def createCylinder(size: float, segments: int, height: float, sup: float):
+    """Vertices and indices of a cylindrical blocker.
+
+    :param size: diameter in mm.
+    :param segments: number of segments around the axis.
+    :param height: length below the picked point.
+    :param sup: additional height above the picked point.
+    :return: (vertices, indices)
+    """
+    r = size / 2
+    l = -height
+    ang = numpy.arange(segments + 1, dtype=numpy.float64) * (2 * numpy.pi / segments)
+    cos = r * numpy.cos(ang)
+    sin = r * numpy.sin(ang)
+
+    zeros = numpy.zeros(segments)
+    # Points of every segment : current angle (0) and next angle (1), top (t) and bottom (b)
+    center_t = numpy.stack([zeros, zeros + sup, zeros], axis=1)
+    center_b = numpy.stack([zeros, zeros + l, zeros], axis=1)
+    p0t = numpy.stack([cos[:-1], zeros + sup, sin[:-1]], axis=1)
+    p1t = numpy.stack([cos[1:], zeros + sup, sin[1:]], axis=1)
+    p0b = numpy.stack([cos[:-1], zeros + l, sin[:-1]], axis=1)
+    p1b = numpy.stack([cos[1:], zeros + l, sin[1:]], axis=1)
+
+    # Top / Side 1a / Side 1b / Bottom : 12 vertices per segment
+    verts = numpy.stack([
+        center_t, p1t, p0t,
+        p0t, p1t, p1b,
+        p1b, p0b, p0t,
+        center_b, p0b, p1b
+    ], axis=1).reshape(-1, 3).astype(numpy.float32)
+
+    indices = numpy.arange(verts.shape[0], dtype=numpy.int32).reshape(-1, 3)
+    return verts, indices
+
+
+def createCustom(size: float, pos1, pos2, sup: float):
+    """Vertices and indices of a blocker joining two picked points.
+
+    The vertices are relative to pos1 and the bottom reaches the build plate.
+
+    :param size: width in mm.
+    :param pos1: first point as (x, y, z).
+    :param pos2: second point as (x, y, z).
+    :param sup: additional height above the picked points.
+    :return: (vertices, indices)
+    """
+    # Work in X Z Y like the original Vector code, Y is swapped back at the end
+    dx = pos2[0] - pos1[0]
+    dz = pos2[2] - pos1[2]
+    dy = pos2[1] - pos1[1]
+    s = size / 2
+
+    length = numpy.hypot(dx, dz)
+    if length > 0:
+        dec = numpy.array([dz, -dx, 0.0]) * (s / length)
+    else:
+        dec = numpy.array([s, 0.0, 0.0])
+
+    v_dir = numpy.array([dx, dz, dy])
+    v_top = numpy.array([0.0, 0.0, sup])
+    vz_a = numpy.array([0.0, 0.0, -pos1[1]])
+    vz_b = numpy.array([0.0, 0.0, -pos2[1]])
+
+    # t=Top i=Inf
+    p1t = v_top + dec
+    p2t = v_top - dec
+    p3t = v_dir + v_top + dec
+    p4t = v_dir + v_top - dec
+    p1i = vz_a + dec
+    p2i = vz_a - dec
+    p3i = vz_b + v_dir + dec
+    p4i = vz_b + v_dir - dec
+
+    # Top, Front, Left, Right, Back, Bottom
+    verts = numpy.array([
+        p1t, p2t, p4t, p3t,
+        p1t, p3t, p3i, p1i,
+        p2t, p1t, p1i, p2i,
+        p3t, p4t, p4i, p3i,
+        p4t, p2t, p2i, p4i,
+        p1i, p2i, p4i, p3i
+    ], dtype=numpy.float32)[:, [0, 2, 1]]
+
+    return numpy.ascontiguousarray(verts), _quadIndices(6)
+
+
+def createPolyline(size: float, points, sup: float):
+    """Vertices and indices of one blocker swept along several picked points.
+
+    Same section as the custom type : the top follows the picked points and the bottom reaches
+    the build plate. The joints are mitred, the vertices are relative to the first point.
+
+    :param size: width in mm.
+    :param points: picked points as a sequence of (x, y, z).
+    :param sup: additional height above the picked points.
+    :return: (vertices, indices)
+    """
+    pts = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    # Points picked twice at the same place give no direction
+    keep = numpy.ones(len(pts), dtype=bool)
+    keep[1:] = numpy.hypot(numpy.diff(pts[:, 0]), numpy.diff(pts[:, 2])) > 1e-6
+    pts = pts[keep]
+    if len(pts) < 2:
+        return createCustom(size, tuple(pts[0]), tuple(pts[0]), sup)
+
+    s = size / 2
+    # Work in X Z Y like createCustom, Y is swapped back at the end
+    xz = pts[:, [0, 2]]
+    seg = numpy.diff(xz, axis=0)
+    seg /= numpy.linalg.norm(seg, axis=1)[:, None]
+    seg_normals = numpy.stack([seg[:, 1], -seg[:, 0]], axis=1)
+
+    # Offset of every point : the segment normal at the ends, the mitre in between
+    offsets = numpy.empty_like(xz)
+    offsets[0] = seg_normals[0] * s
+    offsets[-1] = seg_normals[-1] * s
+    if len(pts) > 2:
+        mitre = seg_normals[:-1] + seg_normals[1:]
+        length = numpy.linalg.norm(mitre, axis=1)
+        # A U-turn has no mitre, keep the normal of the next segment
+        reverse = length < 1e-6
+        mitre[reverse] = seg_normals[1:][reverse]
+        length[reverse] = 1.0
+        mitre /= length[:, None]
+        # Limit the mitre of sharp angles to 4 times the half width
+        cos_half = numpy.maximum(numpy.einsum('ij,ij->i', mitre, seg_normals[1:]), 0.25)
+        offsets[1:-1] = mitre * (s / cos_half)[:, None]
+
+    origin = pts[0]
+    top = numpy.empty((len(pts), 3))
+    top[:, :2] = xz - origin[[0, 2]]
+    top[:, 2] = pts[:, 1] - origin[1] + sup
+    inf = top.copy()
+    inf[:, 2] = -origin[1]
+    dec = numpy.zeros_like(top)
+    dec[:, :2] = offsets
+
+    # t=Top i=Inf, L=+offset R=-offset
+    lt, rt, li, ri = top + dec, top - dec, inf + dec, inf - dec
+    a, b = slice(0, -1), slice(1, None)
+    # Top, Left, Right, Bottom of every segment, then the two end caps, all wound like createCube
+    quads = numpy.concatenate([
+        numpy.stack([lt[a], lt[b], rt[b], rt[a]], axis=1),
+        numpy.stack([lt[a], li[a], li[b], lt[b]], axis=1),
+        numpy.stack([rt[b], ri[b], ri[a], rt[a]], axis=1),
+        numpy.stack([li[a], ri[a], ri[b], li[b]], axis=1),
+        numpy.stack([rt[0], ri[0], li[0], lt[0]])[None],
+        numpy.stack([lt[-1], li[-1], ri[-1], rt[-1]])[None]
+    ])
+    verts = quads.reshape(-1, 3)[:, [0, 2, 1]].astype(numpy.float32)
+    return numpy.ascontiguousarray(verts), _quadIndices(len(quads))
+
+
+def createOrientedBox(length: float, width: float, angle: float, height: float, sup: float):
+    """Vertices and indices of a box blocker turned around the Y axis.
+
+    :param length: side along the rotated X axis in mm.
+    :param width: side along the rotated Z axis in mm.
+    :param angle: rotation around Y in radians, the X axis goes to (cos, sin) in the XZ plane.
+    :return: (vertices, indices)
+    """
+    verts, indices = createCube(1.0, height, sup)
+    x = verts[:, 0] * length
+    z = verts[:, 2] * width
+    c = numpy.cos(angle)
+    s = numpy.sin(angle)
+    # Scaling and rotation keep the winding of the cube
+    verts = numpy.stack([x * c - z * s, verts[:, 1], x * s + z * c], axis=1).astype(numpy.float32)
+    return verts, indices
+
+
+def blockerHeight(sb_type: str, size: float, y: float, on_build_plate: bool, depth: float = 0.0) -> float:
+    """Length of the blocker below the picked point.
+
+    :param y: height of the picked point above the build plate.
+    :param depth: additional length, used to cover a sloped overhang region.
+    """
+    if on_build_plate:
+        height = y
+    elif sb_type == 'cylinder':
+        # Height of the Cylinder = the radius
+        height = size * 0.5 + depth
+    else:
+        height = size + depth
+    return min(height, y)
+
+
+def topExtra(sb_type: str, size: float) -> float:
+    """Additional height above the picked point, the precision on the click position is not very tight."""
+    if sb_type in ('cube', 'box'):
+        return size * 0.05
+    return size * 0.01
+
+
+def meshArrays(verts: numpy.ndarray, indices: numpy.ndarray, compact: bool = False):
+    """(vertices, indices, normals) of a mesh, as is or with shared vertices."""
+    if compact:
+        verts, indices = compactMesh(verts, indices)
+        return verts, indices, calculateSmoothNormals(verts, indices)
+    return verts, indices, calculateNormals(verts, indices)
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _cachedTemplate(sb_type: str, size: float, height: float, sup: float, segments: int, compact: bool):
+    if sb_type == 'cylinder':
+        verts, indices = createCylinder(size, segments, height, sup)
+    else:
+        verts, indices = createCube(size, height, sup)
+    return _readOnly(*meshArrays(verts, indices, compact))
+
+
+def templateKey(sb_type: str, size: float, height: float, sup: float, segments: int = 36, compact: bool = False):
+    """Normalized cache key of a cube or cylinder blocker."""
+    return (sb_type,
+            round(float(size), KEY_DECIMALS),
+            round(float(height), KEY_DECIMALS),
+            round(float(sup), KEY_DECIMALS),
+            int(segments),
+            bool(compact))
+
+
+def getTemplate(sb_type: str, size: float, height: float, sup: float, segments: int = 36, compact: bool = False):
+    """Cached (vertices, indices, normals) of a cube or cylinder blocker.
+
+    The returned arrays are read-only and shared by every caller asking for the same key.
+    """
+    return _cachedTemplate(*templateKey(sb_type, size, height, sup, segments, compact))
+
+
+def templateCacheInfo():
+    return _cachedTemplate.cache_info()
+
+
+def clearTemplateCache() -> None:
+    _cachedTemplate.cache_clear()
+
+
+def transformPoints(matrix, points) -> numpy.ndarray:
+    """Apply a 4x4 transformation (column vector convention) to (n, 3) points."""
+    matrix = numpy.asarray(matrix, dtype=numpy.float64)
+    points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def faceIndices(vertices: numpy.ndarray, indices) -> numpy.ndarray:
+    """(m, 3) face indices, also for a non indexed mesh where every 3 vertices make a face."""
+    if indices is None:
+        return numpy.arange(vertices.shape[0], dtype=numpy.int32).reshape(-1, 3)
+    return numpy.asarray(indices, dtype=numpy.int32)
+
+
+def concatenateMeshes(meshes):
+    """Concatenate several (vertices, indices) meshes into a single indexed mesh.
+
+    :param meshes: list of (vertices, indices), indices may be None.
+    :return: (vertices, indices)
+    """
+    all_verts = []
+    all_indices = []
+    offset = 0
+    for verts, indices in meshes:
+        all_verts.append(numpy.asarray(verts, dtype=numpy.float32))
+        all_indices.append(faceIndices(verts, indices) + offset)
+        offset += verts.shape[0]
+    return numpy.concatenate(all_verts), numpy.concatenate(all_indices).astype(numpy.int32)
+
+
+# Offsets to the 13 "forward" neighbours of a grid cell, the 13 others are covered by symmetry
+_NEIGHBOUR_OFFSETS = numpy.array(
+    [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1) if (dx, dy, dz) > (0, 0, 0)],
+    dtype=numpy.int64)
+
+
+def _connectedCells(cells: numpy.ndarray) -> numpy.ndarray:
+    """Label of the connected group (26-neighbourhood) of every unique grid cell."""
+    nb_cells = cells.shape[0]
+    origin = cells.min(axis=0) - 1
+    dims = cells.max(axis=0) - origin + 2
+    def encode(c):
+        return ((c[:, 0] - origin[0]) * dims[1] + (c[:, 1] - origin[1])) * dims[2] + (c[:, 2] - origin[2])
+
+    keys = encode(cells)
+    order = numpy.argsort(keys)
+    sorted_keys = keys[order]
+
+    pairs_a = []
+    pairs_b = []
+    for offset in _NEIGHBOUR_OFFSETS:
+        neighbour_keys = encode(cells + offset)
+        pos = numpy.searchsorted(sorted_keys, neighbour_keys)
+        pos[pos >= nb_cells] = 0
+        found = sorted_keys[pos] == neighbour_keys
+        pairs_a.append(numpy.nonzero(found)[0])
+        pairs_b.append(order[pos[found]])
+    pairs_a = numpy.concatenate(pairs_a)
+    pairs_b = numpy.concatenate(pairs_b)
+
+    # Propagate the smallest label along the links until nothing moves
+    labels = numpy.arange(nb_cells)
+    while pairs_a.size:
+        link = numpy.minimum(labels[pairs_a], labels[pairs_b])
+        new_labels = labels.copy()
+        numpy.minimum.at(new_labels, pairs_a, link)
+        numpy.minimum.at(new_labels, pairs_b, link)
+        new_labels = new_labels[new_labels]
+        if numpy.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    return numpy.unique(labels, return_inverse=True)[1].reshape(-1)
+
+
+def findOverhangRegions(vertices: numpy.ndarray, indices, support_angle: float, cell_size: float,
+                        min_area: float = 0.0, max_height: float = 0.0, plate_tolerance: float = 0.2):
+    """Group the overhanging faces of a mesh into regions.
+
+    :param vertices: (n, 3) world space vertices, Y up.
+    :param indices: (m, 3) face indices or None for a non indexed mesh.
+    :param support_angle: support overhang angle in degree.
+    :param cell_size: faces closer than this distance end up in the same region.
+    :param min_area: regions with a smaller projected area (mm2) are ignored.
+    :param max_height: regions starting higher than this are ignored, 0 = no limit.
+    :param plate_tolerance: faces lower than this lie on the build plate and are not overhangs.
+    :return: list of (center_x, top_y, center_z, extent_x, extent_z, depth, area) sorted by area,
+             top_y being the highest point of the region and depth its height.
+    """
+    vertices = numpy.asarray(vertices, dtype=numpy.float64)
+    if indices is None:
+        tris = vertices.reshape(-1, 3, 3)
+    else:
+        tris = vertices[numpy.asarray(indices)]
+    if tris.shape[0] == 0:
+        return []
+
+    cross = numpy.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    length = numpy.linalg.norm(cross, axis=1)
+    valid = length > 0
+    normal_y = numpy.zeros(length.shape)
+    normal_y[valid] = cross[valid, 1] / length[valid]
+
+    tri_min = tris.min(axis=1)
+    tri_max = tris.max(axis=1)
+    overhang = valid & (normal_y < -numpy.sin(numpy.radians(support_angle))) & (tri_min[:, 1] > plate_tolerance)
+    if max_height > 0:
+        overhang &= tri_min[:, 1] <= max_height
+    if not overhang.any():
+        return []
+
+    tri_min = tri_min[overhang]
+    tri_max = tri_max[overhang]
+    # Projected area on the build plate
+    area = numpy.abs(cross[overhang, 1]) * 0.5
+
+    # Every face covers the grid cells of its bounding box, so large faces link the cells they span
+    cell_size = max(cell_size, 1e-3)
+    while True:
+        cell_lo = numpy.floor(tri_min / cell_size).astype(numpy.int64)
+        span = numpy.floor(tri_max / cell_size).astype(numpy.int64) - cell_lo + 1
+        count = span.prod(axis=1)
+        if count.sum() <= MAX_OVERHANG_CELLS:
+            break
+        cell_size *= 2.0
+
+    face = numpy.repeat(numpy.arange(count.shape[0]), count)
+    rank = numpy.arange(face.shape[0]) - numpy.repeat(numpy.cumsum(count) - count, count)
+    span_f = span[face]
+    offset = numpy.stack([rank // (span_f[:, 1] * span_f[:, 2]),
+                          (rank // span_f[:, 2]) % span_f[:, 1],
+                          rank % span_f[:, 2]], axis=1)
+    item_cells = cell_lo[face] + offset
+    # Unique on a single int64 key is much faster than a row-wise unique
+    origin = item_cells.min(axis=0)
+    dims = item_cells.max(axis=0) - origin + 1
+    keys = ((item_cells[:, 0] - origin[0]) * dims[1] + (item_cells[:, 1] - origin[1])) * dims[2] + (item_cells[:, 2] - origin[2])
+    unique_keys, cell_of_item = numpy.unique(keys, return_inverse=True)
+    cells = numpy.stack([unique_keys // (dims[1] * dims[2]) + origin[0],
+                         (unique_keys // dims[2]) % dims[1] + origin[1],
+                         unique_keys % dims[2] + origin[2]], axis=1)
+    cell_label = _connectedCells(cells)
+    region = numpy.zeros(count.shape[0], dtype=numpy.int64)
+    region[face] = cell_label[cell_of_item.reshape(-1)]
+    nb_regions = region.max() + 1
+
+    region_min = numpy.full((nb_regions, 3), numpy.inf)
+    region_max = numpy.full((nb_regions, 3), -numpy.inf)
+    numpy.minimum.at(region_min, region, tri_min)
+    numpy.maximum.at(region_max, region, tri_max)
+    region_area = numpy.bincount(region, weights=area, minlength=nb_regions)
+
+    regions = []
+    for i in numpy.argsort(-region_area):
+        if region_area[i] < min_area:
+            continue
+        center = (region_min[i] + region_max[i]) * 0.5
+        extent = region_max[i] - region_min[i]
+        regions.append((float(center[0]), float(region_max[i, 1]), float(center[2]),
+                        float(extent[0]), float(extent[2]), float(extent[1]), float(region_area[i])))
+    return regions
+
+
+def _cellItems(count: numpy.ndarray):
+    # (owner, rank) of every item when owner i has count[i] items
+    owner = numpy.repeat(numpy.arange(count.shape[0]), count)
+    rank = numpy.arange(owner.shape[0]) - numpy.repeat(numpy.cumsum(count) - count, count)
+    return owner, rank
+
+
+class VerticalRayCaster:
+    """Downward rays against the upward facing triangles of a mesh.
+
+    All the rays are vertical, so a uniform grid on the build plate (X Z) plays the role of a BVH :
+    every triangle is listed in the cells its bounding box covers, a ray only tests the triangles
+    of its cell. Build it once per mesh and transformation, then cast the rays in batches.
+    """
+    def __init__(self, vertices: numpy.ndarray, indices = None, max_entries: int = MAX_RAY_GRID_ENTRIES) -> None:
+        """
+        param vertices: (n, 3) world space vertices, Y up.
+        param indices: (m, 3) face indices or None for a non indexed mesh.
+        """
+        vertices = numpy.asarray(vertices, dtype=numpy.float64)
+        tris = vertices.reshape(-1, 3, 3) if indices is None else vertices[numpy.asarray(indices)]
+        e1 = tris[:, 1] - tris[:, 0]
+        e2 = tris[:, 2] - tris[:, 0]
+        det = e1[:, 0] * e2[:, 2] - e1[:, 2] * e2[:, 0]
+        # Only the surfaces facing up can stop a blocker, the overhang itself faces down
+        up = numpy.cross(e1, e2)[:, 1] > 1e-9
+        tris, e1, e2, det = tris[up], e1[up], e2[up], det[up]
+
+        self._origin_xz = tris[:, 0][:, [0, 2]]
+        self._origin_y = tris[:, 0, 1]
+        self._e1 = e1
+        self._e2 = e2
+        self._inv_det = 1.0 / det
+        self._size = tris.shape[0]
+        if self._size == 0:
+            return
+
+        tri_min = tris.min(axis=1)[:, [0, 2]]
+        tri_max = tris.max(axis=1)[:, [0, 2]]
+        self._grid_min = tri_min.min(axis=0)
+        extent = numpy.maximum(tri_max.max(axis=0) - self._grid_min, 1e-3)
+        cell_size = max(float(numpy.sqrt(extent[0] * extent[1] / self._size)) * 2.0, 1e-3)
+        while True:
+            cell_lo = numpy.floor((tri_min - self._grid_min) / cell_size).astype(numpy.int64)
+            span = numpy.floor((tri_max - self._grid_min) / cell_size).astype(numpy.int64) - cell_lo + 1
+            count = span.prod(axis=1)
+            if count.sum() <= max_entries:
+                break
+            cell_size *= 2.0
+        self._cell_size = cell_size
+        self._dims = numpy.floor(extent / cell_size).astype(numpy.int64) + 1
+
+        # Triangles sorted by cell, with the offset of every cell in the list
+        tri, rank = _cellItems(count)
+        cells = cell_lo[tri] + numpy.stack([rank // span[tri, 1], rank % span[tri, 1]], axis=1)
+        keys = cells[:, 0] * self._dims[1] + cells[:, 1]
+        order = numpy.argsort(keys, kind='stable')
+        self._cell_tris = tri[order]
+        self._cell_offsets = numpy.concatenate([[0], numpy.cumsum(numpy.bincount(keys, minlength=int(self._dims.prod())))])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def castDown(self, points, gap: float = 1e-3) -> numpy.ndarray:
+        """Y of the first upward facing surface at least gap below every point, -inf where there is none.
+
+        :param points: (k, 3) ray origins.
+        """
+        points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        result = numpy.full(points.shape[0], -numpy.inf)
+        if self._size == 0 or points.shape[0] == 0:
+            return result
+
+        cell = numpy.floor((points[:, [0, 2]] - self._grid_min) / self._cell_size).astype(numpy.int64)
+        inside = (cell >= 0).all(axis=1) & (cell < self._dims).all(axis=1)
+        key = numpy.where(inside, cell[:, 0] * self._dims[1] + cell[:, 1], 0)
+        start = self._cell_offsets[key]
+        count = numpy.where(inside, self._cell_offsets[key + 1] - start, 0)
+
+        ray, rank = _cellItems(count)
+        tri = self._cell_tris[start[ray] + rank]
+        # Barycentric coordinates of the ray in the triangle projected on the build plate
+        d = points[ray][:, [0, 2]] - self._origin_xz[tri]
+        e1 = self._e1[tri]
+        e2 = self._e2[tri]
+        u = (d[:, 0] * e2[:, 2] - d[:, 1] * e2[:, 0]) * self._inv_det[tri]
+        v = (e1[:, 0] * d[:, 1] - e1[:, 2] * d[:, 0]) * self._inv_det[tri]
+        y = self._origin_y[tri] + e1[:, 1] * u + e2[:, 1] * v
+        hit = (u >= -1e-9) & (v >= -1e-9) & (u + v <= 1 + 1e-9) & (y <= points[ray, 1] - gap)
+        numpy.maximum.at(result, ray[hit], y[hit])
+        return result
+
+
+def boxSamples(start, end, window_width: int, window_height: int, count: int = BOX_SAMPLES):
+    """Grid of count x count samples over a screen rectangle.
+
+    :param start: corner (x, y) in the normalized coordinates of the mouse events (-1 to 1).
+    :param end: opposite corner.
+    :return: (x, y, px, py) normalized coordinates and pixel indices of the samples, as used by the PickingPass.
+    """
+    x, y = numpy.meshgrid(numpy.linspace(start[0], end[0], count), numpy.linspace(start[1], end[1], count), indexing='ij')
+    x = x.ravel()
+    y = y.ravel()
+    px = numpy.floor((0.5 + x / 2.0) * window_width).astype(numpy.int64)
+    py = numpy.floor((0.5 + y / 2.0) * window_height).astype(numpy.int64)
+    return x, y, px, py
+
+
+def pickedDepth(pixels) -> numpy.ndarray:
+    """Distance in mm from the camera of picking pass pixels (ARGB), stored in micron in the RGB channels."""
+    return (numpy.asarray(pixels, dtype=numpy.uint32) & 0x00FFFFFF) / 1000.0
+
+
+def fitOrientedBox(points, min_extent: float = 0.0):
+    """Box around the points, turned along the main direction of their spread in the XZ plane.
+
+    :param points: (n, 3) points.
+    :param min_extent: minimum length and width in mm.
+    :return: (center (x, z), length, width, angle, y_min, y_max) the angle as for createOrientedBox.
+    """
+    points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    xz = points[:, [0, 2]]
+    mean = xz.mean(axis=0)
+    centered = xz - mean
+    # Principal axis of the XZ covariance, the length follows it
+    _, vectors = numpy.linalg.eigh(centered.T @ centered)
+    angle = float(numpy.arctan2(vectors[1, 1], vectors[0, 1]))
+    axis_u = numpy.array([numpy.cos(angle), numpy.sin(angle)])
+    axis_v = numpy.array([-axis_u[1], axis_u[0]])
+    u = centered @ axis_u
+    v = centered @ axis_v
+    center = mean + axis_u * (u.min() + u.max()) * 0.5 + axis_v * (v.min() + v.max()) * 0.5
+    length = max(float(u.max() - u.min()), min_extent)
+    width = max(float(v.max() - v.min()), min_extent)
+    return center, length, width, angle, float(points[:, 1].min()), float(points[:, 1].max())
+
+
+def boxFromCorners(points, min_extent: float = 0.0):
+    """Box of a recorded box blocker, the inverse of its record : no new fit, so a square keeps its angle.
+
+    :param points: (9, 3) top center, the 4 top corners in boxCorners order, then the 4 bottom corners.
+    :param min_extent: minimum length and width in mm.
+    :return: (center (x, z), length, width, angle, y_min, y_max) as fitOrientedBox.
+    """
+    points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+    corners = points[1:5][:, [0, 2]]
+    side_u = corners[1] - corners[0]
+    side_v = corners[2] - corners[1]
+    angle = float(numpy.arctan2(side_u[1], side_u[0]))
+    center = corners.mean(axis=0)
+    length = max(float(numpy.linalg.norm(side_u)), min_extent)
+    width = max(float(numpy.linalg.norm(side_v)), min_extent)
+    return center, length, width, angle, float(points[5:9, 1].min()), float(points[0, 1])
+
+
+def boxCorners(length: float, width: float, angle: float) -> numpy.ndarray:
+    """(4, 2) XZ offsets of the corners of an oriented box from its center."""
+    c = numpy.cos(angle)
+    s = numpy.sin(angle)
+    corners = numpy.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=numpy.float64) * [length * 0.5, width * 0.5]
+    return numpy.stack([corners[:, 0] * c - corners[:, 1] * s, corners[:, 0] * s + corners[:, 1] * c], axis=1)
+
+
+def _footprintIntervals(extent: float, spacing: float) -> int:
+    # Intervals along extent mm keeping the rays at most spacing mm apart
+    return min(max(int(numpy.ceil(extent / spacing - 1e-9)), 1), MAX_FLOOR_RAY_SAMPLES - 1)
+
+
+def _gridFootprint(nu: int, nv: int, length: float, width: float, angle: float) -> numpy.ndarray:
+    # nu x nv rays over a rectangle turned around Y, corners and edges included
+    u, v = numpy.meshgrid(numpy.linspace(-0.5, 0.5, nu) * length, numpy.linspace(-0.5, 0.5, nv) * width, indexing='ij')
+    u = u.ravel()
+    v = v.ravel()
+    c = numpy.cos(angle)
+    s = numpy.sin(angle)
+    return numpy.stack([u * c - v * s, numpy.zeros(u.shape[0]), u * s + v * c], axis=1)
+
+
+def _ringFootprint(rings: int, radius: float) -> numpy.ndarray:
+    # Center and concentric rings, ring k has at least 2 pi k rays so they stay as far apart as the rings
+    offsets = [numpy.zeros((1, 3))]
+    for ring in range(1, rings + 1):
+        count = max(8, int(numpy.ceil(2 * numpy.pi * ring)))
+        angles = numpy.linspace(0.0, 2 * numpy.pi, count, endpoint=False)
+        r = radius * ring / rings
+        offsets.append(numpy.stack([numpy.cos(angles) * r, numpy.zeros(count), numpy.sin(angles) * r], axis=1))
+    return numpy.vstack(offsets)
+
+
+def boxFootprint(length: float, width: float, angle: float, spacing: float = FLOOR_RAY_SPACING) -> numpy.ndarray:
+    """(k, 3) offsets of the points sampling the footprint of an oriented box from its center, corners and edges included."""
+    return _gridFootprint(_footprintIntervals(length, spacing) + 1, _footprintIntervals(width, spacing) + 1, length, width, angle)
+
+
+def boxSurfaceBelow(caster: VerticalRayCaster, box, gap: float = 0.1) -> float:
+    """Height of the first surface under the whole footprint of a box, below its lowest point, 0 when there is none.
+
+    :param box: (center (x, z), length, width, angle, y_min, y_max) from fitOrientedBox.
+    """
+    center, length, width, angle, y_min, y_max = box
+    points = numpy.array([center[0], y_min, center[1]]) + boxFootprint(length, width, angle)
+    return max(float(caster.castDown(points, gap).max()), 0.0)
+
+
+def _footprintSamples(sb_type: str, size: float, spacing: float) -> int:
+    # Rings of a cylinder, intervals per side of a cube or a template, 0 for a single ray
+    if sb_type == 'cylinder':
+        return _footprintIntervals(size / 2, spacing)
+    if sb_type in ('cube', 'template'):
+        return _footprintIntervals(size, spacing)
+    return 0
+
+
+def _unitFootprint(sb_type: str, samples: int) -> numpy.ndarray:
+    # Offsets of a blocker of size 1, the center first
+    if sb_type == 'cylinder':
+        return _ringFootprint(samples, 0.5)
+    if sb_type in ('cube', 'template'):
+        return numpy.vstack([numpy.zeros((1, 3)), _gridFootprint(samples + 1, samples + 1, 1.0, 1.0, 0.0)])
+    return numpy.zeros((1, 3))
+
+
+def footprintOffsets(sb_type: str, size: float, spacing: float = FLOOR_RAY_SPACING) -> numpy.ndarray:
+    """(k, 3) offsets of the points sampling the footprint of a blocker, the center first, at most spacing mm apart.
+
+    A grid for a cube or a template, concentric rings for a cylinder. A box has no size based
+    footprint, see boxSurfaceBelow.
+    """
+    return _unitFootprint(sb_type, _footprintSamples(sb_type, size, spacing)) * size
+
+
+def surfaceBelow(caster: VerticalRayCaster, sb_types, positions, sizes, gap: float = 0.1) -> numpy.ndarray:
+    """Height of the first surface under the footprint of every blocker, 0 (build plate) when there is none.
+
+    :param sb_types: blocker type, one for all or one per blocker.
+    :param positions: (n, 3) picked points.
+    :param sizes: blocker size, one for all or one per blocker.
+    :param gap: surfaces closer to the picked point are ignored, the picked position is not exact.
+    """
+    positions = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)
+    sizes = numpy.broadcast_to(numpy.asarray(sizes, dtype=numpy.float64), (positions.shape[0],))
+    types = numpy.broadcast_to(numpy.asarray(sb_types), (positions.shape[0],))
+    floors = numpy.zeros(positions.shape[0])
+    # All the rays of the blockers of a type with the same number of samples in one batch
+    samples = numpy.array([_footprintSamples(str(sb_type), float(size), FLOOR_RAY_SPACING) for sb_type, size in zip(types, sizes)], dtype=numpy.int64)
+    for sb_type in numpy.unique(types):
+        for count in numpy.unique(samples[types == sb_type]):
+            selected = (types == sb_type) & (samples == count)
+            offsets = _unitFootprint(str(sb_type), int(count))
+            points = positions[selected][:, None, :] + offsets[None, :, :] * sizes[selected][:, None, None]
+            hits = caster.castDown(points.reshape(-1, 3), gap).reshape(int(selected.sum()), -1)
+            floors[selected] = numpy.maximum(hits.max(axis=1), 0.0)
+    return floors
+
+# position2 (x, y, z) only used by the custom type, points [(x, y, z), ...] only used by the polyline type
+PlacementSpec = collections.namedtuple("PlacementSpec", ["sb_type", "size", "position", "position2", "on_build_plate", "points"],
+                                       defaults=[None, False, None])
+
+# Types createBlocker can build without Cura, template and box blockers need the tool
+HEADLESS_TYPES = ('cube', 'cylinder', 'custom', 'polyline')
+
+
+def createBlocker(spec: PlacementSpec, tolerance: float = DEFAULT_CHORD_TOLERANCE, compact: bool = False):
+    """(vertices, indices, normals) of a blocker, relative to its position, same rules as the tool.
+
+    :raise ValueError: the type is not one of HEADLESS_TYPES.
+    """
+    if spec.sb_type not in HEADLESS_TYPES:
+        raise ValueError("Unsupported blocker type %r, expected one of %s" % (spec.sb_type, ", ".join(HEADLESS_TYPES)))
+    position = tuple(float(v) for v in spec.position)
+    sup = topExtra(spec.sb_type, spec.size)
+    if spec.sb_type == 'custom':
+        position2 = tuple(float(v) for v in spec.position2) if spec.position2 is not None else position
+        verts, indices = createCustom(spec.size, position, position2, sup)
+        return meshArrays(verts, indices, compact)
+    if spec.sb_type == 'polyline':
+        points = spec.points if spec.points else [position]
+        verts, indices = createPolyline(spec.size, points, sup)
+        return meshArrays(verts, indices, compact)
+    height = blockerHeight(spec.sb_type, spec.size, position[1], spec.on_build_plate)
+    return getTemplate(spec.sb_type, spec.size, height, sup, segmentsForTolerance(spec.size / 2, tolerance), compact)
+
+
+def buildBlockers(specs, tolerance: float = DEFAULT_CHORD_TOLERANCE, compact: bool = False):
+    """Blocker meshes of a list of placements.
+
+    :param specs: iterable of PlacementSpec (or tuples in the same order).
+    :param tolerance: chord tolerance in mm of the cylinders.
+    :param compact: share the vertices between faces.
+    :return: list of (vertices, indices, normals), vertices in scene coordinates.
+    :raise ValueError: a placement has a type createBlocker does not support.
+    """
+    meshes = []
+    for spec in specs:
+        spec = PlacementSpec(*spec)
+        verts, indices, normals = createBlocker(spec, tolerance, compact)
+        meshes.append((verts + numpy.asarray(spec.position, dtype=numpy.float32), indices, normals))
+    return meshes
+
+
+def _toZUp(vertices: numpy.ndarray) -> numpy.ndarray:
+    # Cura Y up -> file Z up, the inverse of the rotation Cura applies on load
+    return numpy.stack([vertices[:, 0], -vertices[:, 2], vertices[:, 1]], axis=1)
+
+
+def writeStl(path: str, meshes) -> None:
+    """Write the meshes as a single binary STL file."""
+    tris = numpy.concatenate([_toZUp(verts)[faceIndices(verts, indices)] for verts, indices, *_ in meshes]).astype(numpy.float32)
+    normals = numpy.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    length = numpy.linalg.norm(normals, axis=1)
+    length[length == 0] = 1.0
+    normals /= length[:, None]
+
+    record = numpy.zeros(tris.shape[0], dtype=[("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+    record["normal"] = normals
+    record["vertices"] = tris
+    with open(path, "wb") as stl_file:
+        stl_file.write(b"Custom Support Eraser Plus blockers".ljust(80, b" "))
+        stl_file.write(struct.pack("<I", tris.shape[0]))
+        stl_file.write(record.tobytes())
+
+
+def write3mf(path: str, meshes) -> None:
+    """Write the meshes as one object each in a 3MF file."""
+    objects = []
+    items = []
+    for object_id, (verts, indices, *_) in enumerate(meshes, start = 1):
+        verts = _toZUp(verts)
+        vertex_xml = "".join('<vertex x="%.4f" y="%.4f" z="%.4f"/>' % tuple(v) for v in verts)
+        triangle_xml = "".join('<triangle v1="%d" v2="%d" v3="%d"/>' % tuple(t) for t in faceIndices(verts, indices))
+        objects.append('<object id="%d" type="model"><mesh><vertices>%s</vertices><triangles>%s</triangles></mesh></object>' % (object_id, vertex_xml, triangle_xml))
+        items.append('<item objectid="%d"/>' % object_id)
+
+    model = ('<?xml version="1.0" encoding="UTF-8"?>'
+             '<model unit="millimeter" xml:lang="en-US" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">'
+             '<resources>%s</resources><build>%s</build></model>') % ("".join(objects), "".join(items))
+    content_types = ('<?xml version="1.0" encoding="UTF-8"?>'
+                     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                     '<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>'
+                     '</Types>')
+    rels = ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Target="/3D/3dmodel.model" Id="rel0" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>'
+            '</Relationships>')
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", rels)
+        archive.writestr("3D/3dmodel.model", model)
+
+
+def writeBlockers(path: str, meshes) -> None:
+    """Write the meshes as STL or 3MF according to the file extension.
+
+    :raise ValueError: there is no mesh to write.
+    """
+    if not meshes:
+        raise ValueError("No blocker to write")
+    if path.lower().endswith(".3mf"):
+        write3mf(path, meshes)
+    else:
+        writeStl(path, meshes)
+
+
+def loadPlacements(path: str):
+    """Read a JSON list of placements :
+    [{"type": "cube", "size": 5, "position": [x, y, z], "position2": [x, y, z], "on_build_plate": true}, ...]
+    A polyline gives its points instead of the position : {"type": "polyline", "size": 5, "points": [[x, y, z], ...]}
+
+    :raise ValueError: the file is not such a list, is empty, or a placement is not valid (its index is in the message).
+    """
+    with open(path, "r", encoding = "utf-8") as json_file:
+        data = json.load(json_file)
+    if not isinstance(data, list):
+        raise ValueError("%s must contain a JSON list of placements" % path)
+    if not data:
+        raise ValueError("No placement in %s" % path)
+    return [_placementSpec(index, item) for index, item in enumerate(data)]
+
+
+def _point(index: int, name: str, value):
+    # (x, y, z) of a placement field
+    try:
+        point = tuple(float(v) for v in value)
+    except (TypeError, ValueError):
+        point = ()
+    if len(point) != 3:
+        raise ValueError("Placement %d : %s must be [x, y, z]" % (index, name))
+    return point
+
+
+def _placementSpec(index: int, item) -> PlacementSpec:
+    # PlacementSpec of one item of a placements file, ValueError with the index of the item when it is not valid
+    if not isinstance(item, dict):
+        raise ValueError("Placement %d : must be a JSON object" % index)
+    sb_type = item.get("type", "cube")
+    if sb_type not in HEADLESS_TYPES:
+        raise ValueError("Placement %d : unsupported blocker type %r, expected one of %s" % (index, sb_type, ", ".join(HEADLESS_TYPES)))
+    try:
+        size = float(item.get("size", 5.0))
+    except (TypeError, ValueError):
+        size = 0.0
+    if not size > 0:
+        raise ValueError("Placement %d : size must be a number greater than 0" % index)
+    points = None
+    if item.get("points") is not None:
+        if not isinstance(item["points"], list) or not item["points"]:
+            raise ValueError("Placement %d : points must be a list of [x, y, z]" % index)
+        points = [_point(index, "points[%d]" % i, point) for i, point in enumerate(item["points"])]
+    if item.get("position") is not None:
+        position = _point(index, "position", item["position"])
+    elif points is not None:
+        position = points[0]
+    else:
+        raise ValueError("Placement %d : position (or points) is missing" % index)
+    position2 = _point(index, "position2", item["position2"]) if item.get("position2") is not None else None
+    return PlacementSpec(sb_type, size, position, position2, bool(item.get("on_build_plate", False)), points)
+
+
+def main(argv) -> int:
+    if len(argv) != 3:
+        print("usage: python BlockerGeometry.py placements.json output.stl|output.3mf")
+        return 1
+    try:
+        meshes = buildBlockers(loadPlacements(argv[1]))
+        writeBlockers(argv[2], meshes)
+    except (OSError, ValueError) as e:
+        print("error: %s" % e)
+        return 1
+    print("%d blocker(s) written to %s" % (len(meshes), argv[2]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
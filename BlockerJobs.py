@@ -0,0 +1,66 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Heavy geometry work (overhang analysis, ray casting, union of blockers) run by the worker
+# threads of the Uranium JobQueue.
+#
+# The compute function only works on NumPy arrays and immutable MeshData, it never touches the
+# scene. Progress and result are handed back to the main thread with Application.callLater, so
+# the scene operations built from the result still run in the Qt event loop.
+#--------------------------------------------------------------------------------------------
+
+import time
+
+from UM.Application import Application
+from UM.Job import Job
+from UM.Logger import Logger
+
+
+class JobCancelled(Exception):
+    """Raised inside the compute function when the job was cancelled."""
+    pass
+
+
+class GeometryJob(Job):
+    def __init__(self, stage: str, compute, on_done, on_progress, on_finished) -> None:
+        """
+        param stage: name of the job, also used for the statistics.
+        param compute: function(job) run in a worker thread, returns the result.
+        param on_done: function(result) run on the main thread with the result.
+        param on_progress: function(job, percent) run on the main thread.
+        param on_finished: function(job) run on the main thread once the job is over.
+        """
+        super().__init__()
+        self.stage = stage
+        self.on_done = on_done
+        self.elapsed = 0.0
+        self._compute = compute
+        self._on_progress = on_progress
+        self._on_finished = on_finished
+        self._cancelled = False
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        try:
+            self.setResult(self._compute(self))
+        except JobCancelled:
+            pass
+        except Exception as e:
+            Logger.logException("e", "Support blocker job %s failed", self.stage)
+            self.setError(e)
+        self.elapsed = time.perf_counter() - start
+        Application.getInstance().callLater(self._on_finished, self)
+
+    def cancel(self) -> None:
+        # A job still waiting is removed from the queue, a running one stops at its next report()
+        self._cancelled = True
+        super().cancel()
+
+    def isCancelled(self) -> bool:
+        return self._cancelled
+
+    def report(self, done: int, total: int) -> None:
+        """Called by the compute function between two steps : progress, and stop if cancelled."""
+        if self._cancelled:
+            raise JobCancelled()
+        Application.getInstance().callLater(self._on_progress, self, int(100 * done / max(total, 1)))
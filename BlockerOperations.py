@@ -0,0 +1,35 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Undoable operations of the tool which Uranium does not provide.
+#--------------------------------------------------------------------------------------------
+
+from UM.Operations.Operation import Operation
+
+
+class SetMeshDataOperation(Operation):
+    """Replace the mesh of a node, the previous mesh comes back on undo."""
+    def __init__(self, node, mesh_data, name: str = None, on_changed = None) -> None:
+        """
+        param name: new name of the node, None to keep it.
+        param on_changed: function(node, redone) called after every redo (True) and undo (False).
+        """
+        super().__init__()
+        self._node = node
+        self._old_mesh_data = node.getMeshData()
+        self._new_mesh_data = mesh_data
+        self._old_name = node.getName()
+        self._new_name = name if name is not None else self._old_name
+        self._on_changed = on_changed
+
+    def undo(self) -> None:
+        self._node.setName(self._old_name)
+        self._node.setMeshData(self._old_mesh_data)
+        if self._on_changed is not None:
+            self._on_changed(self._node, False)
+
+    def redo(self) -> None:
+        self._node.setName(self._new_name)
+        self._node.setMeshData(self._new_mesh_data)
+        if self._on_changed is not None:
+            self._on_changed(self._node, True)
@@ -0,0 +1,173 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Index of the support blockers present in the scene.
+#
+# The nodes are held through weak references and indexed by parent node and by build plate,
+# so the lookups only visit the blockers concerned instead of walking the whole scene.
+# Nodes removed from the scene stay known (as long as something, like the undo stack, keeps
+# them alive) and come back in the lookups once an undo puts them back in the scene.
+#
+# SpatialHash is a grid index of blocker positions used to skip overlapping placements.
+#--------------------------------------------------------------------------------------------
+
+import itertools
+import math
+import weakref
+
+
+class BlockerRegistry:
+    def __init__(self, root) -> None:
+        """
+        param root: root node of the scene.
+        """
+        self._root = root
+        # id(node) -> weak reference
+        self._refs = {}
+        # id(node) -> (id(parent), build plate) used when the node was indexed
+        self._keys = {}
+        self._by_parent = {}
+        self._by_plate = {}
+        # Blockers placed during this session, for the "Remove Last" action
+        self._session = set()
+        # id(node) -> rank of the node in the order the blockers were added
+        self._order = {}
+        self._counter = itertools.count()
+
+    def __contains__(self, node) -> bool:
+        return id(node) in self._refs
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def add(self, node, session: bool = False) -> None:
+        node_id = id(node)
+        if node_id not in self._refs:
+            self._refs[node_id] = weakref.ref(node, lambda ref, node_id = node_id: self._forget(node_id))
+            self._order[node_id] = next(self._counter)
+        self.update(node)
+        if session:
+            self._session.add(node_id)
+
+    def update(self, node) -> None:
+        """Index the node again after a change of parent or build plate."""
+        node_id = id(node)
+        if node_id not in self._refs:
+            return
+        parent = node.getParent()
+        if parent is None:
+            # Removed from the scene : keep the last index, an undo puts it back under the same parent
+            return
+        key = (id(parent), node.callDecoration("getBuildPlateNumber"))
+        if self._keys.get(node_id) == key:
+            return
+        self._unindex(node_id)
+        self._keys[node_id] = key
+        self._by_parent.setdefault(key[0], set()).add(node_id)
+        self._by_plate.setdefault(key[1], set()).add(node_id)
+
+    def discard(self, node) -> None:
+        self._forget(id(node))
+
+    def clearSession(self) -> None:
+        self._session.clear()
+
+    def nodes(self, parent = None, build_plate = None, session: bool = False):
+        """Blockers currently in the scene, optionally limited to a parent, a build plate or this session."""
+        if parent is not None:
+            candidates = self._by_parent.get(id(parent), ())
+        elif build_plate is not None:
+            candidates = self._by_plate.get(build_plate, ())
+        elif session:
+            candidates = self._session
+        else:
+            candidates = self._refs
+
+        result = []
+        for node_id in list(candidates):
+            node = self._refs[node_id]()
+            if node is None:
+                continue
+            # The index is refreshed lazily when a node moved since it was indexed
+            self.update(node)
+            if not self._isInScene(node):
+                continue
+            if parent is not None and node.getParent() is not parent:
+                continue
+            if build_plate is not None and self._keys[node_id][1] != build_plate:
+                continue
+            if session and node_id not in self._session:
+                continue
+            result.append(node)
+        return result
+
+    def newestFirst(self, nodes):
+        """The nodes sorted from the last added blocker to the first one."""
+        return sorted(nodes, key = lambda node: self._order.get(id(node), -1), reverse = True)
+
+    def count(self, parent = None, build_plate = None) -> int:
+        return len(self.nodes(parent, build_plate))
+
+    def countByPlate(self):
+        """Number of blockers in the scene for every build plate."""
+        counts = {}
+        for node in self.nodes():
+            plate = self._keys[id(node)][1]
+            counts[plate] = counts.get(plate, 0) + 1
+        return counts
+
+    def _isInScene(self, node) -> bool:
+        while node is not None:
+            if node is self._root:
+                return True
+            node = node.getParent()
+        return False
+
+    def _unindex(self, node_id: int) -> None:
+        key = self._keys.pop(node_id, None)
+        if key is None:
+            return
+        for index, value in ((self._by_parent, key[0]), (self._by_plate, key[1])):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.discard(node_id)
+                if not bucket:
+                    del index[value]
+
+    def _forget(self, node_id: int) -> None:
+        self._unindex(node_id)
+        self._refs.pop(node_id, None)
+        self._order.pop(node_id, None)
+        self._session.discard(node_id)
+
+
+class SpatialHash:
+    """Uniform grid of points, to know quickly if a new point falls too close to an existing one."""
+    def __init__(self, cell_size: float) -> None:
+        self._cell_size = max(float(cell_size), 1e-3)
+        self._cells = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _cell(self, point):
+        return (int(math.floor(point[0] / self._cell_size)),
+                int(math.floor(point[1] / self._cell_size)),
+                int(math.floor(point[2] / self._cell_size)))
+
+    def insert(self, point) -> None:
+        self._cells.setdefault(self._cell(point), []).append((float(point[0]), float(point[1]), float(point[2])))
+        self._count += 1
+
+    def hasNeighbour(self, point, distance: float) -> bool:
+        """True if a stored point is closer than distance, which must not exceed the cell size."""
+        cx, cy, cz = self._cell(point)
+        limit = distance * distance
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for other in self._cells.get((cx + dx, cy + dy, cz + dz), ()):
+                        if (other[0] - point[0]) ** 2 + (other[1] - point[1]) ** 2 + (other[2] - point[2]) ** 2 < limit:
+                            return True
+        return False
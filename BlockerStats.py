@@ -0,0 +1,60 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Optional latency instrumentation of the tool.
+#
+# Every stage of a placement (selection lookup, picking pass, mesh, settings, operation,
+# scene notification) is timed when the instrumentation is enabled. When it is disabled,
+# measure() costs a single test.
+#--------------------------------------------------------------------------------------------
+
+import contextlib
+import time
+
+
+class BlockerStats:
+    def __init__(self) -> None:
+        self.enabled = False
+        # stage -> [count, total s, max s, last s]
+        self._timings = {}
+
+    @contextlib.contextmanager
+    def measure(self, stage: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage: str, seconds: float) -> None:
+        timing = self._timings.get(stage)
+        if timing is None:
+            self._timings[stage] = [1, seconds, seconds, seconds]
+        else:
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+            timing[3] = seconds
+
+    def reset(self) -> None:
+        self._timings = {}
+
+    def timings(self):
+        """stage -> (count, mean ms, max ms, last ms)"""
+        return {stage: (count, total / count * 1000, maximum * 1000, last * 1000)
+                for stage, (count, total, maximum, last) in self._timings.items()}
+
+    def summary(self, blockers_by_plate, triangles: int) -> str:
+        """Multi line text of the counters and the stage timings."""
+        lines = []
+        for plate in sorted(blockers_by_plate, key = str):
+            lines.append("Plate %s : %d blocker(s)" % (plate, blockers_by_plate[plate]))
+        if not lines:
+            lines.append("No blocker")
+        lines.append("Triangles : %d" % triangles)
+        for stage, (count, mean, maximum, last) in self.timings().items():
+            lines.append("%s : %.1f ms (mean %.1f, max %.1f, n=%d)" % (stage, last, mean, maximum, count))
+        return "\n".join(lines)
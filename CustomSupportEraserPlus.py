@@ -12,21 +12,32 @@
 # V1.0.1 01-17-2023  Clean and Simplify plugin Code + Test Cura 4.X
 # V1.1.2 01-18-2023  Introduce Translation
 # V1.1.3 03-13-2023  Change location qml & i18n
+# V1.2.0 10-18-2026  Vectorized blocker geometry with a shared template cache
+# V1.3.0 10-18-2026  Polyline support blocker
+# V1.3.1 10-18-2026  Placements remembered per model geometry
+# V1.3.2 10-18-2026  Stop at the surface below
+# V1.3.3 10-18-2026  Auto and Consolidate computed in background jobs
+# V1.3.4 10-18-2026  Template support blocker from a library of STL / 3MF files
+# V1.3.5 10-18-2026  Box selection covered by one oriented blocker
+# V1.3.6 10-18-2026  Blocker budget with cost estimate and limits
+# V1.3.7 10-18-2026  Batch edit of the existing blockers
 #
 #--------------------------------------------------------------------------------------------
 
 VERSION_QT5 = False
 try:
     from PyQt6.QtCore import Qt, QTimer
+    from PyQt6.QtGui import QImage
     from PyQt6.QtWidgets import QApplication
 except ImportError:
     from PyQt5.QtCore import Qt, QTimer
+    from PyQt5.QtGui import QImage
     from PyQt5.QtWidgets import QApplication
     VERSION_QT5 = True
 
 from cura.CuraApplication import CuraApplication
 
-from UM.Mesh.MeshData import MeshData, calculateNormalsFromIndexedVertices
+from UM.Mesh.MeshData import MeshData
 
 from UM.Logger import Logger
 from UM.Message import Message
@@ -35,32 +46,34 @@ from UM.Math.Vector import Vector
 
 from UM.Tool import Tool
 from UM.Event import Event, MouseEvent
-from UM.Mesh.MeshBuilder import MeshBuilder
 from UM.Scene.Selection import Selection
 
-from cura.PickingPass import PickingPass
-
-from UM.Operations.GroupedOperation import GroupedOperation
-from UM.Operations.AddSceneNodeOperation import AddSceneNodeOperation
-from UM.Operations.RemoveSceneNodeOperation import RemoveSceneNodeOperation
-from cura.Operations.SetParentOperation import SetParentOperation
 from UM.Scene.Iterator.DepthFirstIterator import DepthFirstIterator
 # from UM.Scene.Selection import Selection
 
-from UM.Settings.SettingInstance import SettingInstance
-
-from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
-from cura.Scene.BuildPlateDecorator import BuildPlateDecorator
 from cura.Scene.CuraSceneNode import CuraSceneNode
 
+# PickingPass, the operations, the decorators, SettingInstance and trimesh are imported
+# on first use, so the plugin costs as little as possible at Cura startup
+
+import collections
 import math
 import numpy
 import os.path
-import trimesh
+import time
+import weakref
 
 from UM.Resources import Resources
 from UM.i18n import i18nCatalog
 
+from . import BlockerGeometry
+from .BlockerBudget import BlockerBudget, DEFAULT_MAX_BLOCKERS, DEFAULT_MAX_TRIANGLES, SIMPLIFY_TOLERANCE_FACTOR
+from .BlockerJobs import GeometryJob
+from .BlockerRegistry import BlockerRegistry, SpatialHash
+from .BlockerStats import BlockerStats
+from .PlacementCache import CACHE_FILE_NAME, MeshHashCache, PlacementCache, PlacementRecord
+from .TemplateLibrary import TemplateLibrary, scaleTemplate
+
 
 Resources.addSearchPath(
     os.path.join(os.path.abspath(os.path.dirname(__file__)),'resources')
@@ -77,8 +90,6 @@ class CustomSupportEraserPlus(Tool):
        
         super().__init__()
         
-        self._all_picked_node = []
-        
         self._Nb_Point = 0  
         
         # variable for menu dialog        
@@ -86,22 +97,97 @@ class CustomSupportEraserPlus(Tool):
         self._UseOnBuildPlate = False
         self._SBType = 'cube'
         self._SMsg = i18n_catalog.i18nc("@label", "Remove All") 
+        # Burst placement : delay in ms before the pending blockers are committed, 0 = disabled
+        self._BurstDelay = 0
+        # Automatic placement filters : minimum region area in mm2, maximum height in mm (0 = no limit)
+        self._AutoMinArea = 1.0
+        self._AutoMaxHeight = 0.0
+        # Paint placement : blockers laid along the mouse path, at least PaintSpacing mm apart (0 = size)
+        self._UsePaint = False
+        self._PaintSpacing = 0.0
+        # Box selection : a rectangle dragged on the model is covered by one oriented box blocker
+        self._UseBoxSelect = False
+        # Cylinder facets stay within ChordTolerance mm of the true circle, CompactMesh shares the vertices between faces
+        self._ChordTolerance = BlockerGeometry.DEFAULT_CHORD_TOLERANCE
+        self._UseCompactMesh = False
+        # Placements remembered per model geometry and offered again when the same model is loaded
+        self._UsePlacementCache = True
+        # The blockers stop at the first surface of the model below them instead of going through it
+        self._UseStopAtSurface = False
+        # Type Template : file of the template library, the library is read on first use
+        self._TemplateName = ""
+        self._template_library = None
         
         # Shortcut
         if not VERSION_QT5:
             self._shortcut_key = Qt.Key.Key_B
+            # Keys ending (Enter) or cancelling (Escape) a polyline, as received in the key events
+            self._confirm_keys = (Qt.Key.Key_Return.value, Qt.Key.Key_Enter.value)
+            self._cancel_key = Qt.Key.Key_Escape.value
+            self._image_format = QImage.Format.Format_ARGB32_Premultiplied
         else:
             self._shortcut_key = Qt.Key_B
+            self._confirm_keys = (Qt.Key_Return, Qt.Key_Enter)
+            self._cancel_key = Qt.Key_Escape
+            self._image_format = QImage.Format_ARGB32_Premultiplied
             
         self._controller = self.getController()
 
         self._Svg_Position = Vector
         self._selection_pass = None
-
         
+        # Polyline in progress : picked points, model picked first, (time, x, y) of the last click
+        self._polyline_points = []
+        self._polyline_parent = None
+        self._last_press = None
+        
+        # Box selection in progress : first corner (x, y) and model picked there
+        self._box_start = None
+        self._box_parent = None
+        
+        # The picking pass is kept between clicks and only rendered again when needed
+        self._picking_pass = None
+        self._picking_pass_state = None
+        self._picking_pass_dirty = True
+        
+        # Shared MeshData of the cube / cylinder blockers by template key, oldest first
+        self._shared_mesh_data = collections.OrderedDict()
+        
+        # Ray casters of the models by (id(mesh), world transformation), oldest first
+        self._ray_casters = collections.OrderedDict()
+        
+        # Geometry jobs running in the JobQueue worker threads, and the message showing their progress
+        self._jobs = []
+        self._job_message = None
+
         self._application = CuraApplication.getInstance()
         
-        self.setExposedProperties("SSize" , "SBType" , "OnBuildPlate" , "SMsg")
+        # Optional stage timings of the placements
+        self._stats = BlockerStats()
+        
+        # Blockers of the scene indexed by parent and build plate
+        self._registry = BlockerRegistry(self._controller.getScene().getRoot())
+        
+        # Cost of the blockers of the scene, and the warning shown while the limits are crossed
+        self._budget = BlockerBudget()
+        self._budget_cost = self._budget.measure([])
+        self._budget_message = None
+        self._controller.getScene().sceneChanged.connect(self._onSceneChanged)
+        
+        # Recorded placements : sidecar cache keyed by the model geometry hash, saved shortly after a change
+        self._placement_cache = PlacementCache(os.path.join(Resources.getDataStoragePath(), CACHE_FILE_NAME))
+        self._mesh_hashes = MeshHashCache()
+        # id(node) -> (weak reference, PlacementRecord in node coordinates) of the blockers created here
+        self._placement_records = {}
+        # id(model) -> weak reference of the models recorded here, recorded again when their blockers change outside of the tool
+        self._recorded_models = {}
+        self._placements_changed = False
+        # Models already looked up in the cache, and the ones loaded since the last lookup
+        self._placement_checked = {}
+        self._reapply_candidates = []
+        self._reapply_nodes = []
+        
+        self.setExposedProperties("SSize" , "SBType" , "OnBuildPlate" , "SMsg" , "BurstDelay" , "AutoMinArea" , "AutoMaxHeight" , "Instrumentation" , "SStats" , "Paint" , "PaintSpacing" , "ChordTolerance" , "CompactMesh" , "PlacementCache" , "StopAtSurface" , "TemplateName" , "TemplateList" , "BoxSelect" , "BudgetMaxBlockers" , "BudgetMaxTriangles" , "SBudget")
         
         CuraApplication.getInstance().globalContainerStackChanged.connect(self._updateEnabled)
         
@@ -117,12 +203,58 @@ class CustomSupportEraserPlus(Tool):
         self._had_selection_timer.setInterval(0)
         self._had_selection_timer.setSingleShot(True)
         self._had_selection_timer.timeout.connect(self._selectionChangeDelay)
+
+        # Burst placement : placements are collected and committed together when the timer expires
+        self._pending_placements = []
+        self._burst_timer = QTimer()
+        self._burst_timer.setSingleShot(True)
+        self._burst_timer.timeout.connect(self._commitPendingPlacements)
+
+        # Current paint stroke : positions of the blockers already there or placed along the stroke
+        self._paint_hash = None
+
+        self._cache_save_timer = QTimer()
+        self._cache_save_timer.setInterval(2000)
+        self._cache_save_timer.setSingleShot(True)
+        self._cache_save_timer.timeout.connect(self._savePlacementCache)
+
+        # Ray casters of the selected models prepared in the background, once the selection settles
+        self._prepare_timer = QTimer()
+        self._prepare_timer.setInterval(200)
+        self._prepare_timer.setSingleShot(True)
+        self._prepare_timer.timeout.connect(self._prepareRayCasters)
+
+        # The cost is measured again once the scene changes settle
+        self._budget_timer = QTimer()
+        self._budget_timer.setInterval(300)
+        self._budget_timer.setSingleShot(True)
+        self._budget_timer.timeout.connect(self._updateBudget)
+
+        # The models loaded together are looked up once the loading is over
+        self._reapply_timer = QTimer()
+        self._reapply_timer.setInterval(500)
+        self._reapply_timer.setSingleShot(True)
+        self._reapply_timer.timeout.connect(self._offerReapply)
         
         # set the preferences to store the default value
         self._preferences = CuraApplication.getInstance().getPreferences()
         self._preferences.addPreference("CustomSupportEraserPlus/sb_type", "cube")
         self._preferences.addPreference("CustomSupportEraserPlus/s_size", 5)
         self._preferences.addPreference("CustomSupportEraserPlus/on_build_plate", False)
+        self._preferences.addPreference("CustomSupportEraserPlus/burst_delay", 0)
+        self._preferences.addPreference("CustomSupportEraserPlus/auto_min_area", 1.0)
+        self._preferences.addPreference("CustomSupportEraserPlus/auto_max_height", 0.0)
+        self._preferences.addPreference("CustomSupportEraserPlus/instrumentation", False)
+        self._preferences.addPreference("CustomSupportEraserPlus/paint", False)
+        self._preferences.addPreference("CustomSupportEraserPlus/paint_spacing", 0.0)
+        self._preferences.addPreference("CustomSupportEraserPlus/chord_tolerance", BlockerGeometry.DEFAULT_CHORD_TOLERANCE)
+        self._preferences.addPreference("CustomSupportEraserPlus/compact_mesh", False)
+        self._preferences.addPreference("CustomSupportEraserPlus/placement_cache", True)
+        self._preferences.addPreference("CustomSupportEraserPlus/stop_at_surface", False)
+        self._preferences.addPreference("CustomSupportEraserPlus/template_name", "")
+        self._preferences.addPreference("CustomSupportEraserPlus/box_select", False)
+        self._preferences.addPreference("CustomSupportEraserPlus/budget_max_blockers", DEFAULT_MAX_BLOCKERS)
+        self._preferences.addPreference("CustomSupportEraserPlus/budget_max_triangles", DEFAULT_MAX_TRIANGLES)
         
         # convert as string to avoid further issue
         self._SBType = str(self._preferences.getValue("CustomSupportEraserPlus/sb_type"))
@@ -130,6 +262,28 @@ class CustomSupportEraserPlus(Tool):
         self._UseSize = float(self._preferences.getValue("CustomSupportEraserPlus/s_size"))
         # convert as boolean to avoid further issue
         self._UseOnBuildPlate = bool(self._preferences.getValue("CustomSupportEraserPlus/on_build_plate"))
+        # convert as int to avoid further issue
+        self._BurstDelay = int(self._preferences.getValue("CustomSupportEraserPlus/burst_delay"))
+        # convert as float to avoid further issue
+        self._AutoMinArea = float(self._preferences.getValue("CustomSupportEraserPlus/auto_min_area"))
+        self._AutoMaxHeight = float(self._preferences.getValue("CustomSupportEraserPlus/auto_max_height"))
+        # convert as boolean to avoid further issue
+        self._stats.enabled = bool(self._preferences.getValue("CustomSupportEraserPlus/instrumentation"))
+        self._UsePaint = bool(self._preferences.getValue("CustomSupportEraserPlus/paint"))
+        # convert as float to avoid further issue
+        self._PaintSpacing = float(self._preferences.getValue("CustomSupportEraserPlus/paint_spacing"))
+        self._ChordTolerance = float(self._preferences.getValue("CustomSupportEraserPlus/chord_tolerance"))
+        # convert as boolean to avoid further issue
+        self._UseCompactMesh = bool(self._preferences.getValue("CustomSupportEraserPlus/compact_mesh"))
+        self._UsePlacementCache = bool(self._preferences.getValue("CustomSupportEraserPlus/placement_cache"))
+        self._UseStopAtSurface = bool(self._preferences.getValue("CustomSupportEraserPlus/stop_at_surface"))
+        # convert as string to avoid further issue
+        self._TemplateName = str(self._preferences.getValue("CustomSupportEraserPlus/template_name"))
+        # convert as boolean to avoid further issue
+        self._UseBoxSelect = bool(self._preferences.getValue("CustomSupportEraserPlus/box_select"))
+        # convert as int to avoid further issue
+        self._budget.max_blockers = int(self._preferences.getValue("CustomSupportEraserPlus/budget_max_blockers"))
+        self._budget.max_triangles = int(self._preferences.getValue("CustomSupportEraserPlus/budget_max_triangles"))
                 
     def event(self, event):
         super().event(event)
@@ -143,7 +297,52 @@ class CustomSupportEraserPlus(Tool):
             shift_is_active = modifiers & Qt.ShiftModifier
             alt_is_active = modifiers & Qt.AltModifier
 
+        if event.type == Event.ToolActivateEvent:
+            self._prepare_timer.start()
+            # Files may have been added to the template library since the last time
+            if self._template_library is not None:
+                self.propertyChanged.emit()
+
+        if event.type == Event.ToolDeactivateEvent:
+            # Leaving the tool ends the current burst or paint stroke, drops an unfinished polyline
+            # and stops the geometry jobs
+            self._paint_hash = None
+            self._box_start = None
+            self._box_parent = None
+            self._cancelPolyline()
+            self._commitPendingPlacements()
+            self._cancelJobs()
+            self._prepare_timer.stop()
+            # Release the picking pass buffer and the ray casters
+            self._picking_pass = None
+            self._ray_casters.clear()
+            return
         
+        if self._paint_hash is not None:
+            if event.type == Event.MouseMoveEvent:
+                self._paintMove(event)
+                return
+            if event.type == Event.MouseReleaseEvent:
+                # End of the stroke : all its blockers are added in one operation
+                self._paint_hash = None
+                self._commitPendingPlacements()
+                return
+
+        if self._box_start is not None:
+            if event.type == Event.MouseMoveEvent:
+                return
+            if event.type == Event.MouseReleaseEvent:
+                self._finishBox(event)
+                return
+
+        if event.type == Event.KeyPressEvent and self._polyline_points:
+            if event.key in self._confirm_keys:
+                self._finishPolyline()
+                return
+            if event.key == self._cancel_key:
+                self._cancelPolyline()
+                return
+
         if event.type == Event.MousePressEvent and MouseEvent.LeftButton in event.buttons and self._controller.getToolsEnabled():
             if ctrl_is_active:
                 self._controller.setActiveTool("TranslateTool")
@@ -159,7 +358,8 @@ class CustomSupportEraserPlus(Tool):
                 # The selection renderpass is used to identify objects in the current view
                 self._selection_pass = CuraApplication.getInstance().getRenderer().getRenderPass("selection")
                 
-            picked_node = self._controller.getScene().findObject(self._selection_pass.getIdAtPosition(event.x, event.y))
+            with self._stats.measure("selection"):
+                picked_node = self._controller.getScene().findObject(self._selection_pass.getIdAtPosition(event.x, event.y))
             
             
             if not picked_node:
@@ -176,11 +376,27 @@ class CustomSupportEraserPlus(Tool):
                     # Only "normal" meshes can have anti_overhang_mesh added to them
                     return
 
-            # Create a pass for picking a world-space location from the mouse location
-            active_camera = self._controller.getScene().getActiveCamera()
-            picking_pass = PickingPass(active_camera.getViewportWidth(), active_camera.getViewportHeight())
-            picking_pass.render()
+            # Pass for picking a world-space location from the mouse location
+            with self._stats.measure("picking"):
+                picking_pass = self._getPickingPass()
             
+            if self._UseBoxSelect and self._SBType in ('cube', 'cylinder', 'template'):
+                # Start of a box selection, the blocker is added when the mouse is released
+                self._box_start = (event.x, event.y)
+                self._box_parent = picked_node
+                return
+
+            if self._UsePaint and self._SBType in ('cube', 'cylinder', 'template'):
+                # Start of a paint stroke, the next blockers are placed while the mouse moves
+                self._startPaintStroke()
+                self._paintAt(picked_node, picking_pass.getPickedPosition(event.x, event.y))
+                return
+
+            # Type Polyline collects points up to a double-click or Enter
+            if self._SBType == 'polyline':
+                self._addPolylinePoint(picked_node, picking_pass, event)
+                return
+
             # Type Custom need to select Two points
             if self._SBType == 'custom': 
                 self._Nb_Point += 1
@@ -205,97 +421,655 @@ class CustomSupportEraserPlus(Tool):
 
 
     def _createSupportEraserMesh(self, parent: CuraSceneNode, position: Vector , position2: Vector):
-        node = CuraSceneNode()
-    
-        if self._SBType == 'cube':
-            node.setName("EraserCube")
-        elif self._SBType == 'cylinder':
-            node.setName("EraserCylinder")           
+        with self._stats.measure("placement"):
+            floor = 0.0
+            if self._SBType in ('cube', 'cylinder', 'template'):
+                floor = self._surfaceFloors(parent, self._SBType, [position], self._UseSize)[0]
+            node = self._createSupportEraserNode(self._SBType, self._UseSize, position, position2, floor = floor, template = self._currentTemplate() if self._SBType == 'template' else None)
+            if node is None:
+                return
+
+            if self._BurstDelay > 0:
+                # Burst placement : wait for the next clicks before touching the scene
+                self._pending_placements.append((node, parent, position))
+                self._burst_timer.start(self._BurstDelay)
+            else:
+                self._commitPlacements([(node, parent, position)])
+
+    def _createSupportEraserNode(self, sb_type: str, size: float, position: Vector , position2: Vector, depth: float = 0.0, on_build_plate: bool = None, floor: float = 0.0, template: str = None) -> CuraSceneNode:
+        # depth : additional length below the picked point, used to cover a sloped overhang region
+        # on_build_plate : None for the current "Reach Build Plate" option
+        # floor : height of the surface the blocker stops at, 0 for the build plate
+        # template : file of the template library for the type template
+        # Returns None when the template can not be read
+        created = self._supportEraserMesh(sb_type, size, position, position2, depth, on_build_plate, floor, template)
+        if created is None:
+            return None
+        return self._newBlockerNode(*created)
+
+    def _supportEraserMesh(self, sb_type: str, size: float, position: Vector , position2: Vector, depth: float = 0.0, on_build_plate: bool = None, floor: float = 0.0, template: str = None):
+        # (name, mesh, placement record) of a blocker at this position, None when the template can not be read
+        if on_build_plate is None:
+            on_build_plate = self._UseOnBuildPlate
+        if sb_type == 'cube':
+            name = "EraserCube"
+        elif sb_type == 'cylinder':
+            name = "EraserCylinder"
+        elif sb_type == 'template':
+            name = "EraserTemplate"
         else:
-            node.setName("EraserCustom")
-            
-        node.setSelectable(True)
-        
-        # long=Support Height
-        if self._UseOnBuildPlate :
-            self._long=position.y
-        else :
-            # Change de Height for the Cylinder to the radius
-            if self._SBType == 'cylinder':
-                self._long=self._UseSize*0.5
-            else :
-                self._long=self._UseSize
-        
-        if self._long >= position.y :
-            self._long=position.y
-            
-        # Logger.log("d", "Long Support= %s", str(self._long))
+            name = "EraserCustom"
         
-        # For Cube/Cylinder
-        # Test with 0.05 because the precision on the clic poisition is not very thight 
-        if self._SBType == 'cube' :
-            self._Sup = self._UseSize*0.05
-        else :
-            self._Sup = self._UseSize*0.01
-                
-        # Logger.log("d", "Additional Long Support = %s", str(self._long+self._Sup))    
+        # long=Support Height , Sup=top Additional Height
+        self._long = BlockerGeometry.blockerHeight(sb_type, size, position.y - floor, on_build_plate, depth)
+        self._Sup = BlockerGeometry.topExtra(sb_type, size)
             
-        if self._SBType == 'cube':
-            # Cube creation Size , length , top Additional Height
-            mesh =  self._createCube(self._UseSize,self._long,self._Sup)
-        elif self._SBType == 'cylinder':
-            # Cylinder creation Diameter , Increment angle 10°, length , top Additional Height
-            mesh = self._createCylinder(self._UseSize,10,self._long,self._Sup)            
-        else:           
-            # Custom creation Size , P1 as vector P2 as vector           
-            mesh =  self._createCustom(self._UseSize,position,position2,self._Sup)
-
-        node.setMeshData(mesh.build())
+        with self._stats.measure("mesh"):
+            if sb_type == 'template':
+                # Template creation Size , file , length , top Additional Height
+                mesh = self._createTemplate(size, template, position.y - floor, on_build_plate, depth, self._Sup)
+                if mesh is None:
+                    return None
+            elif sb_type == 'cube':
+                # Cube creation Size , length , top Additional Height
+                mesh =  self._createCube(size,self._long,self._Sup)
+            elif sb_type == 'cylinder':
+                # Cylinder creation Diameter , number of segments for the chord tolerance, length , top Additional Height
+                mesh = self._createCylinder(size,BlockerGeometry.segmentsForTolerance(size / 2, self._ChordTolerance),self._long,self._Sup)
+            else:           
+                # Custom creation Size , P1 as vector P2 as vector           
+                mesh =  self._createCustom(size,position,position2,self._Sup)
+
+        points = [(0.0, 0.0, 0.0)]
+        if sb_type == 'custom':
+            points.append((position2.x - position.x, position2.y - position.y, position2.z - position.z))
+        return name, mesh, PlacementRecord(sb_type, size, on_build_plate, depth, numpy.array(points), template if sb_type == 'template' else None)
+
+    def _newBlockerNode(self, name: str, mesh: MeshData, record: PlacementRecord) -> CuraSceneNode:
+        node = self._createBlockerNode(name, mesh)
+        if record.sb_type in ('cube', 'cylinder', 'template'):
+            node.transformationChanged.connect(self._onSharedBlockerTransformed)
+        self._setPlacementRecord(node, record)
+        return node
+
+    def _blockerMesh(self, sb_type: str, size: float, points, depth: float, on_build_plate: bool, floor: float, template: str = None):
+        # (name, mesh, placement record) of any blocker type from its recorded points in world coordinates
+        if sb_type == 'polyline':
+            return self._polylineMesh(size, points)
+        if sb_type == 'box':
+            box = BlockerGeometry.boxFromCorners([(p.x, p.y, p.z) for p in points], size)
+            return self._boxMesh(size, box, on_build_plate, floor)
+        return self._supportEraserMesh(sb_type, size, points[0], points[-1], depth, on_build_plate, floor, template)
+
+    def _addPolylinePoint(self, picked_node: CuraSceneNode, picking_pass, event):
+        now = time.monotonic()
+        if self._polyline_points and self._last_press is not None:
+            last_time, last_x, last_y = self._last_press
+            interval = QApplication.styleHints().mouseDoubleClickInterval() / 1000
+            # Second click of a double-click : its point was already added by the first one
+            if now - last_time <= interval and abs(event.x - last_x) < 0.02 and abs(event.y - last_y) < 0.02:
+                self._finishPolyline()
+                return
+
+        self._last_press = (now, event.x, event.y)
+        if not self._polyline_points:
+            self._polyline_parent = picked_node
+        self._polyline_points.append(picking_pass.getPickedPosition(event.x, event.y))
+
+    def _finishPolyline(self):
+        points = self._polyline_points
+        parent = self._polyline_parent
+        self._cancelPolyline()
+        if len(points) < 2:
+            return
+
+        with self._stats.measure("placement"):
+            node = self._createPolylineNode(self._UseSize, points)
+            self._commitPlacements([(node, parent, points[0])])
+
+    def _cancelPolyline(self):
+        self._polyline_points = []
+        self._polyline_parent = None
+        self._last_press = None
+
+    def _createPolylineNode(self, size: float, points) -> CuraSceneNode:
+        # One swept mesh through all the points, relative to the first one, reaching the build plate
+        return self._newBlockerNode(*self._polylineMesh(size, points))
+
+    def _polylineMesh(self, size: float, points):
+        self._Sup = BlockerGeometry.topExtra('polyline', size)
+        with self._stats.measure("mesh"):
+            verts, indices = BlockerGeometry.createPolyline(size, [(p.x, p.y, p.z) for p in points], self._Sup)
+            verts, indices, normals = BlockerGeometry.meshArrays(verts, indices, self._UseCompactMesh)
+            mesh = MeshData(vertices=verts, normals=normals, indices=indices)
+
+        origin = points[0]
+        local_points = numpy.array([(p.x - origin.x, p.y - origin.y, p.z - origin.z) for p in points])
+        return "EraserPolyline", mesh, PlacementRecord('polyline', size, True, 0.0, local_points)
+
+    def _createBlockerNode(self, name: str, mesh: MeshData) -> CuraSceneNode:
+        # Scene node defined as "anti_overhang_mesh" on the active build plate
+        from UM.Settings.SettingInstance import SettingInstance
+        from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
+        from cura.Scene.BuildPlateDecorator import BuildPlateDecorator
+
+        node = CuraSceneNode()
+        node.setName(name)
+        node.setSelectable(True)
+        node.setMeshData(mesh)
 
         # test for init position
         node_transform = Matrix()
         node_transform.setToIdentity()
         node.setTransformation(node_transform)
         
-        active_build_plate = CuraApplication.getInstance().getMultiBuildPlateModel().activeBuildPlate
-        node.addDecorator(BuildPlateDecorator(active_build_plate))
-        node.addDecorator(SliceableObjectDecorator())
-              
-        stack = node.callDecoration("getStack") # created by SettingOverrideDecorator that is automatically added to CuraSceneNode
-
-        settings = stack.getTop()
-
-        # Define the new mesh as "anti_overhang_mesh" 
-        definition = stack.getSettingDefinition("anti_overhang_mesh")
-        new_instance = SettingInstance(definition, settings)
-        new_instance.setProperty("value", True)
-        new_instance.resetState()  # Ensure that the state is not seen as a user state.
-        settings.addInstance(new_instance)
-            
+        with self._stats.measure("settings"):
+            active_build_plate = CuraApplication.getInstance().getMultiBuildPlateModel().activeBuildPlate
+            node.addDecorator(BuildPlateDecorator(active_build_plate))
+            node.addDecorator(SliceableObjectDecorator())
+                  
+            stack = node.callDecoration("getStack") # created by SettingOverrideDecorator that is automatically added to CuraSceneNode
+
+            settings = stack.getTop()
+
+            # Define the new mesh as "anti_overhang_mesh" 
+            definition = stack.getSettingDefinition("anti_overhang_mesh")
+            new_instance = SettingInstance(definition, settings)
+            new_instance.setProperty("value", True)
+            new_instance.resetState()  # Ensure that the state is not seen as a user state.
+            settings.addInstance(new_instance)
+
+        return node
+
+    def _finishBox(self, event):
+        start = self._box_start
+        parent = self._box_parent
+        self._box_start = None
+        self._box_parent = None
+        if parent.getParent() is None:
+            return
+
+        picking_pass = self._getPickingPass()
+        if abs(event.x - start[0]) < 0.01 and abs(event.y - start[1]) < 0.01:
+            # A simple click places a blocker of the current type
+            position = picking_pass.getPickedPosition(start[0], start[1])
+            self._createSupportEraserMesh(parent, position, position)
+            return
+
+        with self._stats.measure("placement"):
+            with self._stats.measure("picking"):
+                points = self._sampleBoxPositions(picking_pass, start, (event.x, event.y))
+            if len(points) < 3:
+                return
+            box = BlockerGeometry.fitOrientedBox(points, self._UseSize)
+            top = Vector(float(box[0][0]), box[5], float(box[0][1]))
+            floor = self._boxFloor(parent, box)
+            node = self._createBoxNode(self._UseSize, box, floor = floor)
+            self._commitPlacements([(node, parent, top)])
+
+    def _sampleBoxPositions(self, picking_pass, start, end) -> numpy.ndarray:
+        # World positions under a grid of samples of the rectangle, the depth of all the samples is read at once
+        image = picking_pass.getOutput().convertToFormat(self._image_format)
+        window_width, window_height = CuraApplication.getInstance().getRenderer().getWindowSize()
+        xs, ys, px, py = BlockerGeometry.boxSamples(start, end, window_width, window_height)
+
+        bits = image.constBits()
+        bits.setsize(image.bytesPerLine() * image.height())
+        pixels = numpy.frombuffer(bits, dtype=numpy.uint32).reshape(image.height(), image.bytesPerLine() // 4)
+        inside = (px >= 0) & (px < image.width()) & (py >= 0) & (py < image.height())
+        depths = numpy.zeros(len(xs))
+        depths[inside] = BlockerGeometry.pickedDepth(pixels[py[inside], px[inside]])
+        # No model behind the sample : nothing written, or the clear value
+        valid = (depths > 0) & (depths < 0x00FFFFFF / 1000.0)
+
+        camera = self._controller.getScene().getActiveCamera()
+        points = []
+        for x, y, depth in zip(xs[valid], ys[valid], depths[valid]):
+            point = camera.getRay(float(x), float(y)).getPointAlongRay(float(depth))
+            points.append((point.x, point.y, point.z))
+        return numpy.array(points, dtype=numpy.float64).reshape(-1, 3)
+
+    def _createBoxNode(self, size: float, box, on_build_plate: bool = None, floor: float = 0.0) -> CuraSceneNode:
+        # box : (center, length, width, angle, y_min, y_max) from fitOrientedBox, the node origin is the top center
+        # The box goes size below the lowest sampled point, or down to the floor
+        return self._newBlockerNode(*self._boxMesh(size, box, on_build_plate, floor))
+
+    def _boxMesh(self, size: float, box, on_build_plate: bool = None, floor: float = 0.0):
+        if on_build_plate is None:
+            on_build_plate = self._UseOnBuildPlate
+        center, length, width, angle, y_min, y_max = box
+        depth = y_max - y_min
+        self._long = BlockerGeometry.blockerHeight('box', size, y_max - floor, on_build_plate, depth)
+        self._Sup = BlockerGeometry.topExtra('box', size)
+        with self._stats.measure("mesh"):
+            verts, indices = BlockerGeometry.createOrientedBox(length, width, angle, self._long, self._Sup)
+            verts, indices, normals = BlockerGeometry.meshArrays(verts, indices, self._UseCompactMesh)
+            mesh = MeshData(vertices=verts, normals=normals, indices=indices)
+
+        # Recorded as the top center then the corners at the top and at the lowest sampled point, see boxFromCorners
+        corners = BlockerGeometry.boxCorners(length, width, angle)
+        points = [(0.0, 0.0, 0.0)]
+        points.extend((x, 0.0, z) for x, z in corners)
+        points.extend((x, -depth, z) for x, z in corners)
+        return "EraserBox", mesh, PlacementRecord('box', size, on_build_plate, depth, numpy.array(points))
+
+    def _paintSpacing(self) -> float:
+        return self._PaintSpacing if self._PaintSpacing > 0 else self._UseSize
+
+    def _startPaintStroke(self):
+        # Index the blockers already in the scene or waiting, so the stroke does not stack new ones on them
+        self._burst_timer.stop()
+        self._paint_hash = SpatialHash(self._paintSpacing())
+        for node in self._registry.nodes():
+            position = node.getWorldPosition()
+            self._paint_hash.insert((position.x, position.y, position.z))
+        for node, parent, position in self._pending_placements:
+            self._paint_hash.insert((position.x, position.y, position.z))
+
+    def _paintMove(self, event):
+        picked_node = self._controller.getScene().findObject(self._selection_pass.getIdAtPosition(event.x, event.y))
+        if not picked_node or not self._isModelNode(picked_node):
+            return
+        # The scene does not change during the stroke, the picking pass is rendered at most once
+        picking_pass = self._getPickingPass()
+        self._paintAt(picked_node, picking_pass.getPickedPosition(event.x, event.y))
+
+    def _paintAt(self, parent: CuraSceneNode, position: Vector):
+        point = (position.x, position.y, position.z)
+        if self._paint_hash.hasNeighbour(point, self._paintSpacing()):
+            return
+        self._paint_hash.insert(point)
+        floor = self._surfaceFloors(parent, self._SBType, [position], self._UseSize)[0]
+        node = self._createSupportEraserNode(self._SBType, self._UseSize, position, position, floor = floor, template = self._currentTemplate() if self._SBType == 'template' else None)
+        if node is not None:
+            self._pending_placements.append((node, parent, position))
+
+    def _commitPendingPlacements(self):
+        self._burst_timer.stop()
+        # Skip the placements whose model was removed in the meantime
+        placements = [placement for placement in self._pending_placements if placement[1].getParent() is not None]
+        self._pending_placements = []
+        self._commitPlacements(placements)
+
+    def _commitPlacements(self, placements):
+        # Add all the (node, parent, position) placements with one undo entry and one scene notification
+        if not placements:
+            return
+
+        from UM.Operations.GroupedOperation import GroupedOperation
+        from UM.Operations.AddSceneNodeOperation import AddSceneNodeOperation
+        from cura.Operations.SetParentOperation import SetParentOperation
+
         op = GroupedOperation()
-        # First add node to the scene at the correct position/scale, before parenting, so the support mesh does not get scaled with the parent
-        op.addOperation(AddSceneNodeOperation(node, self._controller.getScene().getRoot()))
-        op.addOperation(SetParentOperation(node, parent))
-        op.push()
-        node.setPosition(position, CuraSceneNode.TransformSpace.World)
-        self._all_picked_node.append(node)
+        root = self._controller.getScene().getRoot()
+        for node, parent, position in placements:
+            # First add node to the scene at the correct position/scale, before parenting, so the support mesh does not get scaled with the parent
+            op.addOperation(AddSceneNodeOperation(node, root))
+            op.addOperation(SetParentOperation(node, parent))
+        with self._stats.measure("operation"):
+            op.push()
+
+            for node, parent, position in placements:
+                node.setPosition(position, CuraSceneNode.TransformSpace.World)
+                self._registry.add(node, session = True)
+
+        self._recordPlacements([parent for node, parent, position in placements])
+
         self._SMsg = i18n_catalog.i18nc("@label", "Remove Last") 
         self.propertyChanged.emit()
         
-        CuraApplication.getInstance().getController().getScene().sceneChanged.emit(node)
+        with self._stats.measure("notify"):
+            CuraApplication.getInstance().getController().getScene().sceneChanged.emit(placements[-1][0])
+
+    def _getPickingPass(self):
+        # Render the picking pass only if the camera, the viewport size or the scene changed since the last render
+        from cura.PickingPass import PickingPass
+
+        active_camera = self._controller.getScene().getActiveCamera()
+        width = active_camera.getViewportWidth()
+        height = active_camera.getViewportHeight()
+        state = (
+            id(active_camera),
+            width,
+            height,
+            active_camera.getWorldTransformation().getData().tobytes(),
+            active_camera.getProjectionMatrix().getData().tobytes()
+        )
+
+        if self._picking_pass is None or state[1:3] != self._picking_pass_state[1:3]:
+            self._picking_pass = PickingPass(width, height)
+            self._picking_pass_dirty = True
+
+        if self._picking_pass_dirty or state != self._picking_pass_state:
+            self._picking_pass.render()
+            self._picking_pass_state = state
+            self._picking_pass_dirty = False
+
+        return self._picking_pass
+
+    def _onSceneChanged(self, source):
+        # Any change in the scene can change the depth seen by the picking pass, and the blockers in it
+        self._picking_pass_dirty = True
+        self._budget_timer.start()
+
+        # Keep the registry in sync with the blockers added, moved, loaded or restored by an undo
+        if source in self._registry:
+            self._registry.update(source)
+        elif self._isBlockerNode(source):
+            self._registry.add(source)
+        elif self._UsePlacementCache and id(source) not in self._placement_checked and source.getMeshData() is not None and source.callDecoration("isSliceable"):
+            # A model seen for the first time, it is looked up in the placement cache once the loading is over
+            node_id = id(source)
+            self._placement_checked[node_id] = weakref.ref(source, lambda ref, node_id = node_id: self._placement_checked.pop(node_id, None))
+            self._reapply_candidates.append(weakref.ref(source))
+            self._reapply_timer.start()
+
+        # Blockers moved by the Translate tool, deleted or restored by an undo : recorded again before the next save
+        if self._UsePlacementCache and self._recorded_models and \
+           (source in self._registry or id(source) in self._recorded_models or source is self._controller.getScene().getRoot()):
+            self._placements_changed = True
+            self._cache_save_timer.start()
+
+    def _surfaceFloors(self, parent: CuraSceneNode, sb_types, positions, sizes):
+        # Height of the surface each blocker stops at : the first surface of the model below it, or the build plate
+        if not self._UseStopAtSurface or not positions or parent.getMeshData() is None:
+            return [0.0] * len(positions)
+        with self._stats.measure("raycast"):
+            caster = self._getRayCaster(parent)
+            floors = BlockerGeometry.surfaceBelow(caster, sb_types, [(p.x, p.y, p.z) for p in positions], sizes)
+        return floors.tolist()
+
+    def _boxFloor(self, parent: CuraSceneNode, box) -> float:
+        # Same as _surfaceFloors for a box : the rays cover its corners, edges and inside, below its lowest point
+        if not self._UseStopAtSurface or parent.getMeshData() is None:
+            return 0.0
+        with self._stats.measure("raycast"):
+            return BlockerGeometry.boxSurfaceBelow(self._getRayCaster(parent), box)
+
+    def _recordedFloors(self, parent: CuraSceneNode, sb_types, all_points, sizes):
+        # Floors of blockers rebuilt from their recorded points in world coordinates
+        floors = self._surfaceFloors(parent, sb_types, [points[0] for points in all_points], sizes)
+        for i, (sb_type, points, size) in enumerate(zip(sb_types, all_points, sizes)):
+            if sb_type == 'box':
+                floors[i] = self._boxFloor(parent, BlockerGeometry.boxFromCorners([(p.x, p.y, p.z) for p in points], size))
+        return floors
+
+    def _getRayCaster(self, parent: CuraSceneNode):
+        key, mesh, transformation = self._rayCasterKey(parent)
+        caster = self._cachedRayCaster(key, mesh)
+        if caster is None:
+            world_mesh = mesh.getTransformed(transformation)
+            caster = BlockerGeometry.VerticalRayCaster(world_mesh.getVertices(), world_mesh.getIndices())
+        self._storeRayCaster(key, mesh, caster)
+        return caster
+
+    def _rayCasterKey(self, parent: CuraSceneNode):
+        # Built once per mesh and position of the model, the key changes when the model is moved or its mesh replaced
+        mesh = parent.getMeshData()
+        transformation = parent.getWorldTransformation()
+        return (id(mesh), transformation.getData().tobytes()), mesh, transformation
+
+    def _cachedRayCaster(self, key, mesh: MeshData):
+        entry = self._ray_casters.get(key)
+        if entry is None or entry[0] is not mesh:
+            return None
+        return entry[1]
+
+    def _storeRayCaster(self, key, mesh: MeshData, caster):
+        self._ray_casters.pop(key, None)
+        if len(self._ray_casters) >= 4:
+            self._ray_casters.popitem(last=False)
+        self._ray_casters[key] = (mesh, caster)
+
+    def _prepareRayCasters(self):
+        # Build the ray casters of the selected models in the background, the next clicks find them ready
+        if not self._UseStopAtSurface or self._controller.getActiveTool() is not self:
+            return
+        tasks = []
+        for selected_node in Selection.getAllSelectedObjects():
+            for parent in DepthFirstIterator(selected_node):
+                if self._isModelNode(parent):
+                    key, mesh, transformation = self._rayCasterKey(parent)
+                    if self._cachedRayCaster(key, mesh) is None:
+                        tasks.append((key, mesh, transformation))
+        if not tasks:
+            return
+
+        def compute(job):
+            casters = []
+            for index, (key, mesh, transformation) in enumerate(tasks):
+                job.report(index, len(tasks))
+                world_mesh = mesh.getTransformed(transformation)
+                casters.append((key, mesh, BlockerGeometry.VerticalRayCaster(world_mesh.getVertices(), world_mesh.getIndices())))
+            return casters
+
+        self._startJob("prepare", None, compute, lambda casters: [self._storeRayCaster(*caster) for caster in casters])
+
+    def _startJob(self, stage: str, text, compute, on_done):
+        # text : progress message, None for a silent job
+        job = GeometryJob(stage, compute, on_done, self._onJobProgress, self._onJobFinished)
+        self._jobs.append(job)
+        if text is not None:
+            if self._job_message is None:
+                self._job_message = Message(text = text, title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus"),
+                                            progress = 0, lifetime = 0, dismissable = False)
+                self._job_message.addAction("cancel", i18n_catalog.i18nc("@action:button", "Cancel"), "", i18n_catalog.i18nc("@info:tooltip", "Stop the computation"))
+                self._job_message.actionTriggered.connect(self._onJobMessageAction)
+                self._job_message.show()
+            else:
+                self._job_message.setText(text)
+        job.start()
+
+    def _onJobProgress(self, job, progress: int):
+        if job in self._jobs and self._job_message is not None:
+            self._job_message.setProgress(progress)
+
+    def _onJobFinished(self, job):
+        # Main thread : the scene operations built from the result run here
+        if job not in self._jobs:
+            # Cancelled
+            return
+        self._jobs.remove(job)
+        if self._job_message is not None and not self._jobs:
+            self._job_message.hide()
+            self._job_message = None
+        if job.isCancelled():
+            return
+        self._stats.record(job.stage, job.elapsed)
+        if job.hasError():
+            Message(text = i18n_catalog.i18nc("@info:status", "The support blocker computation failed : %s") % str(job.getError()),
+                    title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus")).show()
+            return
+        job.on_done(job.getResult())
+
+    def _onJobMessageAction(self, message, action):
+        if action == "cancel":
+            self._cancelJobs()
+
+    def _cancelJobs(self):
+        for job in self._jobs:
+            job.cancel()
+        self._jobs = []
+        if self._job_message is not None:
+            self._job_message.hide()
+            self._job_message = None
 
     def _removeSupportBlockerMesh(self, node: CuraSceneNode):
-        parent = node.getParent()
-        if parent == self._controller.getScene().getRoot():
-            parent = None
+        self._removeSupportBlockerMeshes([node])
+
+    def _removeSupportBlockerMeshes(self, nodes):
+        # Remove all the nodes with one undo entry, one selection change and one scene notification
+        from UM.Operations.GroupedOperation import GroupedOperation
+        from UM.Operations.RemoveSceneNodeOperation import RemoveSceneNodeOperation
+
+        root = self._controller.getScene().getRoot()
+        op = GroupedOperation()
+        last_node = None
+        parent = None
+        parents = []
+        for node in nodes:
+            node_parent = node.getParent()
+            if node_parent is None:
+                # Already removed (deleted by a click or undone)
+                continue
+            op.addOperation(RemoveSceneNodeOperation(node))
+            last_node = node
+            parents.append(node_parent)
+            if parent is None and node_parent != root:
+                parent = node_parent
+
+        if last_node is None:
+            return
 
-        op = RemoveSceneNodeOperation(node)
         op.push()
+        self._recordPlacements(parents)
 
         if parent and not Selection.isSelected(parent):
             Selection.add(parent)
 
-        CuraApplication.getInstance().getController().getScene().sceneChanged.emit(node)
+        CuraApplication.getInstance().getController().getScene().sceneChanged.emit(last_node)
+
+    def _updateBudget(self):
+        # Measure the blockers of the scene, warn once when the limits are crossed
+        cost = self._budget.measure(self._registry.nodes())
+        if cost == self._budget_cost:
+            return
+        self._budget_cost = cost
+        self.propertyChanged.emit()
+
+        if not self._budget.exceeded(cost):
+            if self._budget_message is not None:
+                self._budget_message.hide()
+                self._budget_message = None
+            return
+        if self._budget_message is not None:
+            return
+
+        Logger.log("w", "Support blocker budget exceeded : %s", self._budget.summary(cost))
+        message = Message(text = i18n_catalog.i18nc("@info:status", "The support blockers may slow down the slicing : %d blockers, %d triangles, about %.1f s more") % (cost.blockers, cost.triangles, cost.seconds),
+                          title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus"),
+                          lifetime = 0)
+        message.addAction("consolidate", i18n_catalog.i18nc("@action:button", "Consolidate"), "", i18n_catalog.i18nc("@info:tooltip", "Merge the blockers of every model into one mesh"))
+        message.addAction("simplify", i18n_catalog.i18nc("@action:button", "Simplify"), "", i18n_catalog.i18nc("@info:tooltip", "Rebuild the cylinders with fewer segments"))
+        message.addAction("remove_excess", i18n_catalog.i18nc("@action:button", "Remove excess"), "", i18n_catalog.i18nc("@info:tooltip", "Remove the last added blockers beyond the limits"))
+        message.actionTriggered.connect(self._onBudgetAction)
+        message.show()
+        self._budget_message = message
+
+    def _onBudgetAction(self, message, action):
+        message.hide()
+        if action == "consolidate":
+            self.consolidateSupportBlockerMesh()
+        elif action == "simplify":
+            self.simplifySupportBlockerMesh()
+        elif action == "remove_excess":
+            self._commitPendingPlacements()
+            self._removeSupportBlockerMeshes(self._budget.excess(self._registry.newestFirst(self._registry.nodes())))
+        # A new warning comes if the blockers are still over the limits once the action changed them
+        self._budget_message = None
+
+    def _setPlacementRecord(self, node: CuraSceneNode, record: PlacementRecord):
+        node_id = id(node)
+        self._placement_records[node_id] = (weakref.ref(node, lambda ref, node_id = node_id: self._placement_records.pop(node_id, None)), record)
+
+    def _placementRecord(self, node: CuraSceneNode):
+        entry = self._placement_records.get(id(node))
+        if entry is None or entry[0]() is not node:
+            return None
+        return entry[1]
+
+    def _recordPlacements(self, parents):
+        # Store the blockers of these models in the cache, in model coordinates
+        if not self._UsePlacementCache:
+            return
+        done = set()
+        for parent in parents:
+            if id(parent) in done or not self._isModelNode(parent):
+                continue
+            done.add(id(parent))
+            if parent.getParent() is None:
+                # Model removed from the scene, its placements stay in the cache
+                continue
+            node_id = id(parent)
+            self._recorded_models[node_id] = weakref.ref(parent, lambda ref, node_id = node_id: self._recorded_models.pop(node_id, None))
+            to_model = numpy.linalg.inv(parent.getWorldTransformation().getData())
+            records = []
+            for node in self._registry.nodes(parent = parent):
+                record = self._placementRecord(node)
+                if record is None:
+                    # Merged or loaded blockers have no recorded placement : the cached entry stays as it is
+                    records = None
+                    break
+                matrix = to_model @ node.getWorldTransformation().getData()
+                records.append(record._replace(points = BlockerGeometry.transformPoints(matrix, record.points)))
+            if records is not None:
+                self._placement_cache.put(self._mesh_hashes.get(parent.getMeshData()), records)
+        if self._placement_cache.dirty:
+            self._cache_save_timer.start()
+
+    def _savePlacementCache(self):
+        if self._placements_changed:
+            self._placements_changed = False
+            models = [ref() for ref in list(self._recorded_models.values())]
+            self._recordPlacements([model for model in models if model is not None])
+            self._cache_save_timer.stop()
+        try:
+            self._placement_cache.save()
+        except OSError as e:
+            Logger.log("w", "Placement cache not saved : %s", str(e))
+
+    def _offerReapply(self):
+        # Offer to add the recorded blockers of the models just loaded, if they have none yet
+        candidates = self._reapply_candidates
+        self._reapply_candidates = []
+        if not self._UsePlacementCache or not len(self._placement_cache):
+            return
+
+        models = []
+        for ref in candidates:
+            node = ref()
+            if node is None or node.getParent() is None or not self._isModelNode(node):
+                continue
+            if self._registry.count(parent = node):
+                continue
+            if self._mesh_hashes.get(node.getMeshData()) in self._placement_cache:
+                models.append(node)
+        if not models:
+            return
+
+        self._reapply_nodes = [weakref.ref(node) for node in models]
+        message = Message(text = i18n_catalog.i18nc("@info:status", "%d model(s) already had support blockers in a previous project") % len(models),
+                          title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus"),
+                          lifetime = 0)
+        message.addAction("reapply", i18n_catalog.i18nc("@action:button", "Reapply"), "", i18n_catalog.i18nc("@info:tooltip", "Add the recorded support blockers to these models"))
+        message.actionTriggered.connect(self._onReapplyAction)
+        message.show()
+
+    def _onReapplyAction(self, message, action):
+        message.hide()
+        if action != "reapply":
+            return
+        models = [node for node in (ref() for ref in self._reapply_nodes) if node is not None]
+        self._reapply_nodes = []
+        self.reapplyPlacements(models)
+
+    def reapplyPlacements(self, models):
+        # Add the recorded blockers of these models in a single grouped operation
+        self._commitPendingPlacements()
+        placements = []
+        for parent in models:
+            if parent.getParent() is None:
+                continue
+            to_world = parent.getWorldTransformation().getData()
+            records = self._placement_cache.get(self._mesh_hashes.get(parent.getMeshData()))
+            all_points = [[Vector(float(x), float(y), float(z)) for x, y, z in BlockerGeometry.transformPoints(to_world, record.points)] for record in records]
+            floors = self._recordedFloors(parent, [record.sb_type for record in records], all_points, [record.size for record in records])
+            for record, points, floor in zip(records, all_points, floors):
+                created = self._blockerMesh(record.sb_type, record.size, points, record.depth, record.on_build_plate, floor, record.template)
+                if created is not None:
+                    placements.append((self._newBlockerNode(*created), parent, points[0]))
+        self._commitPlacements(placements)
+        Logger.log("d", "Recorded support blockers reapplied : %d", len(placements))
 
     def _updateEnabled(self):
         plugin_enabled = False
@@ -307,6 +1081,10 @@ class CustomSupportEraserPlus(Tool):
         CuraApplication.getInstance().getController().toolEnabledChanged.emit(self._plugin_id, plugin_enabled)
     
     def _onSelectionChanged(self):
+        # The running jobs were computed for the previous selection
+        self._cancelJobs()
+        self._prepare_timer.start()
+
         # When selection is passed from one object to another object, first the selection is cleared
         # and then it is set to the new object. We are only interested in the change from no selection
         # to a selection or vice-versa, not in a change from one object to another. A timer is used to
@@ -325,164 +1103,491 @@ class CustomSupportEraserPlus(Tool):
         
     # Cube Support Blocker Creation
     def _createCube(self, size, height, sup ):
-        mesh = MeshBuilder()
-
-        # Intial Comment from Ultimaker B.V. I have never try to verify this point
-        # Can't use MeshBuilder.addCube() because that does not get per-vertex normals
-        # Per-vertex normals require duplication of vertices
-        s = size / 2
-        l = height 
-        s_inf=s
-        
-        nbv=24        
-        verts = [ # 6 faces with 4 corners each
-            [-s_inf, -l,  s_inf], [-s,  sup,  s], [ s,  sup,  s], [ s_inf, -l,  s_inf],
-            [-s,  sup, -s], [-s_inf, -l, -s_inf], [ s_inf, -l, -s_inf], [ s,  sup, -s],
-            [ s_inf, -l, -s_inf], [-s_inf, -l, -s_inf], [-s_inf, -l,  s_inf], [ s_inf, -l,  s_inf],
-            [-s,  sup, -s], [ s,  sup, -s], [ s,  sup,  s], [-s,  sup,  s],
-            [-s_inf, -l,  s_inf], [-s_inf, -l, -s_inf], [-s,  sup, -s], [-s,  sup,  s],
-            [ s_inf, -l, -s_inf], [ s_inf, -l,  s_inf], [ s,  sup,  s], [ s,  sup, -s]
-        ]
-        mesh.setVertices(numpy.asarray(verts, dtype=numpy.float32))
-
-        indices = []
-        for i in range(0, nbv, 4): # All 6 quads (12 triangles)
-            indices.append([i, i+2, i+1])
-            indices.append([i, i+3, i+2])
-        mesh.setIndices(numpy.asarray(indices, dtype=numpy.int32))
-
-        mesh.calculateNormals()
-        return mesh      
+        return self._getSharedMeshData(BlockerGeometry.templateKey('cube', size, height, sup, compact=self._UseCompactMesh))
         
     # Cylinder Support Blocker Creation
     def _createCylinder(self, size, nb , height , sup ):
-        mesh = MeshBuilder()
-        # Per-vertex normals require duplication of vertices
-        r = size / 2
-
-        l = -height
-        rng = int(360 / nb)
-        ang = math.radians(nb)
-        r_inf=r
-        
-        verts = []
-
-        nbv=12
-        for i in range(0, rng):
-            # Top
-            verts.append([0, sup, 0])
-            verts.append([r*math.cos((i+1)*ang), sup, r*math.sin((i+1)*ang)])
-            verts.append([r*math.cos(i*ang), sup, r*math.sin(i*ang)])
-            #Side 1a
-            verts.append([r*math.cos(i*ang), sup, r*math.sin(i*ang)])
-            verts.append([r*math.cos((i+1)*ang), sup, r*math.sin((i+1)*ang)])
-            verts.append([r_inf*math.cos((i+1)*ang), l, r_inf*math.sin((i+1)*ang)])
-            #Side 1b
-            verts.append([r_inf*math.cos((i+1)*ang), l, r_inf*math.sin((i+1)*ang)])
-            verts.append([r_inf*math.cos(i*ang), l, r_inf*math.sin(i*ang)])
-            verts.append([r*math.cos(i*ang), sup, r*math.sin(i*ang)])
-            #Bottom 
-            verts.append([0, l, 0])
-            verts.append([r_inf*math.cos(i*ang), l, r_inf*math.sin(i*ang)])
-            verts.append([r_inf*math.cos((i+1)*ang), l, r_inf*math.sin((i+1)*ang)])
-        
-        mesh.setVertices(numpy.asarray(verts, dtype=numpy.float32))
+        # nb = Number of segments
+        return self._getSharedMeshData(BlockerGeometry.templateKey('cylinder', size, height, sup, nb, self._UseCompactMesh))
+
+    # Template Support Blocker Creation
+    def _createTemplate(self, size, template, y, on_build_plate, depth, sup):
+        library = self._getTemplateLibrary()
+        entry = library.get(template) if template else None
+        if entry is None:
+            if template in library.errors:
+                Logger.log("w", "Template %s can not be read : %s", template, library.errors[template])
+            Message(text = i18n_catalog.i18nc("@info:status", "The template '%s' can not be read from %s") % (template, library.folder),
+                    title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus")).show()
+            return None
+        file_key, unit_vertices, unit_indices, unit_height = entry
+        # Footprint of size mm, the height keeps the template proportions unless the blocker reaches the build plate
+        height = BlockerGeometry.blockerHeight('template', size * unit_height, y, on_build_plate, depth)
+
+        def build():
+            # One vertex per face corner like the other blockers, unless the mesh is compact
+            verts = scaleTemplate(unit_vertices, unit_height, size, height, sup)[unit_indices].reshape(-1, 3)
+            indices = numpy.arange(verts.shape[0], dtype=numpy.int32).reshape(-1, 3)
+            return BlockerGeometry.meshArrays(verts, indices, self._UseCompactMesh)
 
-        indices = []
-        # for every angle increment nbv (12 or 18) Vertices
-        tot = rng * nbv
-        for i in range(0, tot, 3): # 
-            indices.append([i, i+1, i+2])
-        mesh.setIndices(numpy.asarray(indices, dtype=numpy.int32))
+        key = ('template', file_key) + BlockerGeometry.templateKey('template', size, height, sup, compact=self._UseCompactMesh)[1:]
+        return self._getSharedMeshData(key, build)
 
-        mesh.calculateNormals()
+    def _currentTemplate(self) -> str:
+        # The first file of the library until one is chosen in the panel
+        names = self._getTemplateLibrary().names()
+        if self._TemplateName in names or not names:
+            return self._TemplateName
+        return names[0]
+
+    def _getTemplateLibrary(self) -> TemplateLibrary:
+        # Created on first use, the files are read and simplified only when a template is placed
+        if self._template_library is None:
+            folder_name = "custom_support_eraser_templates"
+            self._template_library = TemplateLibrary(os.path.join(Resources.getDataStoragePath(), folder_name),
+                                                     os.path.join(Resources.getCacheStoragePath(), folder_name))
+        return self._template_library
+
+    def _getSharedMeshData(self, key, builder = None) -> MeshData:
+        # Identical blockers use the same immutable MeshData, so the renderer uploads the buffers only once
+        # builder : function returning (vertices, indices, normals), the cube / cylinder template by default
+        mesh = self._shared_mesh_data.pop(key, None)
+        if mesh is None:
+            if builder is not None:
+                verts, indices, normals = builder()
+            else:
+                verts, indices, normals = BlockerGeometry.getTemplate(*key)
+            mesh = MeshData(vertices=verts, normals=normals, indices=indices)
+            if len(self._shared_mesh_data) >= BlockerGeometry.TEMPLATE_CACHE_SIZE:
+                self._shared_mesh_data.popitem(last=False)
+        self._shared_mesh_data[key] = mesh
         return mesh
+
+    def _onSharedBlockerTransformed(self, node):
+        # A scaled blocker no longer matches its template, it gets its own MeshData
+        if self._isScaled(node):
+            self._detachMeshData(node)
+
+    def _isScaled(self, node) -> bool:
+        # World scale : the local scale of a blocker parented to a scaled model is the inverse of the model scale
+        scale = node.getWorldScale()
+        return abs(scale.x - 1.0) > 1e-6 or abs(scale.y - 1.0) > 1e-6 or abs(scale.z - 1.0) > 1e-6
+
+    def _detachMeshData(self, node):
+        # Copy on write : the arrays are immutable, a new MeshData is enough to stop sharing
+        node.transformationChanged.disconnect(self._onSharedBlockerTransformed)
+        node.setMeshData(node.getMeshData().set())
         
     # Custom Support Blocker Creation
     def _createCustom(self, size, pos1 , pos2, sup):
-        mesh = MeshBuilder()
-        # Init point
-        Pt1 = Vector(pos1.x,pos1.z,pos1.y)
-        Pt2 = Vector(pos2.x,pos2.z,pos2.y)
+        # Depends on the two picked points, so nothing to share with other placements
+        verts, indices = BlockerGeometry.createCustom(size, (pos1.x, pos1.y, pos1.z), (pos2.x, pos2.y, pos2.z), sup)
+        verts, indices, normals = BlockerGeometry.meshArrays(verts, indices, self._UseCompactMesh)
+        return MeshData(vertices=verts, normals=normals, indices=indices)
 
-        V_Dir = Pt2 - Pt1
+    def _isModelNode(self, node) -> bool:
+        # Only "normal" meshes can have anti_overhang_mesh added to them
+        if not node.callDecoration("isSliceable") or node.getMeshData() is None:
+            return False
+        node_stack = node.callDecoration("getStack")
+        if node_stack:
+            for mesh_type in ("support_mesh", "anti_overhang_mesh", "infill_mesh", "cutting_mesh"):
+                if node_stack.getProperty(mesh_type, "value"):
+                    return False
+        return True
 
-        # Calcul vecteur
-        s = size / 2
+    def _isBlockerNode(self, node) -> bool:
+        if not node.callDecoration("isSliceable"):
+            return False
+        node_stack = node.callDecoration("getStack")
+        return bool(node_stack and node_stack.getProperty("anti_overhang_mesh", "value"))
 
-        l_a = pos1.y 
-        l_b = pos2.y 
- 
-        Vtop = Vector(0,0,sup)
-        VZ = Vector(0,0,s)
-        VZa = Vector(0,0,-l_a)
-        VZb = Vector(0,0,-l_b)
-        
-        Norm=Vector.cross(V_Dir,VZ).normalized()
-        Dec = Vector(Norm.x*s,Norm.y*s,Norm.z*s)
-            
-        nbv=24
-
-        # X Z Y
-        # t=Top
-        P_1t = Vtop+Dec
-        P_2t = Vtop-Dec
-        P_3t = V_Dir+Vtop+Dec
-        P_4t = V_Dir+Vtop-Dec
-        # i=Inf
-        P_1i = VZa+Dec
-        P_2i = VZa-Dec
-        P_3i = VZb+V_Dir+Dec
-        P_4i = VZb+V_Dir-Dec
-         
-        """
-        1) Top
-        2) Front
-        3) Left
-        4) Right
-        5) Back 
-        6) Bottom
-        """
-        verts = [ # 6 faces with 4 corners each
-            [P_1t.x, P_1t.z, P_1t.y], [P_2t.x, P_2t.z, P_2t.y], [P_4t.x, P_4t.z, P_4t.y], [P_3t.x, P_3t.z, P_3t.y],
-            [P_1t.x, P_1t.z, P_1t.y], [P_3t.x, P_3t.z, P_3t.y], [P_3i.x, P_3i.z, P_3i.y], [P_1i.x, P_1i.z, P_1i.y],
-            [P_2t.x, P_2t.z, P_2t.y], [P_1t.x, P_1t.z, P_1t.y], [P_1i.x, P_1i.z, P_1i.y], [P_2i.x, P_2i.z, P_2i.y],
-            [P_3t.x, P_3t.z, P_3t.y], [P_4t.x, P_4t.z, P_4t.y], [P_4i.x, P_4i.z, P_4i.y], [P_3i.x, P_3i.z, P_3i.y],
-            [P_4t.x, P_4t.z, P_4t.y], [P_2t.x, P_2t.z, P_2t.y], [P_2i.x, P_2i.z, P_2i.y], [P_4i.x, P_4i.z, P_4i.y],
-            [P_1i.x, P_1i.z, P_1i.y], [P_2i.x, P_2i.z, P_2i.y], [P_4i.x, P_4i.z, P_4i.y], [P_3i.x, P_3i.z, P_3i.y]
-        ]
-        
-        mesh.setVertices(numpy.asarray(verts, dtype=numpy.float32))
+    def autoSupportBlockerMesh(self):
+        # Add one blocker per overhang region of the selected models, all in a single grouped operation
+        self._commitPendingPlacements()
+
+        global_container_stack = CuraApplication.getInstance().getGlobalContainerStack()
+        if not global_container_stack:
+            return
+        support_angle = float(global_container_stack.getProperty("support_angle", "value"))
 
-        indices = []
-        for i in range(0, nbv, 4): # All 6 quads (12 triangles)
-            indices.append([i, i+2, i+1])
-            indices.append([i, i+3, i+2])
-        mesh.setIndices(numpy.asarray(indices, dtype=numpy.int32))
+        # Custom blockers need two points, the regions are covered with cubes instead
+        sb_type = 'cylinder' if self._SBType == 'cylinder' else 'cube'
+        use_size = self._UseSize
+        min_area = self._AutoMinArea
+        max_height = self._AutoMaxHeight
+        stop_at_surface = self._UseStopAtSurface
 
-        mesh.calculateNormals()
-        return mesh
+        # Everything the worker needs is read here, the worker never touches the scene
+        tasks = []
+        for selected_node in Selection.getAllSelectedObjects():
+            for parent in DepthFirstIterator(selected_node):
+                if self._isModelNode(parent):
+                    key, mesh, transformation = self._rayCasterKey(parent)
+                    tasks.append((parent, mesh, transformation, key, self._cachedRayCaster(key, mesh)))
+        if not tasks:
+            return
+
+        def compute(job):
+            results = []
+            for index, (parent, mesh, transformation, key, caster) in enumerate(tasks):
+                job.report(index, len(tasks))
+                world_mesh = mesh.getTransformed(transformation)
+                regions = BlockerGeometry.findOverhangRegions(world_mesh.getVertices(), world_mesh.getIndices(), support_angle, use_size, min_area, max_height)
+                sizes = []
+                for center_x, top_y, center_z, extent_x, extent_z, depth, area in regions:
+                    # The blocker covers the footprint of the region, never smaller than the current size
+                    if sb_type == 'cylinder':
+                        sizes.append(max(math.hypot(extent_x, extent_z), use_size))
+                    else:
+                        sizes.append(max(extent_x, extent_z, use_size))
+
+                # The surfaces below all the regions of the model in one batch of rays
+                floors = [0.0] * len(regions)
+                if stop_at_surface and regions:
+                    job.report(index + 0.5, len(tasks))
+                    if caster is None:
+                        caster = BlockerGeometry.VerticalRayCaster(world_mesh.getVertices(), world_mesh.getIndices())
+                    positions = [(region[0], region[1], region[2]) for region in regions]
+                    floors = BlockerGeometry.surfaceBelow(caster, sb_type, positions, sizes).tolist()
+                results.append((parent, transformation, regions, sizes, floors, (key, mesh, caster) if caster is not None else None))
+            return results
+
+        self._startJob("auto", i18n_catalog.i18nc("@info:status", "Searching the overhang regions"), compute,
+                       lambda results: self._addAutoBlockers(sb_type, results))
+
+    def _addAutoBlockers(self, sb_type: str, results):
+        placements = []
+        for parent, transformation, regions, sizes, floors, caster_entry in results:
+            if caster_entry is not None:
+                self._storeRayCaster(*caster_entry)
+            # The model was removed or moved during the computation, its regions are no longer valid
+            if parent.getParent() is None or not numpy.array_equal(parent.getWorldTransformation().getData(), transformation.getData()):
+                continue
+            for region, size, floor in zip(regions, sizes, floors):
+                position = Vector(region[0], region[1], region[2])
+                node = self._createSupportEraserNode(sb_type, size, position, position, region[5], floor = floor)
+                placements.append((node, parent, position))
+
+        self._commitPlacements(placements)
+        Logger.log("d", "Automatic support blockers : %d", len(placements))
+        Message(text = i18n_catalog.i18nc("@info:status", "%d support blocker(s) added on the overhang regions") % len(placements),
+                title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus")).show()
+
+    def consolidateSupportBlockerMesh(self):
+        # Replace all the blockers of every model by a single mesh, in one undoable operation
+        self._commitPendingPlacements()
+
+        blockers_by_parent = {}
+        for node in self._registry.nodes():
+            if node.getMeshData() is not None:
+                blockers_by_parent.setdefault(id(node.getParent()), []).append(node)
+
+        # The blocker meshes are read here, the union runs in a worker thread
+        groups = []
+        for blockers in blockers_by_parent.values():
+            if len(blockers) < 2:
+                continue
+            meshes = []
+            for node in blockers:
+                mesh = node.getMeshData().getTransformed(node.getWorldTransformation())
+                meshes.append((mesh.getVertices(), mesh.getIndices()))
+            groups.append((blockers[0].getParent(), blockers, meshes))
+        if not groups:
+            return
+
+        def compute(job):
+            results = []
+            for index, (parent, blockers, meshes) in enumerate(groups):
+                job.report(index, len(groups))
+                triangles = sum(BlockerGeometry.faceIndices(verts, indices).shape[0] for verts, indices in meshes)
+                verts, indices = self._unionMeshes(meshes)
+                results.append((parent, blockers, triangles, verts, indices))
+            return results
+
+        self._startJob("consolidate", i18n_catalog.i18nc("@info:status", "Merging the support blockers"), compute, self._replaceByMergedBlockers)
+
+    def _replaceByMergedBlockers(self, results):
+        from UM.Operations.GroupedOperation import GroupedOperation
+        from UM.Operations.AddSceneNodeOperation import AddSceneNodeOperation
+        from UM.Operations.RemoveSceneNodeOperation import RemoveSceneNodeOperation
+        from cura.Operations.SetParentOperation import SetParentOperation
+
+        root = self._controller.getScene().getRoot()
+        op = GroupedOperation()
+        merged = []
+        nb_blockers = 0
+        triangles_before = 0
+        triangles_after = 0
+        for parent, blockers, triangles, verts, indices in results:
+            # Blockers removed or moved to another model during the computation : keep this group as it is
+            if any(node.getParent() is not parent for node in blockers):
+                continue
+            for node in blockers:
+                op.addOperation(RemoveSceneNodeOperation(node))
+            triangles_before += triangles
+            triangles_after += indices.shape[0]
+            nb_blockers += len(blockers)
+
+            # Keep the node origin in the middle of the merged blockers
+            center = (verts.min(axis=0) + verts.max(axis=0)) * 0.5
+            verts = (verts - center).astype(numpy.float32)
+            normals = BlockerGeometry.calculateNormals(verts, indices)
+            node = self._createBlockerNode("EraserMerged", MeshData(vertices=verts, normals=normals, indices=indices))
+
+            op.addOperation(AddSceneNodeOperation(node, root))
+            op.addOperation(SetParentOperation(node, parent))
+            merged.append((node, Vector(float(center[0]), float(center[1]), float(center[2]))))
+
+        if not merged:
+            return
+
+        op.push()
+        for node, position in merged:
+            node.setPosition(position, CuraSceneNode.TransformSpace.World)
+            self._registry.add(node)
+        # The merged nodes replace the session blockers, "Remove All" goes back to the whole scene
+        self._registry.clearSession()
+        self._SMsg = i18n_catalog.i18nc("@label", "Remove All") 
+        self.propertyChanged.emit()
+
+        CuraApplication.getInstance().getController().getScene().sceneChanged.emit(merged[-1][0])
+
+        Logger.log("d", "Consolidate blockers : %d meshes -> %d, %d triangles -> %d", nb_blockers, len(merged), triangles_before, triangles_after)
+        Message(text = i18n_catalog.i18nc("@info:status", "%d support blockers merged into %d mesh(es), triangles %d -> %d") % (nb_blockers, len(merged), triangles_before, triangles_after),
+                title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus")).show()
+
+    def simplifySupportBlockerMesh(self):
+        # Rebuild the cylinders with a coarser chord tolerance, all the mesh swaps in one undoable operation
+        from UM.Operations.GroupedOperation import GroupedOperation
+        from .BlockerOperations import SetMeshDataOperation
+
+        self._commitPendingPlacements()
+        tolerance = self._ChordTolerance * SIMPLIFY_TOLERANCE_FACTOR
+        op = GroupedOperation()
+        last_node = None
+        triangles_before = 0
+        triangles_after = 0
+        for node in self._registry.nodes():
+            record = self._placementRecord(node)
+            mesh = node.getMeshData()
+            if record is None or record.sb_type != 'cylinder' or mesh is None:
+                continue
+            # Same length and top as the current mesh, only the segment count changes
+            y = mesh.getVertices()[:, 1]
+            segments = BlockerGeometry.segmentsForTolerance(record.size / 2, tolerance)
+            simplified = self._getSharedMeshData(BlockerGeometry.templateKey('cylinder', record.size, -float(y.min()), float(y.max()), segments, self._UseCompactMesh))
+            if simplified.getFaceCount() >= mesh.getFaceCount():
+                continue
+            if self._isScaled(node):
+                # A scaled blocker keeps its own MeshData
+                simplified = simplified.set()
+            op.addOperation(SetMeshDataOperation(node, simplified))
+            triangles_before += mesh.getFaceCount()
+            triangles_after += simplified.getFaceCount()
+            last_node = node
+
+        if last_node is None:
+            Message(text = i18n_catalog.i18nc("@info:status", "No support blocker to simplify"),
+                    title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus")).show()
+            return
+
+        op.push()
+        CuraApplication.getInstance().getController().getScene().sceneChanged.emit(last_node)
+        Logger.log("d", "Simplify blockers : triangles %d -> %d", triangles_before, triangles_after)
+
+    def _unionMeshes(self, meshes):
+        # Boolean union when trimesh has a boolean engine available, simple concatenation otherwise
+        verts, indices = BlockerGeometry.concatenateMeshes(meshes)
+        try:
+            import trimesh
+            parts = [trimesh.Trimesh(vertices=part_verts, faces=BlockerGeometry.faceIndices(part_verts, part_indices), process=True) for part_verts, part_indices in meshes]
+            union = trimesh.boolean.union(parts)
+            if union.is_volume:
+                return numpy.asarray(union.vertices, dtype=numpy.float32), numpy.asarray(union.faces, dtype=numpy.int32)
+        except Exception as e:
+            Logger.log("d", "Blocker union not available, meshes concatenated : %s", str(e))
+        return verts, indices
+
+    def _statisticsText(self) -> str:
+        triangles = 0
+        for node in self._registry.nodes():
+            mesh = node.getMeshData()
+            if mesh is not None:
+                triangles += mesh.getFaceCount()
+        return self._stats.summary(self._registry.countByPlate(), triangles)
+
+    def logStatistics(self):
+        # Write the counters and the stage timings in the Cura log
+        Logger.log("i", "Custom Support Eraser Plus statistics :\n%s", self._statisticsText())
 
     def removeAllSupportBlockerMesh(self):
-        if self._all_picked_node:
-            for node in self._all_picked_node:
-                node_stack = node.callDecoration("getStack")
-                if node_stack.getProperty("anti_overhang_mesh", "value"):
-                    self._removeSupportBlockerMesh(node)
-            self._all_picked_node = []
-            self._SMsg = i18n_catalog.i18nc("@label", "Remove All") 
-            self.propertyChanged.emit()
-        else:        
-            for node in DepthFirstIterator(self._application.getController().getScene().getRoot()):
-                if node.callDecoration("isSliceable"):
-                    # N_Name=node.getName()
-                    # Logger.log('d', 'isSliceable : ' + str(N_Name))
-                    node_stack=node.callDecoration("getStack")           
-                    if node_stack:        
-                        if node_stack.getProperty("anti_overhang_mesh", "value"):
-                            # N_Name=node.getName()
-                            # Logger.log('d', 'SupportBlockerMesh : ' + str(N_Name)) 
-                            self._removeSupportBlockerMesh(node)
+        # Blockers still waiting in a burst are dropped, they never reached the scene or the undo stack
+        self._burst_timer.stop()
+        self._pending_placements = []
+        # Blockers placed during this session first, all the blockers of the scene otherwise
+        nodes = self._registry.nodes(session = True)
+        if not nodes:
+            nodes = self._registry.nodes()
+        self._removeSupportBlockerMeshes(nodes)
+        self._registry.clearSession()
+        self._SMsg = i18n_catalog.i18nc("@label", "Remove All") 
+        self.propertyChanged.emit()
+
+    def removeModelSupportBlockerMesh(self):
+        # Remove the blockers of the selected models only
+        self._commitPendingPlacements()
+        nodes = []
+        for selected_node in Selection.getAllSelectedObjects():
+            for parent in DepthFirstIterator(selected_node):
+                nodes.extend(self._registry.nodes(parent = parent))
+        self._removeSupportBlockerMeshes(nodes)
+
+    def _selectedBlockers(self):
+        # The selected blockers, and the blockers of the selected models
+        nodes = {}
+        for selected_node in Selection.getAllSelectedObjects():
+            if selected_node in self._registry:
+                nodes[id(selected_node)] = selected_node
+                continue
+            for parent in DepthFirstIterator(selected_node):
+                for node in self._registry.nodes(parent = parent):
+                    nodes[id(node)] = node
+        return [node for node in nodes.values() if node.getParent() is not None]
+
+    def editSupportBlockerMesh(self):
+        # Apply the current size, type and "Reach Build Plate" option to the selected blockers,
+        # all the mesh swaps in one undoable operation and one scene notification
+        from UM.Operations.GroupedOperation import GroupedOperation
+        from .BlockerOperations import SetMeshDataOperation
+
+        self._commitPendingPlacements()
+        # Only the blockers placed from a single point can change of type
+        single_point_types = ('cube', 'cylinder', 'template')
+        template = self._currentTemplate() if self._SBType == 'template' else None
+
+        edits_by_parent = {}
+        skipped = 0
+        for node in self._selectedBlockers():
+            record = self._placementRecord(node)
+            if record is None:
+                # Merged or loaded blockers : nothing to rebuild them from
+                skipped += 1
+                continue
+            sb_type = record.sb_type
+            if sb_type in single_point_types and self._SBType in single_point_types:
+                sb_type = self._SBType
+            world_points = BlockerGeometry.transformPoints(node.getWorldTransformation().getData(), record.points)
+            points = [Vector(float(x), float(y), float(z)) for x, y, z in world_points]
+            edits_by_parent.setdefault(id(node.getParent()), (node.getParent(), []))[1].append((node, record, sb_type, points))
+
+        op = GroupedOperation()
+        last_node = None
+        parents = []
+        edited = 0
+        with self._stats.measure("edit"):
+            for parent, edits in edits_by_parent.values():
+                floors = self._recordedFloors(parent, [edit[2] for edit in edits], [edit[3] for edit in edits], [self._UseSize] * len(edits))
+                for (node, record, sb_type, points), floor in zip(edits, floors):
+                    on_build_plate = record.on_build_plate if sb_type == 'polyline' else self._UseOnBuildPlate
+                    # A template blocker keeps its file unless the Template type is chosen in the panel
+                    node_template = template if self._SBType == 'template' else record.template
+                    created = self._blockerMesh(sb_type, self._UseSize, points, record.depth, on_build_plate, floor, node_template)
+                    if created is None:
+                        skipped += 1
+                        continue
+                    name, mesh, new_record = created
+                    if mesh is node.getMeshData():
+                        continue
+                    if self._isScaled(node) and new_record.sb_type in single_point_types:
+                        # A scaled blocker keeps its own MeshData
+                        mesh = mesh.set()
+                    op.addOperation(SetMeshDataOperation(node, mesh, name,
+                                                         lambda node, redone, old = record, new = new_record: self._setPlacementRecord(node, new if redone else old)))
+                    parents.append(parent)
+                    last_node = node
+                    edited += 1
+
+        if last_node is None:
+            Message(text = i18n_catalog.i18nc("@info:status", "No support blocker to edit, select blockers or models with blockers"),
+                    title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus")).show()
+            return
+
+        op.push()
+        self._recordPlacements(parents)
+        CuraApplication.getInstance().getController().getScene().sceneChanged.emit(last_node)
+        Logger.log("d", "Edit blockers : %d rebuilt, %d skipped", edited, skipped)
+
+    def replicateSupportBlockerMesh(self):
+        # Clone the blockers of the selected models on every identical model of the same build plate
+        self._commitPendingPlacements()
+        root = self._controller.getScene().getRoot()
+        models = [node for node in DepthFirstIterator(root) if self._isModelNode(node)]
+
+        placements = []
+        done = set()
+        for selected_node in Selection.getAllSelectedObjects():
+            for source in DepthFirstIterator(selected_node):
+                if id(source) in done or not self._isModelNode(source):
+                    continue
+                blockers = self._registry.nodes(parent = source)
+                if not blockers:
+                    continue
+                done.add(id(source))
+
+                # Blocker transformations relative to their model, the same for every copy
+                to_source = numpy.linalg.inv(source.getWorldTransformation().getData())
+                relatives = [(blocker, to_source @ blocker.getWorldTransformation().getData()) for blocker in blockers]
+
+                for target in self._identicalModels(source, models):
+                    done.add(id(target))
+                    # Skip the blockers the copy already has, so replicating twice does not stack them
+                    existing = SpatialHash(1.0)
+                    for node in self._registry.nodes(parent = target):
+                        position = node.getWorldPosition()
+                        existing.insert((position.x, position.y, position.z))
+
+                    to_world = target.getWorldTransformation().getData()
+                    for blocker, relative in relatives:
+                        matrix = to_world @ relative
+                        position = Vector(float(matrix[0, 3]), float(matrix[1, 3]), float(matrix[2, 3]))
+                        if existing.hasNeighbour((position.x, position.y, position.z), 0.1):
+                            continue
+                        placements.append((self._cloneBlockerNode(blocker, matrix), target, position))
+
+        self._commitPlacements(placements)
+        Logger.log("d", "Replicated support blockers : %d", len(placements))
+        Message(text = i18n_catalog.i18nc("@info:status", "%d support blocker(s) replicated on the identical models") % len(placements),
+                title = i18n_catalog.i18nc("@info:title", "Custom Supports Eraser Plus")).show()
+
+    def _identicalModels(self, source: CuraSceneNode, models):
+        # Models sharing the MeshData of the source, or with the same geometry hash
+        mesh = source.getMeshData()
+        build_plate = source.callDecoration("getBuildPlateNumber")
+        source_hash = None
+        for node in models:
+            if node is source or node.callDecoration("getBuildPlateNumber") != build_plate:
+                continue
+            other = node.getMeshData()
+            if other is not mesh:
+                if other.getVertexCount() != mesh.getVertexCount():
+                    continue
+                if source_hash is None:
+                    source_hash = self._mesh_hashes.get(mesh)
+                if self._mesh_hashes.get(other) != source_hash:
+                    continue
+            yield node
+
+    def _cloneBlockerNode(self, blocker: CuraSceneNode, matrix) -> CuraSceneNode:
+        # The clone uses the MeshData of the blocker, only its transformation differs
+        node = self._createBlockerNode(blocker.getName(), blocker.getMeshData())
+        node.setTransformation(Matrix(matrix))
+        node.transformationChanged.connect(self._onSharedBlockerTransformed)
+        self._onSharedBlockerTransformed(node)
+        record = self._placementRecord(blocker)
+        if record is not None:
+            self._setPlacementRecord(node, record)
+        return node
         
     def getSSize(self) -> float:
         """ 
@@ -530,6 +1635,8 @@ class CustomSupportEraserPlus(Tool):
         param SBType: SBType as text paramater.
         """
         self._SBType = SBType
+        # A polyline in progress is dropped when the type changes
+        self._cancelPolyline()
         # Logger.log('d', 'SBType : ' + str(SBType))   
         self._preferences.setValue("CustomSupportEraserPlus/sb_type", SBType)
         
@@ -545,4 +1652,275 @@ class CustomSupportEraserPlus(Tool):
         """
         self._UseOnBuildPlate = OnBuildPlate
         self._preferences.setValue("CustomSupportEraserPlus/on_build_plate", OnBuildPlate)
+
+    def getAutoMinArea(self) -> float:
+        """ 
+            return: global _AutoMinArea  in mm2.
+        """ 
+        return self._AutoMinArea
+    
+    def setAutoMinArea(self, AutoMinArea: str) -> None:
+        """
+        param AutoMinArea: Minimum overhang region area in mm2.
+        """
+        try:
+            a_value = float(AutoMinArea)
+        except ValueError:
+            return
+
+        if a_value < 0:
+            return
+
+        self._AutoMinArea = a_value
+        self._preferences.setValue("CustomSupportEraserPlus/auto_min_area", a_value)
+
+    def getAutoMaxHeight(self) -> float:
+        """ 
+            return: global _AutoMaxHeight  in mm.
+        """ 
+        return self._AutoMaxHeight
+    
+    def setAutoMaxHeight(self, AutoMaxHeight: str) -> None:
+        """
+        param AutoMaxHeight: Maximum height of the overhang regions in mm, 0 = no limit.
+        """
+        try:
+            h_value = float(AutoMaxHeight)
+        except ValueError:
+            return
+
+        if h_value < 0:
+            return
+
+        self._AutoMaxHeight = h_value
+        self._preferences.setValue("CustomSupportEraserPlus/auto_max_height", h_value)
+
+    def getInstrumentation(self) -> bool:
+        """ 
+            return: global instrumentation state  as boolean.
+        """ 
+        return self._stats.enabled
+    
+    def setInstrumentation(self, Instrumentation: bool) -> None:
+        """
+        param Instrumentation: as boolean, time the placement stages.
+        """
+        self._stats.enabled = bool(Instrumentation)
+        if not self._stats.enabled:
+            self._stats.reset()
+        self._preferences.setValue("CustomSupportEraserPlus/instrumentation", self._stats.enabled)
+        self.propertyChanged.emit()
+
+    def getSStats(self) -> str:
+        """ 
+            return: counters and stage timings as text, empty when the instrumentation is off.
+        """ 
+        if not self._stats.enabled:
+            return ""
+        return self._statisticsText()
+
+    def getPaint(self) -> bool:
+        """ 
+            return: global _UsePaint  as boolean.
+        """ 
+        return self._UsePaint
+    
+    def setPaint(self, Paint: bool) -> None:
+        """
+        param Paint: as boolean, place the blockers along the mouse path.
+        """
+        self._UsePaint = bool(Paint)
+        self._preferences.setValue("CustomSupportEraserPlus/paint", self._UsePaint)
+
+    def getBoxSelect(self) -> bool:
+        """ 
+            return: global _UseBoxSelect  as boolean.
+        """ 
+        return self._UseBoxSelect
+    
+    def setBoxSelect(self, BoxSelect: bool) -> None:
+        """
+        param BoxSelect: as boolean, cover a dragged rectangle with one box blocker.
+        """
+        self._UseBoxSelect = bool(BoxSelect)
+        self._preferences.setValue("CustomSupportEraserPlus/box_select", self._UseBoxSelect)
+
+    def getBudgetMaxBlockers(self) -> int:
+        """ 
+            return: blocker count above which a warning is shown, 0 = no limit.
+        """ 
+        return self._budget.max_blockers
+    
+    def setBudgetMaxBlockers(self, BudgetMaxBlockers: str) -> None:
+        """
+        param BudgetMaxBlockers: blocker count limit, 0 to disable it.
+        """
+        try:
+            b_value = int(float(BudgetMaxBlockers))
+        except ValueError:
+            return
+
+        if b_value < 0:
+            return
+
+        self._budget.max_blockers = b_value
+        self._preferences.setValue("CustomSupportEraserPlus/budget_max_blockers", b_value)
+        self._budget_cost = None
+        self._budget_timer.start()
+
+    def getBudgetMaxTriangles(self) -> int:
+        """ 
+            return: blocker triangle count above which a warning is shown, 0 = no limit.
+        """ 
+        return self._budget.max_triangles
+    
+    def setBudgetMaxTriangles(self, BudgetMaxTriangles: str) -> None:
+        """
+        param BudgetMaxTriangles: blocker triangle limit, 0 to disable it.
+        """
+        try:
+            t_value = int(float(BudgetMaxTriangles))
+        except ValueError:
+            return
+
+        if t_value < 0:
+            return
+
+        self._budget.max_triangles = t_value
+        self._preferences.setValue("CustomSupportEraserPlus/budget_max_triangles", t_value)
+        self._budget_cost = None
+        self._budget_timer.start()
+
+    def getSBudget(self) -> str:
+        """ 
+            return: blocker count, triangles and estimated slice cost as text.
+        """ 
+        if self._budget_cost is None:
+            return ""
+        return self._budget.summary(self._budget_cost)
+
+    def getPaintSpacing(self) -> float:
+        """ 
+            return: global _PaintSpacing  in mm.
+        """ 
+        return self._PaintSpacing
+    
+    def setPaintSpacing(self, PaintSpacing: str) -> None:
+        """
+        param PaintSpacing: Minimum distance between painted blockers in mm, 0 = size.
+        """
+        try:
+            p_value = float(PaintSpacing)
+        except ValueError:
+            return
+
+        if p_value < 0:
+            return
+
+        self._PaintSpacing = p_value
+        self._preferences.setValue("CustomSupportEraserPlus/paint_spacing", p_value)
+
+    def getChordTolerance(self) -> float:
+        """ 
+            return: global _ChordTolerance  in mm.
+        """ 
+        return self._ChordTolerance
+    
+    def setChordTolerance(self, ChordTolerance: str) -> None:
+        """
+        param ChordTolerance: Maximum distance in mm between a cylinder and its facets.
+        """
+        try:
+            t_value = float(ChordTolerance)
+        except ValueError:
+            return
+
+        if t_value <= 0:
+            return
+
+        self._ChordTolerance = t_value
+        self._preferences.setValue("CustomSupportEraserPlus/chord_tolerance", t_value)
+
+    def getCompactMesh(self) -> bool:
+        """ 
+            return: global _UseCompactMesh  as boolean.
+        """ 
+        return self._UseCompactMesh
+    
+    def setCompactMesh(self, CompactMesh: bool) -> None:
+        """
+        param CompactMesh: as boolean, share the vertices between the faces of the new blockers.
+        """
+        self._UseCompactMesh = bool(CompactMesh)
+        self._preferences.setValue("CustomSupportEraserPlus/compact_mesh", self._UseCompactMesh)
+
+    def getPlacementCache(self) -> bool:
+        """ 
+            return: global _UsePlacementCache  as boolean.
+        """ 
+        return self._UsePlacementCache
+    
+    def setPlacementCache(self, PlacementCache: bool) -> None:
+        """
+        param PlacementCache: as boolean, remember the placements per model and offer them again.
+        """
+        self._UsePlacementCache = bool(PlacementCache)
+        self._preferences.setValue("CustomSupportEraserPlus/placement_cache", self._UsePlacementCache)
+
+    def getStopAtSurface(self) -> bool:
+        """ 
+            return: global _UseStopAtSurface  as boolean.
+        """ 
+        return self._UseStopAtSurface
+    
+    def setStopAtSurface(self, StopAtSurface: bool) -> None:
+        """
+        param StopAtSurface: as boolean, stop the blockers at the first surface of the model below them.
+        """
+        self._UseStopAtSurface = bool(StopAtSurface)
+        self._preferences.setValue("CustomSupportEraserPlus/stop_at_surface", self._UseStopAtSurface)
+        if not self._UseStopAtSurface:
+            self._ray_casters.clear()
+
+    def getTemplateName(self) -> str:
+        """ 
+            return: global _TemplateName  as text paramater.
+        """ 
+        return self._TemplateName
+    
+    def setTemplateName(self, TemplateName: str) -> None:
+        """
+        param TemplateName: file of the template library used by the type template.
+        """
+        self._TemplateName = str(TemplateName)
+        self._preferences.setValue("CustomSupportEraserPlus/template_name", self._TemplateName)
+
+    def getTemplateList(self):
+        """ 
+            return: files of the template library, the first call reads the folder.
+        """ 
+        return self._getTemplateLibrary().names()
+
+    def getBurstDelay(self) -> int:
+        """ 
+            return: global _BurstDelay  in ms.
+        """ 
+        return self._BurstDelay
+    
+    def setBurstDelay(self, BurstDelay: str) -> None:
+        """
+        param BurstDelay: Delay in ms, 0 to disable the burst placement.
+        """
+        try:
+            b_value = int(float(BurstDelay))
+        except ValueError:
+            return
+
+        if b_value < 0:
+            return
+
+        self._BurstDelay = b_value
+        self._preferences.setValue("CustomSupportEraserPlus/burst_delay", b_value)
+        if b_value == 0:
+            self._commitPendingPlacements()
  
@@ -0,0 +1,161 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Blocker placements remembered per model geometry.
+#
+# The placements are stored relative to the model in a JSON sidecar file, keyed by a hash of
+# the model vertex data, so the same part loaded again in another project gets its blockers
+# back. The hash is computed in chunks and kept per MeshData, a model is hashed only once.
+#
+# Pure Python + NumPy, no Cura dependency.
+#--------------------------------------------------------------------------------------------
+
+import collections
+import hashlib
+import json
+import os
+import weakref
+
+import numpy
+
+CACHE_FILE_NAME = "custom_support_eraser_placements.json"
+CACHE_VERSION = 1
+
+# Number of models kept in the file, the least recently used ones are dropped first
+MAX_MODELS = 500
+
+# Bytes given to the hash at once
+HASH_CHUNK = 1 << 22
+
+# One recorded blocker : sb_type, size in mm, on_build_plate flag, additional depth in mm
+# and points (n, 3) in model coordinates : the position, then position2 (custom) or the next points (polyline)
+# template is the file name of the template library used by the template blockers
+PlacementRecord = collections.namedtuple("PlacementRecord", ["sb_type", "size", "on_build_plate", "depth", "points", "template"], defaults = [None])
+
+
+def hashArrays(vertices, indices = None) -> str:
+    """Hex digest of the vertex (and index) data of a mesh, computed chunk by chunk."""
+    digest = hashlib.sha1()
+    for array in (vertices, indices):
+        if array is None:
+            continue
+        data = numpy.ascontiguousarray(array)
+        digest.update(("%s%s" % (data.dtype.str, data.shape)).encode("ascii"))
+        view = memoryview(data).cast("B")
+        for start in range(0, len(view), HASH_CHUNK):
+            digest.update(view[start:start + HASH_CHUNK])
+    return digest.hexdigest()
+
+
+class MeshHashCache:
+    """Geometry hash of MeshData objects, computed once per object."""
+    def __init__(self) -> None:
+        # id(mesh_data) -> (weak reference, hash)
+        self._hashes = {}
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def get(self, mesh_data) -> str:
+        mesh_id = id(mesh_data)
+        entry = self._hashes.get(mesh_id)
+        if entry is not None and entry[0]() is mesh_data:
+            return entry[1]
+        key = hashArrays(mesh_data.getVertices(), mesh_data.getIndices())
+        self._hashes[mesh_id] = (weakref.ref(mesh_data, lambda ref, mesh_id = mesh_id: self._hashes.pop(mesh_id, None)), key)
+        return key
+
+
+class PlacementCache:
+    def __init__(self, path: str) -> None:
+        """
+        param path: JSON file of the cache, read on first use.
+        """
+        self._path = path
+        # hash -> list of PlacementRecord, least recently used first
+        self._entries = None
+        self._dirty = False
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def get(self, key: str):
+        """Recorded placements of a model, empty list when unknown."""
+        entries = self._load()
+        records = entries.get(key)
+        if records is None:
+            return []
+        entries.move_to_end(key)
+        return list(records)
+
+    def put(self, key: str, records) -> None:
+        """Replace the placements of a model, an empty list forgets it."""
+        entries = self._load()
+        records = [PlacementRecord(*record) for record in records]
+        if records:
+            entries[key] = records
+            entries.move_to_end(key)
+            while len(entries) > MAX_MODELS:
+                entries.popitem(last = False)
+        elif entries.pop(key, None) is None:
+            return
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        data = {"version": CACHE_VERSION, "models": {}}
+        for key, records in self._load().items():
+            items = []
+            for record in records:
+                item = {
+                    "type": record.sb_type,
+                    "size": round(float(record.size), 4),
+                    "on_build_plate": bool(record.on_build_plate),
+                    "depth": round(float(record.depth), 4),
+                    "points": numpy.round(numpy.asarray(record.points, dtype = numpy.float64), 4).tolist()
+                }
+                if record.template is not None:
+                    item["template"] = record.template
+                items.append(item)
+            data["models"][key] = items
+
+        # Write a temporary file first, an interrupted save keeps the previous cache
+        folder = os.path.dirname(self._path)
+        if folder:
+            os.makedirs(folder, exist_ok = True)
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "w", encoding = "utf-8") as json_file:
+            json.dump(data, json_file)
+        os.replace(temp_path, self._path)
+        self._dirty = False
+
+    def _load(self):
+        if self._entries is not None:
+            return self._entries
+        self._entries = collections.OrderedDict()
+        try:
+            with open(self._path, "r", encoding = "utf-8") as json_file:
+                data = json.load(json_file)
+        except (OSError, ValueError):
+            return self._entries
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return self._entries
+
+        for key, items in data.get("models", {}).items():
+            try:
+                self._entries[key] = [PlacementRecord(str(item["type"]), float(item["size"]), bool(item.get("on_build_plate", False)),
+                                                      float(item.get("depth", 0.0)), numpy.asarray(item["points"], dtype = numpy.float64).reshape(-1, 3),
+                                                      item.get("template"))
+                                      for item in items]
+            except (KeyError, TypeError, ValueError):
+                # A damaged entry only loses the placements of its model
+                continue
+        return self._entries
@@ -0,0 +1,237 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# User supplied blocker shapes.
+#
+# The STL / 3MF files of the template folder are listed on demand. The first time a file is
+# used, its shape is reduced to its convex hull (trimesh) or to a vertex clustered mesh (NumPy
+# only), normalized to a unit footprint and saved as .npz in the cache folder under the hash of
+# the file, so a detailed template is read and simplified only once.
+#
+# Pure Python + NumPy, trimesh is optional.
+#--------------------------------------------------------------------------------------------
+
+import hashlib
+import os
+import re
+import struct
+import xml.etree.ElementTree as ElementTree
+import zipfile
+
+import numpy
+
+TEMPLATE_EXTENSIONS = (".stl", ".3mf")
+
+# Grid cells along the largest dimension for the vertex clustering
+CLUSTER_RESOLUTION = 24
+
+# Bumped when the simplification changes, the cached files are computed again
+SIMPLIFY_VERSION = 1
+
+
+def _fromZUp(vertices: numpy.ndarray) -> numpy.ndarray:
+    # File Z up -> Cura Y up, the inverse of BlockerGeometry._toZUp
+    return numpy.stack([vertices[:, 0], vertices[:, 2], -vertices[:, 1]], axis=1)
+
+
+def readStl(path: str):
+    """(vertices, indices) of a binary or ASCII STL file, one vertex per triangle corner."""
+    with open(path, "rb") as stl_file:
+        data = stl_file.read()
+    if len(data) >= 84:
+        count = struct.unpack("<I", data[80:84])[0]
+        if len(data) == 84 + count * 50:
+            record = numpy.dtype([("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+            vertices = numpy.frombuffer(data, dtype=record, count=count, offset=84)["vertices"].reshape(-1, 3)
+            return vertices.astype(numpy.float64), numpy.arange(count * 3, dtype=numpy.int32).reshape(-1, 3)
+
+    values = re.findall(rb"vertex\s+(\S+)\s+(\S+)\s+(\S+)", data)
+    vertices = numpy.array(values, dtype=numpy.float64).reshape(-1, 3)
+    count = vertices.shape[0] // 3
+    return vertices[:count * 3], numpy.arange(count * 3, dtype=numpy.int32).reshape(-1, 3)
+
+
+def read3mf(path: str):
+    """(vertices, indices) of all the meshes of a 3MF file, the object transformations are ignored."""
+    all_vertices = []
+    all_indices = []
+    offset = 0
+    with zipfile.ZipFile(path) as archive:
+        for model_name in archive.namelist():
+            if not model_name.lower().endswith(".model"):
+                continue
+            root = ElementTree.fromstring(archive.read(model_name))
+            for mesh in root.iter():
+                if not mesh.tag.endswith("}mesh") and mesh.tag != "mesh":
+                    continue
+                vertices = [(float(v.get("x")), float(v.get("y")), float(v.get("z"))) for v in mesh.iter() if v.tag.endswith("vertex")]
+                indices = [(int(t.get("v1")), int(t.get("v2")), int(t.get("v3"))) for t in mesh.iter() if t.tag.endswith("triangle")]
+                if not vertices or not indices:
+                    continue
+                all_vertices.append(numpy.array(vertices, dtype=numpy.float64))
+                all_indices.append(numpy.array(indices, dtype=numpy.int32) + offset)
+                offset += len(vertices)
+    if not all_vertices:
+        return numpy.zeros((0, 3)), numpy.zeros((0, 3), dtype=numpy.int32)
+    return numpy.concatenate(all_vertices), numpy.concatenate(all_indices)
+
+
+def readMesh(path: str):
+    """(vertices, indices) of an STL or 3MF file, Y up like in Cura."""
+    if path.lower().endswith(".3mf"):
+        vertices, indices = read3mf(path)
+    else:
+        vertices, indices = readStl(path)
+    return _fromZUp(vertices), indices
+
+
+def clusterVertices(vertices: numpy.ndarray, indices: numpy.ndarray, resolution: int = CLUSTER_RESOLUTION):
+    """Simplify a mesh by merging the vertices falling in the same grid cell.
+
+    :return: (vertices, indices) with at most resolution^3 vertices.
+    """
+    low = vertices.min(axis=0)
+    cell_size = max(float((vertices.max(axis=0) - low).max()) / resolution, 1e-6)
+    cells = numpy.floor((vertices - low) / cell_size).astype(numpy.int64)
+    _, cluster = numpy.unique(cells, axis=0, return_inverse=True)
+    cluster = cluster.reshape(-1)
+    nb_clusters = int(cluster.max()) + 1
+    # Every cluster is replaced by the mean of its vertices
+    counts = numpy.bincount(cluster, minlength=nb_clusters)[:, None]
+    merged = numpy.zeros((nb_clusters, 3))
+    numpy.add.at(merged, cluster, vertices)
+    merged /= counts
+
+    faces = cluster[indices]
+    valid = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    faces = faces[valid]
+    # The same triangle can come from several original faces
+    _, first = numpy.unique(numpy.sort(faces, axis=1), axis=0, return_index=True)
+    return merged, faces[numpy.sort(first)].astype(numpy.int32)
+
+
+def simplifyMesh(vertices: numpy.ndarray, indices: numpy.ndarray):
+    """Convex hull of the mesh with trimesh, vertex clustering without it.
+
+    :return: (vertices, indices, method)
+    """
+    try:
+        import trimesh
+        hull = trimesh.Trimesh(vertices=vertices, faces=indices, process=True).convex_hull
+        return numpy.asarray(hull.vertices, dtype=numpy.float64), numpy.asarray(hull.faces, dtype=numpy.int32), "hull"
+    except Exception:
+        verts, faces = clusterVertices(vertices, indices)
+        return verts, faces, "cluster"
+
+
+def normalizeTemplate(vertices: numpy.ndarray):
+    """Unit template : footprint of size 1 centered on the origin, top at y = 0.
+
+    :return: (vertices, height) height being the height of the unit template.
+    """
+    low = vertices.min(axis=0)
+    high = vertices.max(axis=0)
+    extent = high - low
+    scale = max(float(extent[0]), float(extent[2]))
+    if scale <= 0:
+        scale = max(float(extent[1]), 1.0)
+    center = (low + high) * 0.5
+    unit = (vertices - numpy.array([center[0], high[1], center[2]])) / scale
+    return unit.astype(numpy.float32), float(extent[1]) / scale
+
+
+def scaleTemplate(vertices: numpy.ndarray, unit_height: float, size: float, height: float, sup: float) -> numpy.ndarray:
+    """Vertices of a template blocker of footprint size and given height, top sup above the origin."""
+    y_scale = height / unit_height if unit_height > 0 else 0.0
+    return (vertices * numpy.array([size, y_scale, size], dtype=numpy.float32) + numpy.array([0.0, sup, 0.0], dtype=numpy.float32)).astype(numpy.float32)
+
+
+def fileHash(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as template_file:
+        for chunk in iter(lambda: template_file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TemplateLibrary:
+    def __init__(self, folder: str, cache_folder: str) -> None:
+        """
+        param folder: folder of the STL / 3MF templates.
+        param cache_folder: folder of the simplified templates.
+        """
+        self._folder = folder
+        self._cache_folder = cache_folder
+        self._files = None
+        self._folder_mtime = None
+        # name -> (file key, unit vertices, indices, unit height)
+        self._templates = {}
+        # name -> error text of the last failed read
+        self.errors = {}
+
+    @property
+    def folder(self) -> str:
+        return self._folder
+
+    def names(self):
+        """Template names (file names), the folder is listed again only when it changed."""
+        try:
+            mtime = os.stat(self._folder).st_mtime
+        except OSError:
+            return []
+        if self._files is None or mtime != self._folder_mtime:
+            self._folder_mtime = mtime
+            self._files = {name: os.path.join(self._folder, name) for name in os.listdir(self._folder)
+                           if name.lower().endswith(TEMPLATE_EXTENSIONS)}
+        return sorted(self._files, key = str.lower)
+
+    def get(self, name: str):
+        """(key, unit vertices, indices, unit height) of a template, None when it can not be read.
+
+        key changes with the file content, the vertices and indices are read-only.
+        The reason of a failed read is kept in errors[name].
+        """
+        if name not in self.names():
+            return None
+        path = self._files[name]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        template = self._templates.get(name)
+        if template is not None and template[0] == (stat.st_mtime, stat.st_size):
+            return template[1:]
+
+        try:
+            key = "%s-%d" % (fileHash(path), SIMPLIFY_VERSION)
+        except OSError as e:
+            self.errors[name] = str(e)
+            return None
+        cache_path = os.path.join(self._cache_folder, key + ".npz")
+        try:
+            with numpy.load(cache_path) as cached:
+                vertices, indices, unit_height = cached["vertices"], cached["indices"], float(cached["height"])
+        except (OSError, KeyError, ValueError):
+            try:
+                vertices, indices = readMesh(path)
+                if indices.shape[0] == 0:
+                    self.errors[name] = "no triangle in the file"
+                    return None
+                vertices, indices, method = simplifyMesh(vertices, indices)
+                vertices, unit_height = normalizeTemplate(vertices)
+            except (OSError, ValueError, IndexError, zipfile.BadZipFile, ElementTree.ParseError) as e:
+                # Damaged or unsupported file
+                self.errors[name] = "%s : %s" % (type(e).__name__, e)
+                return None
+            try:
+                os.makedirs(self._cache_folder, exist_ok = True)
+                numpy.savez(cache_path, vertices = vertices, indices = indices, height = unit_height, method = method)
+            except OSError:
+                pass
+
+        vertices.flags.writeable = False
+        indices.flags.writeable = False
+        template = ((stat.st_mtime, stat.st_size), key, vertices, indices, unit_height)
+        self._templates[name] = template
+        self.errors.pop(name, None)
+        return template[1:]
@@ -0,0 +1,291 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Benchmarks of the plugin : the Cura independent parts (BlockerGeometry, BlockerRegistry,
+# TemplateLibrary) and the tool itself, driven with the stand-ins of fake_cura.py.
+#
+#   python benchmarks/bench_blockers.py --output results.json
+#   python benchmarks/bench_blockers.py --baseline results.json
+#
+# The results are written as JSON (best time of several runs, in microseconds) so a change
+# can be compared with a previous run. The tool benchmarks also record the undo entries
+# (_pushes) and the scene notifications (_emits) of one action next to its time, both should
+# stay at 1. Only NumPy is needed.
+#--------------------------------------------------------------------------------------------
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BlockerGeometry
+from BlockerRegistry import BlockerRegistry
+from TemplateLibrary import TemplateLibrary, clusterVertices, normalizeTemplate, scaleTemplate
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_cura
+
+BLOCKER_COUNTS = (10, 100, 1000)
+
+
+class _Node:
+    # Minimal scene node : the registry only needs getParent() and the build plate decoration
+    def __init__(self, parent = None) -> None:
+        self._parent = parent
+
+    def getParent(self):
+        return self._parent
+
+    def callDecoration(self, name):
+        return 0
+
+
+def _best(function, number: int, repeat: int = 5) -> float:
+    gc.collect()
+    return min(timeit.repeat(function, number = number, repeat = repeat)) / number * 1e6
+
+
+def benchMeshes(results) -> None:
+    for sb_type in ('cube', 'cylinder'):
+        def uncached(sb_type = sb_type):
+            BlockerGeometry.clearTemplateCache()
+            BlockerGeometry.getTemplate(sb_type, 5.0, 5.0, 0.25)
+        results["mesh_%s_uncached" % sb_type] = _best(uncached, 200)
+        results["mesh_%s_cached" % sb_type] = _best(lambda sb_type = sb_type: BlockerGeometry.getTemplate(sb_type, 5.0, 5.0, 0.25), 2000)
+
+    def compact():
+        BlockerGeometry.clearTemplateCache()
+        BlockerGeometry.getTemplate('cylinder', 5.0, 5.0, 0.05, BlockerGeometry.segmentsForTolerance(2.5), True)
+    results["mesh_cylinder_compact_uncached"] = _best(compact, 200)
+
+    def custom():
+        verts, indices = BlockerGeometry.createCustom(5.0, (0.0, 10.0, 0.0), (20.0, 12.0, 5.0), 0.05)
+        BlockerGeometry.calculateNormals(verts, indices)
+    results["mesh_custom"] = _best(custom, 200)
+
+    # Polyline of 10 points along a zigzag edge
+    points = [(i * 5.0, 10.0 + (i % 2), (i % 3) * 2.0) for i in range(10)]
+    def polyline():
+        verts, indices = BlockerGeometry.createPolyline(5.0, points, 0.05)
+        BlockerGeometry.meshArrays(verts, indices)
+    results["mesh_polyline_10_points"] = _best(polyline, 200)
+
+    # Box fitted on the samples of a dragged rectangle
+    samples = numpy.random.default_rng(0).uniform(-10.0, 10.0, (BlockerGeometry.BOX_SAMPLES, 3))
+    def box():
+        center, length, width, angle, y_min, y_max = BlockerGeometry.fitOrientedBox(samples, 5.0)
+        verts, indices = BlockerGeometry.createOrientedBox(length, width, angle, y_max - y_min + 5.0, 0.25)
+        BlockerGeometry.meshArrays(verts, indices)
+    results["mesh_box"] = _best(box, 200)
+
+    # Template : simplification of a 20k faces file once, then scaling of the unit template at every placement
+    verts, indices = _sphere(100)
+    results["template_simplify_20k_faces"] = _best(lambda: normalizeTemplate(clusterVertices(verts, indices)[0]), 1, 3)
+    unit_vertices, unit_indices = clusterVertices(verts, indices)
+    unit_vertices, unit_height = normalizeTemplate(unit_vertices)
+    def template():
+        scaled = scaleTemplate(unit_vertices, unit_height, 5.0, 10.0, 0.25)[unit_indices].reshape(-1, 3)
+        BlockerGeometry.meshArrays(scaled, numpy.arange(scaled.shape[0], dtype = numpy.int32).reshape(-1, 3))
+    results["mesh_template"] = _best(template, 50)
+
+    # Same rules as a click in the tool, with the on build plate height changing at every placement
+    specs = [BlockerGeometry.PlacementSpec("cube", 5.0, (float(i), 1.0 + i * 0.1, 0.0), None, True) for i in range(100)]
+    def batch():
+        BlockerGeometry.clearTemplateCache()
+        BlockerGeometry.buildBlockers(specs)
+    results["batch_100_placements"] = _best(batch, 5)
+
+
+def _sphere(n: int):
+    # UV sphere of about 2 n^2 faces, radius 20 mm, floating 10 mm above the build plate
+    theta, phi = numpy.meshgrid(numpy.linspace(0, numpy.pi, n), numpy.linspace(0, 2 * numpy.pi, n), indexing = "ij")
+    verts = numpy.stack([20 * numpy.sin(theta) * numpy.cos(phi), 30 - 20 * numpy.cos(theta), 20 * numpy.sin(theta) * numpy.sin(phi)], axis = -1).reshape(-1, 3)
+    grid = numpy.arange(n * n).reshape(n, n)
+    a, b, c, d = grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]
+    indices = numpy.concatenate([numpy.stack([a, c, b], -1).reshape(-1, 3), numpy.stack([a, d, c], -1).reshape(-1, 3)])
+    return verts, indices
+
+
+def benchOverhang(results) -> None:
+    # About 200k faces
+    verts, indices = _sphere(320)
+    results["overhang_200k_faces"] = _best(lambda: BlockerGeometry.findOverhangRegions(verts, indices, 50.0, 5.0), 1, 3)
+
+    # Stop at surface : grid built once per model, then the footprints of 1000 blockers in one batch
+    results["raycast_build_200k_faces"] = _best(lambda: BlockerGeometry.VerticalRayCaster(verts, indices), 1, 3)
+    caster = BlockerGeometry.VerticalRayCaster(verts, indices)
+    positions = numpy.random.default_rng(0).uniform(-25.0, 25.0, (1000, 3))
+    positions[:, 1] = 60.0
+    results["raycast_1000_blockers"] = _best(lambda: BlockerGeometry.surfaceBelow(caster, 'cube', positions, 5.0), 5)
+
+
+def benchRegistry(results) -> None:
+    for count in BLOCKER_COUNTS:
+        root = _Node()
+        models = [_Node(root) for i in range(10)]
+        blockers = [_Node(models[i % 10]) for i in range(count)]
+        registry = BlockerRegistry(root)
+        for node in blockers:
+            registry.add(node, session = True)
+        # Gathering the targets of "Remove All" and "Remove Model"
+        results["registry_remove_all_%d" % count] = _best(registry.nodes, 50)
+        results["registry_remove_model_%d" % count] = _best(lambda: registry.nodes(parent = models[0]), 50)
+
+
+def _counters():
+    application = fake_cura.CuraApplication.getInstance()
+    return application.getOperationStack().pushes, application.getController().getScene().sceneChanged.emits
+
+
+def _measureAction(results, name: str, prepare, action, repeat: int = 5) -> None:
+    # Best time of the action, and its undo entries and scene notifications
+    best = None
+    for i in range(repeat):
+        prepare()
+        gc.collect()
+        pushes, emits = _counters()
+        start = time.perf_counter()
+        action()
+        elapsed = (time.perf_counter() - start) * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    end_pushes, end_emits = _counters()
+    results[name] = best
+    results[name + "_pushes"] = end_pushes - pushes
+    results[name + "_emits"] = end_emits - emits
+
+
+def benchTool(results) -> None:
+    data_folder = tempfile.mkdtemp(prefix = "bench_blockers_")
+    try:
+        application = fake_cura.install(data_folder)
+        plugin = fake_cura.importPlugin()
+        Vector = fake_cura.Vector
+
+        # Template library with one file, read and simplified before the timings
+        template_folder = os.path.join(data_folder, "custom_support_eraser_templates")
+        os.makedirs(template_folder)
+        BlockerGeometry.writeStl(os.path.join(template_folder, "sphere.stl"), [_sphere(60)])
+
+        tool = plugin.CustomSupportEraserPlus.CustomSupportEraserPlus()
+        tool._TemplateName = "sphere.stl"
+        tool._getTemplateLibrary().get(tool._TemplateName)
+
+        def reset():
+            # Empty scene and undo stack, one model
+            root = application.getController().getScene().getRoot()
+            for child in list(root.getChildren()):
+                child.setParent(None)
+            application.getOperationStack().clear()
+            plugin.BlockerGeometry.clearTemplateCache()
+            tool._shared_mesh_data.clear()
+            return fake_cura.createModel()
+
+        # One click on the model : mesh, node, settings, operation, registry, cache record and notification
+        for sb_type in ('cube', 'cylinder', 'custom', 'template'):
+            tool._SBType = sb_type
+            state = {}
+            def prepare():
+                state["model"] = reset()
+            def place():
+                tool._createSupportEraserMesh(state["model"], Vector(1.0, 20.0, 2.0), Vector(8.0, 20.0, 5.0))
+            _measureAction(results, "tool_place_%s" % sb_type, prepare, place)
+        tool._SBType = 'cube'
+
+        for count in BLOCKER_COUNTS:
+            state = {}
+            def prepare(count = count):
+                model = reset()
+                tool._registry.clearSession()
+                placements = []
+                for i in range(count):
+                    position = Vector((i % 20) - 10.0, 20.0, (i // 20 % 20) - 10.0)
+                    placements.append((tool._createSupportEraserNode('cube', 2.0, position, position), model, position))
+                tool._commitPlacements(placements)
+                state["placements"] = placements
+
+            # Burst of clicks committed together
+            def prepareBurst(count = count):
+                prepare(count)
+                model = state["placements"][0][1]
+                state["pending"] = [(tool._createSupportEraserNode('cube', 2.0, position, position), model, position) for node, parent, position in state["placements"]]
+            def burst():
+                tool._pending_placements = list(state["pending"])
+                tool._commitPendingPlacements()
+            _measureAction(results, "tool_burst_commit_%d" % count, prepareBurst, burst, 3)
+
+            _measureAction(results, "tool_remove_all_%d" % count, prepare, tool.removeAllSupportBlockerMesh, 3)
+
+            # Consolidate : union of the blockers of the model in a job, then one replacement operation
+            _measureAction(results, "tool_consolidate_%d" % count, prepare, tool.consolidateSupportBlockerMesh, 3)
+
+        # Auto : overhang regions of a 20k faces sphere in a job, then all the blockers in one operation
+        verts, indices = _sphere(100)
+        for stop_at_surface in (False, True):
+            tool._UseStopAtSurface = stop_at_surface
+            def prepareAuto():
+                reset().setParent(None)
+                fake_cura.Selection.clear()
+                fake_cura.Selection.add(fake_cura.createModel(vertices = verts, indices = indices))
+                tool._ray_casters.clear()
+            name = "tool_auto_20k_faces" + ("_stop_at_surface" if stop_at_surface else "")
+            _measureAction(results, name, prepareAuto, tool.autoSupportBlockerMesh, 3)
+        tool._UseStopAtSurface = False
+        fake_cura.Selection.clear()
+        reset()
+    finally:
+        shutil.rmtree(data_folder, ignore_errors = True)
+
+
+def compare(results, baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding = "utf-8") as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+    print("%-32s %12s %12s %8s" % ("benchmark", "baseline us", "current us", "ratio"))
+    for name, value in results.items():
+        reference = baseline.get(name)
+        if reference:
+            print("%-32s %12.1f %12.1f %8.2f" % (name, reference, value, value / reference))
+        else:
+            print("%-32s %12s %12.1f" % (name, "-", value))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description = "Custom Support Eraser Plus benchmarks")
+    parser.add_argument("--output", help = "JSON file to write the results to")
+    parser.add_argument("--baseline", help = "JSON file of a previous run to compare with")
+    args = parser.parse_args()
+
+    results = {}
+    benchMeshes(results)
+    benchOverhang(results)
+    benchRegistry(results)
+    benchTool(results)
+
+    report = {
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as output_file:
+            json.dump(report, output_file, indent = 2)
+    if args.baseline:
+        compare(results, args.baseline)
+    else:
+        print(json.dumps(report, indent = 2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Share of the plugin in the Cura startup : import time of the modules the plugin used to
+# load with CustomSupportEraserPlus.py and now loads on first use.
+#
+# Run it with the Python of the Cura installation (the one able to import UM and cura) :
+#
+#   python benchmarks/bench_import.py --output imports.json
+#
+# Every module is timed in a fresh interpreter where the modules Cura loads anyway (NumPy,
+# PyQt, UM core) are already imported, so the figure is the extra cost due to the plugin.
+# Modules not available in the interpreter are reported as missing.
+#--------------------------------------------------------------------------------------------
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Loaded by Cura before any plugin
+PRELOADED = ["numpy", "UM.Logger", "UM.Tool", "cura.CuraApplication"]
+
+# Imported by the plugin module before, imported on first use now
+DEFERRED = [
+    "trimesh",
+    "cura.PickingPass",
+    "UM.Operations.GroupedOperation",
+    "UM.Operations.AddSceneNodeOperation",
+    "UM.Operations.RemoveSceneNodeOperation",
+    "cura.Operations.SetParentOperation",
+    "UM.Settings.SettingInstance",
+    "cura.Scene.SliceableObjectDecorator",
+    "cura.Scene.BuildPlateDecorator"
+]
+
+_TIMER = """
+import importlib, json, sys, time
+for name in %r:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        pass
+start = time.perf_counter()
+try:
+    importlib.import_module(%r)
+except Exception as e:
+    print(json.dumps({"error": type(e).__name__}))
+    sys.exit(0)
+print(json.dumps({"ms": (time.perf_counter() - start) * 1000}))
+"""
+
+
+def timeImport(module: str, repeat: int) -> dict:
+    best = None
+    for i in range(repeat):
+        output = subprocess.run([sys.executable, "-c", _TIMER % (PRELOADED, module)], capture_output = True, text = True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if "error" in result:
+            return result
+        best = result["ms"] if best is None else min(best, result["ms"])
+    return {"ms": best}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description = "Import cost of the plugin dependencies")
+    parser.add_argument("--output", help = "JSON file to write the results to")
+    parser.add_argument("--repeat", type = int, default = 5)
+    args = parser.parse_args()
+
+    results = {module: timeImport(module, args.repeat) for module in DEFERRED}
+    saved = sum(result.get("ms", 0.0) for result in results.values())
+    for module, result in results.items():
+        print("%-42s %s" % (module, "%8.1f ms" % result["ms"] if "ms" in result else "missing (%s)" % result["error"]))
+    print("%-42s %8.1f ms" % ("removed from the plugin startup", saved))
+
+    if args.output:
+        with open(args.output, "w", encoding = "utf-8") as output_file:
+            json.dump({"python": sys.version.split()[0], "deferred": results, "saved_ms": saved}, output_file, indent = 2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
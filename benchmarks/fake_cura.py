@@ -0,0 +1,738 @@
+#--------------------------------------------------------------------------------------------
+# Copyright (c) 2023 5axes
+#--------------------------------------------------------------------------------------------
+# Lightweight stand-ins for the parts of UM, cura and PyQt the tool uses, so the real tool
+# methods can be benchmarked on plain Python + NumPy.
+#
+# The operation stack counts the pushed operations (undo entries) and the scene counts the
+# sceneChanged notifications, the two costs the tool keeps at one per user action. The node
+# signals are not forwarded to the scene : only the notifications sent by the tool are counted.
+# The timers never fire by themselves, the benchmarks call the timer slots directly.
+#
+#   import fake_cura
+#   fake_cura.install(data_folder)
+#   plugin = fake_cura.importPlugin()
+#--------------------------------------------------------------------------------------------
+
+import enum
+import importlib.util
+import os
+import sys
+import types
+
+import numpy
+
+
+class Signal:
+    def __init__(self) -> None:
+        self._slots = []
+        self.emits = 0
+
+    def connect(self, slot) -> None:
+        self._slots.append(slot)
+
+    def disconnect(self, slot) -> None:
+        self._slots.remove(slot)
+
+    def emit(self, *args) -> None:
+        self.emits += 1
+        for slot in list(self._slots):
+            slot(*args)
+
+
+# PyQt -------------------------------------------------------------------------------------
+
+class Qt:
+    class Key(enum.Enum):
+        Key_B = 0x42
+        Key_Return = 0x01000004
+        Key_Enter = 0x01000005
+        Key_Escape = 0x01000000
+
+    class KeyboardModifier(enum.IntFlag):
+        NoModifier = 0
+        ShiftModifier = 0x02000000
+        ControlModifier = 0x04000000
+        AltModifier = 0x08000000
+
+
+class QTimer:
+    def __init__(self) -> None:
+        self.timeout = Signal()
+        self._interval = 0
+        self._active = False
+
+    def setInterval(self, interval: int) -> None:
+        self._interval = interval
+
+    def setSingleShot(self, single_shot: bool) -> None:
+        pass
+
+    def start(self, interval: int = None) -> None:
+        if interval is not None:
+            self._interval = interval
+        self._active = True
+
+    def stop(self) -> None:
+        self._active = False
+
+    def isActive(self) -> bool:
+        return self._active
+
+
+class QImage:
+    class Format(enum.Enum):
+        Format_ARGB32_Premultiplied = 6
+
+
+class QApplication:
+    @staticmethod
+    def keyboardModifiers():
+        return Qt.KeyboardModifier.NoModifier
+
+
+# UM ---------------------------------------------------------------------------------------
+
+class Vector:
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        self._data = numpy.array([x, y, z], dtype = numpy.float64)
+
+    x = property(lambda self: float(self._data[0]))
+    y = property(lambda self: float(self._data[1]))
+    z = property(lambda self: float(self._data[2]))
+
+    def getData(self) -> numpy.ndarray:
+        return self._data
+
+    def length(self) -> float:
+        return float(numpy.linalg.norm(self._data))
+
+    def __add__(self, other):
+        return Vector(*(self._data + other._data))
+
+    def __sub__(self, other):
+        return Vector(*(self._data - other._data))
+
+    def __mul__(self, value: float):
+        return Vector(*(self._data * value))
+
+
+class Matrix:
+    def __init__(self, data = None) -> None:
+        self._data = numpy.identity(4) if data is None else numpy.array(data, dtype = numpy.float64)
+
+    def setToIdentity(self) -> None:
+        self._data = numpy.identity(4)
+
+    def getData(self) -> numpy.ndarray:
+        return self._data
+
+    def getInverse(self):
+        return Matrix(numpy.linalg.inv(self._data))
+
+    def multiply(self, other, copy: bool = False):
+        result = Matrix(self._data @ other.getData())
+        if copy:
+            return result
+        self._data = result.getData()
+        return self
+
+
+class MeshData:
+    def __init__(self, vertices = None, normals = None, indices = None, **kwargs) -> None:
+        self._vertices = vertices
+        self._normals = normals
+        self._indices = indices
+
+    def getVertices(self):
+        return self._vertices
+
+    def getNormals(self):
+        return self._normals
+
+    def getIndices(self):
+        return self._indices
+
+    def hasIndices(self) -> bool:
+        return self._indices is not None
+
+    def getVertexCount(self) -> int:
+        return 0 if self._vertices is None else len(self._vertices)
+
+    def getFaceCount(self) -> int:
+        if self._indices is not None:
+            return len(self._indices)
+        return self.getVertexCount() // 3
+
+    def set(self, vertices = None, normals = None, indices = None):
+        return MeshData(self._vertices if vertices is None else vertices,
+                        self._normals if normals is None else normals,
+                        self._indices if indices is None else indices)
+
+    def getTransformed(self, transformation: Matrix):
+        data = transformation.getData()
+        return self.set(vertices = (self._vertices @ data[:3, :3].T + data[:3, 3]).astype(numpy.float32))
+
+
+class Logger:
+    @staticmethod
+    def log(log_type: str, message: str, *args) -> None:
+        pass
+
+    @staticmethod
+    def logException(log_type: str, message: str, *args) -> None:
+        pass
+
+
+class Message:
+    def __init__(self, text: str = "", title: str = "", lifetime: int = 30, **kwargs) -> None:
+        self.actionTriggered = Signal()
+
+    def addAction(self, *args, **kwargs) -> None:
+        pass
+
+    def setProgress(self, progress) -> None:
+        pass
+
+    def setText(self, text: str) -> None:
+        pass
+
+    def show(self) -> None:
+        pass
+
+    def hide(self) -> None:
+        pass
+
+
+class Event:
+    MousePressEvent = 1
+    MouseMoveEvent = 2
+    MouseReleaseEvent = 3
+    KeyPressEvent = 4
+    ToolActivateEvent = 8
+    ToolDeactivateEvent = 9
+
+
+class MouseEvent(Event):
+    LeftButton = "left"
+
+
+class i18nCatalog:
+    def __init__(self, name: str = None) -> None:
+        pass
+
+    def hasTranslationLoaded(self) -> bool:
+        return False
+
+    def i18nc(self, context: str, text: str, *args) -> str:
+        return text
+
+
+class Resources:
+    data_folder = ""
+
+    @classmethod
+    def addSearchPath(cls, path: str) -> None:
+        pass
+
+    @classmethod
+    def getDataStoragePath(cls) -> str:
+        return cls.data_folder
+
+    @classmethod
+    def getCacheStoragePath(cls) -> str:
+        return os.path.join(cls.data_folder, "cache")
+
+
+class Selection:
+    selectionChanged = Signal()
+    _selection = []
+
+    @classmethod
+    def add(cls, node) -> None:
+        if node not in cls._selection:
+            cls._selection.append(node)
+            cls.selectionChanged.emit()
+
+    @classmethod
+    def remove(cls, node) -> None:
+        if node in cls._selection:
+            cls._selection.remove(node)
+            cls.selectionChanged.emit()
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._selection = []
+        cls.selectionChanged.emit()
+
+    @classmethod
+    def isSelected(cls, node) -> bool:
+        return node in cls._selection
+
+    @classmethod
+    def hasSelection(cls) -> bool:
+        return bool(cls._selection)
+
+    @classmethod
+    def getAllSelectedObjects(cls):
+        return list(cls._selection)
+
+
+class _SettingDefinition:
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+
+class _InstanceContainer:
+    def __init__(self) -> None:
+        self._values = {}
+
+    def addInstance(self, instance) -> None:
+        self._values[instance.definition.key] = instance.value
+
+
+class _ContainerStack:
+    def __init__(self) -> None:
+        self._top = _InstanceContainer()
+
+    def getTop(self):
+        return self._top
+
+    def getSettingDefinition(self, key: str):
+        return _SettingDefinition(key)
+
+    def getProperty(self, key: str, property_name: str):
+        return self._top._values.get(key, False)
+
+
+class SettingInstance:
+    def __init__(self, definition, container) -> None:
+        self.definition = definition
+        self.value = None
+
+    def setProperty(self, name: str, value) -> None:
+        if name == "value":
+            self.value = value
+
+    def resetState(self) -> None:
+        pass
+
+
+class _SettingOverrideDecorator:
+    # Added to every CuraSceneNode, like in Cura
+    def __init__(self) -> None:
+        self._stack = _ContainerStack()
+
+    def getStack(self):
+        return self._stack
+
+
+class SliceableObjectDecorator:
+    def isSliceable(self) -> bool:
+        return True
+
+
+class BuildPlateDecorator:
+    def __init__(self, build_plate_number: int = 0) -> None:
+        self._build_plate_number = build_plate_number
+
+    def getBuildPlateNumber(self) -> int:
+        return self._build_plate_number
+
+
+class SceneNode:
+    class TransformSpace:
+        Local = 1
+        Parent = 2
+        World = 3
+
+    def __init__(self, parent = None, name: str = "") -> None:
+        self._name = name
+        self._parent = None
+        self._children = []
+        self._mesh_data = None
+        self._transformation = numpy.identity(4)
+        self._decorators = []
+        self._selectable = False
+        self.transformationChanged = Signal()
+        self.meshDataChanged = Signal()
+        if parent is not None:
+            self.setParent(parent)
+
+    def getName(self) -> str:
+        return self._name
+
+    def setName(self, name: str) -> None:
+        self._name = name
+
+    def setSelectable(self, selectable: bool) -> None:
+        self._selectable = selectable
+
+    def getMeshData(self):
+        return self._mesh_data
+
+    def setMeshData(self, mesh_data) -> None:
+        self._mesh_data = mesh_data
+        self.meshDataChanged.emit(self)
+
+    def getParent(self):
+        return self._parent
+
+    def getChildren(self):
+        return self._children
+
+    def setParent(self, parent) -> None:
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+
+    def addDecorator(self, decorator) -> None:
+        self._decorators.append(decorator)
+
+    def callDecoration(self, name: str, *args):
+        for decorator in self._decorators:
+            function = getattr(decorator, name, None)
+            if function is not None:
+                return function(*args)
+        return None
+
+    def getLocalTransformation(self) -> Matrix:
+        return Matrix(self._transformation)
+
+    def setTransformation(self, transformation: Matrix) -> None:
+        self._transformation = numpy.array(transformation.getData(), dtype = numpy.float64)
+        self.transformationChanged.emit(self)
+
+    def getWorldTransformation(self) -> Matrix:
+        if self._parent is None:
+            return Matrix(self._transformation)
+        return Matrix(self._parent.getWorldTransformation().getData() @ self._transformation)
+
+    def getPosition(self) -> Vector:
+        return Vector(*self._transformation[:3, 3])
+
+    def getWorldPosition(self) -> Vector:
+        return Vector(*self.getWorldTransformation().getData()[:3, 3])
+
+    def setPosition(self, position: Vector, transform_space = TransformSpace.Local) -> None:
+        world = self.getWorldTransformation().getData().copy()
+        if transform_space == SceneNode.TransformSpace.World:
+            world[:3, 3] = position.getData()
+            parent_world = numpy.identity(4) if self._parent is None else self._parent.getWorldTransformation().getData()
+            self.setTransformation(Matrix(numpy.linalg.inv(parent_world) @ world))
+        else:
+            transformation = self._transformation.copy()
+            transformation[:3, 3] = position.getData()
+            self.setTransformation(Matrix(transformation))
+
+    def getScale(self) -> Vector:
+        return Vector(*numpy.linalg.norm(self._transformation[:3, :3], axis = 0))
+
+    def getWorldScale(self) -> Vector:
+        return Vector(*numpy.linalg.norm(self.getWorldTransformation().getData()[:3, :3], axis = 0))
+
+
+class CuraSceneNode(SceneNode):
+    def __init__(self, parent = None, name: str = "") -> None:
+        super().__init__(parent, name)
+        self.addDecorator(_SettingOverrideDecorator())
+
+
+def DepthFirstIterator(node):
+    yield node
+    for child in list(node.getChildren()):
+        yield from DepthFirstIterator(child)
+
+
+class Operation:
+    def undo(self) -> None:
+        pass
+
+    def redo(self) -> None:
+        pass
+
+    def push(self) -> None:
+        CuraApplication.getInstance().getOperationStack().push(self)
+
+
+class GroupedOperation(Operation):
+    def __init__(self) -> None:
+        self._children = []
+
+    def addOperation(self, operation: Operation) -> None:
+        self._children.append(operation)
+
+    def getNumChildrenOperations(self) -> int:
+        return len(self._children)
+
+    def undo(self) -> None:
+        for operation in reversed(self._children):
+            operation.undo()
+
+    def redo(self) -> None:
+        for operation in self._children:
+            operation.redo()
+
+
+class AddSceneNodeOperation(Operation):
+    def __init__(self, node, parent) -> None:
+        self._node = node
+        self._parent = parent
+
+    def undo(self) -> None:
+        self._node.setParent(None)
+
+    def redo(self) -> None:
+        self._node.setParent(self._parent)
+
+
+class RemoveSceneNodeOperation(Operation):
+    def __init__(self, node) -> None:
+        self._node = node
+        self._parent = node.getParent()
+
+    def undo(self) -> None:
+        self._node.setParent(self._parent)
+
+    def redo(self) -> None:
+        self._node.setParent(None)
+        Selection.remove(self._node)
+
+
+class SetParentOperation(Operation):
+    # Keeps the world transformation of the node, like the Cura operation
+    def __init__(self, node, parent) -> None:
+        self._node = node
+        self._parent = parent
+        self._old_parent = node.getParent()
+
+    def _setParent(self, parent) -> None:
+        world = self._node.getWorldTransformation().getData()
+        parent_world = numpy.identity(4) if parent is None else parent.getWorldTransformation().getData()
+        self._node.setParent(parent)
+        self._node.setTransformation(Matrix(numpy.linalg.inv(parent_world) @ world))
+
+    def undo(self) -> None:
+        self._setParent(self._old_parent)
+
+    def redo(self) -> None:
+        self._setParent(self._parent)
+
+
+class OperationStack:
+    def __init__(self) -> None:
+        self.pushes = 0
+        self._operations = []
+
+    def push(self, operation: Operation) -> None:
+        operation.redo()
+        self._operations.append(operation)
+        self.pushes += 1
+
+    def clear(self) -> None:
+        self._operations = []
+
+
+class Scene:
+    def __init__(self) -> None:
+        self._root = SceneNode(name = "Root")
+        self.sceneChanged = Signal()
+
+    def getRoot(self):
+        return self._root
+
+    def getActiveCamera(self):
+        return None
+
+
+class Controller:
+    def __init__(self) -> None:
+        self._scene = Scene()
+
+    def getScene(self) -> Scene:
+        return self._scene
+
+
+class Preferences:
+    def __init__(self) -> None:
+        self._values = {}
+
+    def addPreference(self, key: str, default_value) -> None:
+        self._values.setdefault(key, default_value)
+
+    def getValue(self, key: str):
+        return self._values.get(key)
+
+    def setValue(self, key: str, value) -> None:
+        self._values[key] = value
+
+
+class _GlobalStack:
+    # Settings of the printer read by the tool
+    _values = {("support_angle", "value"): 50.0, ("anti_overhang_mesh", "enabled"): True}
+
+    def getProperty(self, key: str, property_name: str):
+        return self._values.get((key, property_name))
+
+
+class _MultiBuildPlateModel:
+    activeBuildPlate = 0
+
+
+class Application:
+    _instance = None
+
+    def __init__(self) -> None:
+        Application._instance = self
+        self._controller = Controller()
+        self._operation_stack = OperationStack()
+        self._preferences = Preferences()
+        self.globalContainerStackChanged = Signal()
+
+    @classmethod
+    def getInstance(cls):
+        return Application._instance
+
+    def getController(self) -> Controller:
+        return self._controller
+
+    def getOperationStack(self) -> OperationStack:
+        return self._operation_stack
+
+    def getPreferences(self) -> Preferences:
+        return self._preferences
+
+    def getMultiBuildPlateModel(self):
+        return _MultiBuildPlateModel()
+
+    def getGlobalContainerStack(self):
+        return _GlobalStack()
+
+    def callLater(self, function, *args) -> None:
+        function(*args)
+
+
+class CuraApplication(Application):
+    pass
+
+
+class Job:
+    def __init__(self) -> None:
+        self._result = None
+        self._error = None
+
+    def setResult(self, result) -> None:
+        self._result = result
+
+    def getResult(self):
+        return self._result
+
+    def setError(self, error) -> None:
+        self._error = error
+
+    def hasError(self) -> bool:
+        return self._error is not None
+
+    def getError(self):
+        return self._error
+
+    def start(self) -> None:
+        # Run at once instead of in a worker thread, the finished callback comes through callLater
+        self.run()
+
+    def cancel(self) -> None:
+        pass
+
+
+class Tool:
+    def __init__(self) -> None:
+        self._controller = Application.getInstance().getController()
+        self.propertyChanged = Signal()
+        self._exposed_properties = []
+
+    def getController(self) -> Controller:
+        return self._controller
+
+    def setExposedProperties(self, *names) -> None:
+        self._exposed_properties = list(names)
+
+    def event(self, event) -> bool:
+        return False
+
+
+# Module name -> attributes
+_MODULES = {
+    "PyQt6.QtCore": {"Qt": Qt, "QTimer": QTimer, "QT_VERSION_STR": "6.0.0"},
+    "PyQt6.QtGui": {"QImage": QImage},
+    "PyQt6.QtWidgets": {"QApplication": QApplication},
+    "UM.Application": {"Application": Application},
+    "UM.Event": {"Event": Event, "MouseEvent": MouseEvent},
+    "UM.Job": {"Job": Job},
+    "UM.Logger": {"Logger": Logger},
+    "UM.Math.Matrix": {"Matrix": Matrix},
+    "UM.Math.Vector": {"Vector": Vector},
+    "UM.Mesh.MeshData": {"MeshData": MeshData},
+    "UM.Message": {"Message": Message},
+    "UM.Operations.Operation": {"Operation": Operation},
+    "UM.Operations.GroupedOperation": {"GroupedOperation": GroupedOperation},
+    "UM.Operations.AddSceneNodeOperation": {"AddSceneNodeOperation": AddSceneNodeOperation},
+    "UM.Operations.RemoveSceneNodeOperation": {"RemoveSceneNodeOperation": RemoveSceneNodeOperation},
+    "UM.Resources": {"Resources": Resources},
+    "UM.Scene.Iterator.DepthFirstIterator": {"DepthFirstIterator": DepthFirstIterator},
+    "UM.Scene.SceneNode": {"SceneNode": SceneNode},
+    "UM.Scene.Selection": {"Selection": Selection},
+    "UM.Settings.SettingInstance": {"SettingInstance": SettingInstance},
+    "UM.Tool": {"Tool": Tool},
+    "UM.i18n": {"i18nCatalog": i18nCatalog},
+    "cura.CuraApplication": {"CuraApplication": CuraApplication},
+    "cura.Operations.SetParentOperation": {"SetParentOperation": SetParentOperation},
+    "cura.Scene.BuildPlateDecorator": {"BuildPlateDecorator": BuildPlateDecorator},
+    "cura.Scene.CuraSceneNode": {"CuraSceneNode": CuraSceneNode},
+    "cura.Scene.SliceableObjectDecorator": {"SliceableObjectDecorator": SliceableObjectDecorator}
+}
+
+
+def install(data_folder: str) -> CuraApplication:
+    """Register the stand-ins in sys.modules and create the application, data_folder replaces the Cura configuration folder."""
+    for name, attributes in _MODULES.items():
+        parts = name.split(".")
+        for i in range(1, len(parts) + 1):
+            sys.modules.setdefault(".".join(parts[:i]), types.ModuleType(".".join(parts[:i])))
+        vars(sys.modules[name]).update(attributes)
+    Resources.data_folder = data_folder
+    return CuraApplication()
+
+
+def importPlugin(name: str = "CustomSupportEraserPlus"):
+    """Import the plugin package from the folder above the benchmarks, once install() was called."""
+    if name in sys.modules:
+        return sys.modules[name]
+    folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(name, os.path.join(folder, "__init__.py"), submodule_search_locations = [folder])
+    plugin = importlib.util.module_from_spec(spec)
+    sys.modules[name] = plugin
+    spec.loader.exec_module(plugin)
+    return plugin
+
+
+def createModel(size: float = 20.0, position = (0.0, 0.0, 0.0), scale: float = 1.0, vertices = None, indices = None) -> CuraSceneNode:
+    """Sliceable model added to the scene at position : a cube of size mm standing on the build plate, or the given mesh."""
+    root = Application.getInstance().getController().getScene().getRoot()
+    if vertices is not None:
+        verts = numpy.asarray(vertices, dtype = numpy.float32)
+        indices = numpy.asarray(indices, dtype = numpy.int32)
+    else:
+        verts = numpy.array([(x, y, z) for x in (-0.5, 0.5) for y in (0.0, 1.0) for z in (-0.5, 0.5)], dtype = numpy.float32) * size
+        indices = numpy.array([(0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5), (0, 4, 5), (0, 5, 1),
+                               (2, 3, 7), (2, 7, 6), (0, 2, 6), (0, 6, 4), (1, 5, 7), (1, 7, 3)], dtype = numpy.int32)
+    model = CuraSceneNode(name = "Model")
+    model.setMeshData(MeshData(vertices = verts, indices = indices))
+    model.addDecorator(SliceableObjectDecorator())
+    model.addDecorator(BuildPlateDecorator(0))
+    transformation = numpy.diag([scale, scale, scale, 1.0])
+    transformation[:3, 3] = position
+    model.setTransformation(Matrix(transformation))
+    model.setParent(root)
+    return model
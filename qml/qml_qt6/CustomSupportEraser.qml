@@ -6,6 +6,23 @@
 //   "SBType"       : Support Blocker Type 
 //   "OnBuildPlate" : Support Blocker reach Build plate
 //   "SMsg"         : Text for the Remove All Button
+//   "BurstDelay"   : Delay in ms to group the placements, 0 = disabled
+//   "AutoMinArea"  : Minimum overhang area in mm² for the Auto placement
+//   "AutoMaxHeight": Maximum overhang height in mm for the Auto placement, 0 = no limit
+//   "Instrumentation" : Time the placement stages
+//   "SStats"       : Counters and stage timings as text
+//   "Paint"        : Place the blockers along the mouse path
+//   "PaintSpacing" : Minimum distance in mm between painted blockers, 0 = size
+//   "ChordTolerance" : Maximum distance in mm between a cylinder and its facets
+//   "CompactMesh"  : Share the vertices between the faces of the blockers
+//   "PlacementCache" : Remember the placements per model and offer them again
+//   "StopAtSurface" : Stop the blockers at the first surface of the model below them
+//   "TemplateName" : File of the template library used by the Template type
+//   "TemplateList" : Files of the template library
+//   "BoxSelect"    : Cover a dragged rectangle with one box blocker
+//   "BudgetMaxBlockers" : Blocker count above which a warning is shown, 0 = no limit
+//   "BudgetMaxTriangles" : Blocker triangles above which a warning is shown, 0 = no limit
+//   "SBudget"      : Blocker count, triangles and estimated slice cost
 //-----------------------------------------------------------------------------
 
 import QtQuick 6.0
@@ -30,6 +47,8 @@ Item
 		cubeButton.checked = type === 'cube'
 		cylinderButton.checked = type === 'cylinder'
 		customButton.checked = type === 'custom'
+		polylineButton.checked = type === 'polyline'
+		templateButton.checked = type === 'template'
         UM.ActiveTool.setProperty("SBType", type)
     }
 	
@@ -58,7 +77,7 @@ Item
                 checkable: true
                 onClicked: setSBType('cube')
                 checked: UM.ActiveTool.properties.getValue("SBType") === 'cube'
-                z: 3 // Depth position 
+                z: 4 // Depth position 
             }
 			
             UM.ToolbarButton
@@ -74,7 +93,7 @@ Item
                 checkable:true
                 onClicked: setSBType('cylinder')
                 checked: UM.ActiveTool.properties.getValue("SBType") === 'cylinder'
-                z: 2 // Depth position 
+                z: 3 // Depth position 
             }
 
             UM.ToolbarButton
@@ -90,8 +109,50 @@ Item
                 checkable:true
                 onClicked: setSBType('custom')
                 checked: UM.ActiveTool.properties.getValue("SBType") === 'custom'
+                z: 2 // Depth position 
+            }
+
+            UM.ToolbarButton
+            {
+                id: polylineButton
+                text: catalog.i18nc("@label", "Polyline")
+				toolItem: UM.ColorImage
+				{
+					source: Qt.resolvedUrl("type_polyline.svg")
+					color: UM.Theme.getColor("icon")
+				}
+                property bool needBorder: true
+                checkable:true
+                onClicked: setSBType('polyline')
+                checked: UM.ActiveTool.properties.getValue("SBType") === 'polyline'
                 z: 1 // Depth position 
             }
+
+            UM.ToolbarButton
+            {
+                id: templateButton
+                text: catalog.i18nc("@label", "Template")
+				toolItem: UM.ColorImage
+				{
+					source: Qt.resolvedUrl("type_template.svg")
+					color: UM.Theme.getColor("icon")
+				}
+                property bool needBorder: true
+                checkable:true
+                onClicked: setSBType('template')
+                checked: UM.ActiveTool.properties.getValue("SBType") === 'template'
+                z: 0 // Depth position 
+            }
+        }
+
+        ComboBox
+        {
+            id: templateComboBox
+            width: localwidth * 2
+            visible: UM.ActiveTool.properties.getValue("SBType") === 'template'
+            model: UM.ActiveTool.properties.getValue("TemplateList")
+            currentIndex: model ? model.indexOf(UM.ActiveTool.properties.getValue("TemplateName")) : -1
+            onActivated: UM.ActiveTool.setProperty("TemplateName", currentText)
         }
     }
 	
@@ -116,6 +177,76 @@ Item
             renderType: Text.NativeRendering
             width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
         }
+        Label
+        {
+            height: UM.Theme.getSize("setting_control").height
+            text: catalog.i18nc("@label","Burst")
+            font: UM.Theme.getFont("default")
+            color: UM.Theme.getColor("text")
+            verticalAlignment: Text.AlignVCenter
+            renderType: Text.NativeRendering
+            width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
+        }
+        Label
+        {
+            height: UM.Theme.getSize("setting_control").height
+            text: catalog.i18nc("@label","Min Area")
+            font: UM.Theme.getFont("default")
+            color: UM.Theme.getColor("text")
+            verticalAlignment: Text.AlignVCenter
+            renderType: Text.NativeRendering
+            width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
+        }
+        Label
+        {
+            height: UM.Theme.getSize("setting_control").height
+            text: catalog.i18nc("@label","Max Height")
+            font: UM.Theme.getFont("default")
+            color: UM.Theme.getColor("text")
+            verticalAlignment: Text.AlignVCenter
+            renderType: Text.NativeRendering
+            width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
+        }
+        Label
+        {
+            height: UM.Theme.getSize("setting_control").height
+            text: catalog.i18nc("@label","Spacing")
+            font: UM.Theme.getFont("default")
+            color: UM.Theme.getColor("text")
+            verticalAlignment: Text.AlignVCenter
+            renderType: Text.NativeRendering
+            width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
+        }
+        Label
+        {
+            height: UM.Theme.getSize("setting_control").height
+            text: catalog.i18nc("@label","Tolerance")
+            font: UM.Theme.getFont("default")
+            color: UM.Theme.getColor("text")
+            verticalAlignment: Text.AlignVCenter
+            renderType: Text.NativeRendering
+            width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
+        }
+        Label
+        {
+            height: UM.Theme.getSize("setting_control").height
+            text: catalog.i18nc("@label","Max Blockers")
+            font: UM.Theme.getFont("default")
+            color: UM.Theme.getColor("text")
+            verticalAlignment: Text.AlignVCenter
+            renderType: Text.NativeRendering
+            width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
+        }
+        Label
+        {
+            height: UM.Theme.getSize("setting_control").height
+            text: catalog.i18nc("@label","Max Triangles")
+            font: UM.Theme.getFont("default")
+            color: UM.Theme.getColor("text")
+            verticalAlignment: Text.AlignVCenter
+            renderType: Text.NativeRendering
+            width: Math.ceil(contentWidth) //Make sure that the grid cells have an integer width.
+        }
  
 		
         UM.TextFieldWithUnit
@@ -138,6 +269,140 @@ Item
                 UM.ActiveTool.setProperty("SSize", modified_text)
             }
         }
+        UM.TextFieldWithUnit
+        {
+            id: burstTextField
+            width: localwidth
+            height: UM.Theme.getSize("setting_control").height
+            unit: "ms"
+            text: UM.ActiveTool.properties.getValue("BurstDelay")
+            validator: IntValidator
+            {
+                bottom: 0
+                top: 10000
+            }
+
+            onEditingFinished:
+            {
+                UM.ActiveTool.setProperty("BurstDelay", text)
+            }
+        }
+        UM.TextFieldWithUnit
+        {
+            id: minAreaTextField
+            width: localwidth
+            height: UM.Theme.getSize("setting_control").height
+            unit: "mm²"
+            text: UM.ActiveTool.properties.getValue("AutoMinArea")
+            validator: DoubleValidator
+            {
+                decimals: 2
+                bottom: 0
+                locale: "en_US"
+            }
+
+            onEditingFinished:
+            {
+                var modified_text = text.replace(",", ".") // User convenience. We use dots for decimal values
+                UM.ActiveTool.setProperty("AutoMinArea", modified_text)
+            }
+        }
+        UM.TextFieldWithUnit
+        {
+            id: maxHeightTextField
+            width: localwidth
+            height: UM.Theme.getSize("setting_control").height
+            unit: "mm"
+            text: UM.ActiveTool.properties.getValue("AutoMaxHeight")
+            validator: DoubleValidator
+            {
+                decimals: 2
+                bottom: 0
+                locale: "en_US"
+            }
+
+            onEditingFinished:
+            {
+                var modified_text = text.replace(",", ".") // User convenience. We use dots for decimal values
+                UM.ActiveTool.setProperty("AutoMaxHeight", modified_text)
+            }
+        }
+        UM.TextFieldWithUnit
+        {
+            id: paintSpacingTextField
+            width: localwidth
+            height: UM.Theme.getSize("setting_control").height
+            unit: "mm"
+            text: UM.ActiveTool.properties.getValue("PaintSpacing")
+            validator: DoubleValidator
+            {
+                decimals: 2
+                bottom: 0
+                locale: "en_US"
+            }
+
+            onEditingFinished:
+            {
+                var modified_text = text.replace(",", ".") // User convenience. We use dots for decimal values
+                UM.ActiveTool.setProperty("PaintSpacing", modified_text)
+            }
+        }
+        UM.TextFieldWithUnit
+        {
+            id: chordToleranceTextField
+            width: localwidth
+            height: UM.Theme.getSize("setting_control").height
+            unit: "mm"
+            text: UM.ActiveTool.properties.getValue("ChordTolerance")
+            validator: DoubleValidator
+            {
+                decimals: 3
+                bottom: 0
+                locale: "en_US"
+            }
+
+            onEditingFinished:
+            {
+                var modified_text = text.replace(",", ".") // User convenience. We use dots for decimal values
+                UM.ActiveTool.setProperty("ChordTolerance", modified_text)
+            }
+        }
+        UM.TextFieldWithUnit
+        {
+            id: budgetMaxBlockersTextField
+            width: localwidth
+            height: UM.Theme.getSize("setting_control").height
+            unit: ""
+            text: UM.ActiveTool.properties.getValue("BudgetMaxBlockers")
+            validator: IntValidator
+            {
+                bottom: 0
+                top: 10000000
+            }
+
+            onEditingFinished:
+            {
+                UM.ActiveTool.setProperty("BudgetMaxBlockers", text)
+            }
+        }
+        UM.TextFieldWithUnit
+        {
+            id: budgetMaxTrianglesTextField
+            width: localwidth
+            height: UM.Theme.getSize("setting_control").height
+            unit: ""
+            text: UM.ActiveTool.properties.getValue("BudgetMaxTriangles")
+            validator: IntValidator
+            {
+                bottom: 0
+                top: 10000000
+            }
+
+            onEditingFinished:
+            {
+                UM.ActiveTool.setProperty("BudgetMaxTriangles", text)
+            }
+        }
 	}
 	
 	Item
@@ -160,6 +425,78 @@ Item
 			checked: UM.ActiveTool.properties.getValue("OnBuildPlate")
 			onClicked: UM.ActiveTool.setProperty("OnBuildPlate", checked)	
 		}
+
+		UM.CheckBox
+		{
+			id: stopAtSurfaceCheckbox
+			anchors.top: useOnBuildPlateCheckbox.bottom
+			anchors.topMargin: UM.Theme.getSize("default_margin").height
+			anchors.left: parent.left
+			text: catalog.i18nc("@option:check","Stop At Surface")
+
+			checked: UM.ActiveTool.properties.getValue("StopAtSurface")
+			onClicked: UM.ActiveTool.setProperty("StopAtSurface", checked)	
+		}
+
+		UM.CheckBox
+		{
+			id: instrumentationCheckbox
+			anchors.top: stopAtSurfaceCheckbox.bottom
+			anchors.topMargin: UM.Theme.getSize("default_margin").height
+			anchors.left: parent.left
+			text: catalog.i18nc("@option:check","Statistics")
+
+			checked: UM.ActiveTool.properties.getValue("Instrumentation")
+			onClicked: UM.ActiveTool.setProperty("Instrumentation", checked)
+		}
+
+		UM.CheckBox
+		{
+			id: paintCheckbox
+			anchors.top: instrumentationCheckbox.bottom
+			anchors.topMargin: UM.Theme.getSize("default_margin").height
+			anchors.left: parent.left
+			text: catalog.i18nc("@option:check","Paint")
+
+			checked: UM.ActiveTool.properties.getValue("Paint")
+			onClicked: UM.ActiveTool.setProperty("Paint", checked)
+		}
+
+		UM.CheckBox
+		{
+			id: boxSelectCheckbox
+			anchors.top: paintCheckbox.bottom
+			anchors.topMargin: UM.Theme.getSize("default_margin").height
+			anchors.left: parent.left
+			text: catalog.i18nc("@option:check","Box Select")
+
+			checked: UM.ActiveTool.properties.getValue("BoxSelect")
+			onClicked: UM.ActiveTool.setProperty("BoxSelect", checked)
+		}
+
+		UM.CheckBox
+		{
+			id: compactMeshCheckbox
+			anchors.top: boxSelectCheckbox.bottom
+			anchors.topMargin: UM.Theme.getSize("default_margin").height
+			anchors.left: parent.left
+			text: catalog.i18nc("@option:check","Compact Mesh")
+
+			checked: UM.ActiveTool.properties.getValue("CompactMesh")
+			onClicked: UM.ActiveTool.setProperty("CompactMesh", checked)
+		}
+
+		UM.CheckBox
+		{
+			id: placementCacheCheckbox
+			anchors.top: compactMeshCheckbox.bottom
+			anchors.topMargin: UM.Theme.getSize("default_margin").height
+			anchors.left: parent.left
+			text: catalog.i18nc("@option:check","Remember Placements")
+
+			checked: UM.ActiveTool.properties.getValue("PlacementCache")
+			onClicked: UM.ActiveTool.setProperty("PlacementCache", checked)
+		}
 	}
 
     Rectangle {
@@ -183,5 +520,101 @@ Item
 		text: catalog.i18nc("@label", UM.ActiveTool.properties.getValue("SMsg"))
 		onClicked: UM.ActiveTool.triggerAction("removeAllSupportBlockerMesh")
 	}
-		
+
+	Cura.SecondaryButton
+	{
+		id: autoButton
+		anchors.top: removeAllButton.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.horizontalCenter: removeAllButton.horizontalCenter
+		width: UM.Theme.getSize("setting_control").width
+		height: UM.Theme.getSize("setting_control").height
+		text: catalog.i18nc("@label", "Auto")
+		onClicked: UM.ActiveTool.triggerAction("autoSupportBlockerMesh")
+	}
+
+	Cura.SecondaryButton
+	{
+		id: consolidateButton
+		anchors.top: autoButton.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.horizontalCenter: autoButton.horizontalCenter
+		width: UM.Theme.getSize("setting_control").width
+		height: UM.Theme.getSize("setting_control").height
+		text: catalog.i18nc("@label", "Consolidate")
+		onClicked: UM.ActiveTool.triggerAction("consolidateSupportBlockerMesh")
+	}
+
+	Cura.SecondaryButton
+	{
+		id: removeModelButton
+		anchors.top: consolidateButton.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.horizontalCenter: consolidateButton.horizontalCenter
+		width: UM.Theme.getSize("setting_control").width
+		height: UM.Theme.getSize("setting_control").height
+		text: catalog.i18nc("@label", "Remove Model")
+		onClicked: UM.ActiveTool.triggerAction("removeModelSupportBlockerMesh")
+	}
+
+	Cura.SecondaryButton
+	{
+		id: logStatisticsButton
+		anchors.top: removeModelButton.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.horizontalCenter: removeModelButton.horizontalCenter
+		width: UM.Theme.getSize("setting_control").width
+		height: UM.Theme.getSize("setting_control").height
+		text: catalog.i18nc("@label", "Log Statistics")
+		onClicked: UM.ActiveTool.triggerAction("logStatistics")
+	}
+
+	Cura.SecondaryButton
+	{
+		id: replicateButton
+		anchors.top: logStatisticsButton.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.horizontalCenter: logStatisticsButton.horizontalCenter
+		width: UM.Theme.getSize("setting_control").width
+		height: UM.Theme.getSize("setting_control").height
+		text: catalog.i18nc("@label", "Replicate")
+		onClicked: UM.ActiveTool.triggerAction("replicateSupportBlockerMesh")
+	}
+
+	Cura.SecondaryButton
+	{
+		id: editButton
+		anchors.top: replicateButton.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.horizontalCenter: replicateButton.horizontalCenter
+		width: UM.Theme.getSize("setting_control").width
+		height: UM.Theme.getSize("setting_control").height
+		text: catalog.i18nc("@label", "Edit Selected")
+		onClicked: UM.ActiveTool.triggerAction("editSupportBlockerMesh")
+	}
+
+	Label
+	{
+		id: budgetLabel
+		anchors.top: editButton.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.left: parent.left
+		text: UM.ActiveTool.properties.getValue("SBudget")
+		font: UM.Theme.getFont("default")
+		color: UM.Theme.getColor("text")
+		renderType: Text.NativeRendering
+	}
+
+	Label
+	{
+		id: statisticsLabel
+		anchors.top: budgetLabel.bottom
+		anchors.topMargin: UM.Theme.getSize("default_margin").height
+		anchors.left: parent.left
+		visible: UM.ActiveTool.properties.getValue("Instrumentation")
+		text: UM.ActiveTool.properties.getValue("SStats")
+		font: UM.Theme.getFont("default")
+		color: UM.Theme.getColor("text")
+		renderType: Text.NativeRendering
+	}
 }